@@ -0,0 +1,61 @@
+"""
+Compare bulk acronym assignment with a hand-written post-processing loop
+that checks collisions against a list of issued acronyms.
+
+Usage:
+    python -m benchmarks.bench_assign [SIZES...]
+"""
+
+import sys
+import time
+
+from benchmarks.corpus import generate_phrases
+from src.acronymcreator.assign import AcronymAssigner
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+# The list-based loop is quadratic; larger inputs would take minutes
+NAIVE_LIMIT = 20_000
+
+
+def naive_assign(names, creator, options):
+    """Issue basic acronyms, resolving collisions with counters from 2."""
+    issued = []
+    for name in names:
+        base = creator.create_basic_acronym(name, options)
+        acronym = base
+        suffix = 2
+        while acronym in issued:
+            acronym = f"{base}{suffix}"
+            suffix += 1
+        issued.append(acronym)
+    return issued
+
+
+def main(argv=None):
+    argv = argv or sys.argv[1:]
+    sizes = [int(size) for size in argv] or DEFAULT_SIZES
+    creator = AcronymCreator()
+    options = AcronymOptions()
+    for size in sizes:
+        names = list(dict.fromkeys(generate_phrases(size * 2)))[:size]
+        start = time.perf_counter()
+        assignments = list(AcronymAssigner(creator, options).assign_many(names))
+        fast = time.perf_counter() - start
+        issued = [a.acronym.upper() for a in assignments if a.acronym]
+        assert len(set(issued)) == len(issued), "duplicate acronyms issued"
+        collisions = sum(a.strategy not in ("basic", "empty") for a in assignments)
+        line = (
+            f"{len(names):>8,} names, {collisions:>7,} collisions: "
+            f"assigner {fast * 1e3:9.1f} ms"
+        )
+        if len(names) <= NAIVE_LIMIT:
+            start = time.perf_counter()
+            naive_assign(names, creator, options)
+            slow = time.perf_counter() - start
+            line += f", list loop {slow * 1e3:9.1f} ms ({slow / fast:.1f}x)"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Compare create_basic_acronym_many against a per-phrase loop.
+
+Usage:
+    python -m benchmarks.bench_batch [SIZE ...]
+"""
+
+import sys
+import time
+
+from benchmarks.corpus import generate_phrases
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+
+def run(size: int) -> tuple:
+    """Return (loop seconds, batch seconds) for a corpus of the given size."""
+    creator = AcronymCreator()
+    options = AcronymOptions()
+    phrases = generate_phrases(size)
+
+    start = time.perf_counter()
+    expected = [creator.create_basic_acronym(phrase, options) for phrase in phrases]
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = list(creator.create_basic_acronym_many(phrases, options))
+    batch_seconds = time.perf_counter() - start
+
+    assert actual == expected, "batch results differ from the per-phrase loop"
+    return loop_seconds, batch_seconds
+
+
+def main(argv=None):
+    sizes = [int(arg) for arg in (argv or sys.argv[1:])] or DEFAULT_SIZES
+    print(f"{'phrases':>10} {'loop/s':>12} {'batch/s':>12} {'speedup':>8}")
+    for size in sizes:
+        loop_seconds, batch_seconds = run(size)
+        print(
+            f"{size:>10} {size / loop_seconds:>12,.0f} "
+            f"{size / batch_seconds:>12,.0f} {loop_seconds / batch_seconds:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Compare acronym_column against a per-row create_basic_acronym loop on a
+column with repeated values, for lists and, when installed, NumPy and
+pyarrow arrays.
+
+Usage:
+    python -m benchmarks.bench_columnar [ROWS] [UNIQUE]
+"""
+
+import random
+import sys
+import time
+
+from benchmarks.corpus import generate_phrases
+from src.acronymcreator.columnar import acronym_column
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+
+DEFAULT_ROWS = 1_000_000
+DEFAULT_UNIQUE = 10_000
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main(argv=None):
+    argv = argv or sys.argv[1:]
+    rows = int(argv[0]) if argv else DEFAULT_ROWS
+    unique = int(argv[1]) if len(argv) > 1 else DEFAULT_UNIQUE
+    rng = random.Random(42)
+    column = rng.choices(generate_phrases(unique), k=rows)
+    creator = AcronymCreator()
+    options = AcronymOptions()
+
+    baseline, expected = timed(
+        lambda: [creator.create_basic_acronym(phrase, options) for phrase in column]
+    )
+    inputs = [("list", column)]
+    try:
+        import numpy
+
+        inputs.append(("numpy object", numpy.array(column, dtype=object)))
+        inputs.append(("numpy str", numpy.array(column)))
+    except ImportError:
+        print("numpy: not installed, skipped")
+    try:
+        import pyarrow
+
+        inputs.append(("pyarrow", pyarrow.array(column)))
+    except ImportError:
+        print("pyarrow: not installed, skipped")
+
+    print(f"{rows:,} rows, {unique:,} unique phrases")
+    print(f"{'per-row loop':<14} {baseline / rows * 1e9:>8.1f} ns/row")
+    for label, values in inputs:
+        seconds, result = timed(acronym_column, values, options)
+        result = result if isinstance(result, list) else result.tolist()
+        assert result == expected, f"{label} results differ from the scalar API"
+        print(
+            f"{label:<14} {seconds / rows * 1e9:>8.1f} ns/row "
+            f"{baseline / seconds:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
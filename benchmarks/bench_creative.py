@@ -0,0 +1,99 @@
+"""
+Measure creative acronym search: dictionary index build vs. disk-cache load,
+and beam search vs. exhaustive enumeration as phrases grow.
+
+Usage:
+    python -m benchmarks.bench_creative [DICTIONARY_WORDS]
+"""
+
+import itertools
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.corpus import WORDS
+from src.acronymcreator.creative import CreativeSearch, WordIndex
+from src.acronymcreator.tokenizer import clean_tokens
+
+DEFAULT_DICTIONARY_WORDS = 100_000
+WORD_COUNTS = (3, 5, 7, 9, 11)
+# Exhaustive search is skipped past this many combinations
+MAX_COMBINATIONS = 2_000_000
+STOP_WORDS = ["of", "and", "for", "the"]
+
+
+def synthetic_words(count, rng):
+    """Return pronounceable consonant-vowel words of 2 to 8 letters."""
+    consonants, vowels = "bcdfghklmnprstvw", "aeiou"
+    words = set()
+    while len(words) < count:
+        letters = [
+            rng.choice(consonants if index % 2 == 0 else vowels)
+            for index in range(rng.randint(2, 8))
+        ]
+        words.add("".join(letters))
+    return sorted(words)
+
+
+def exhaustive(search, phrase):
+    """Score every combination of choices and return the best candidate."""
+    words = clean_tokens(phrase)
+    best = None
+    for parts in itertools.product(*(search.choices(word) for word in words)):
+        text = "".join(parts).lower()
+        if len(text) > 1:
+            candidate = search.score(text, parts)
+            if best is None or candidate.score > best.score:
+                best = candidate
+    return best
+
+
+def main(argv=None):
+    argv = argv or sys.argv[1:]
+    count = int(argv[0]) if argv else DEFAULT_DICTIONARY_WORDS
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "words.txt"
+        path.write_text("\n".join(synthetic_words(count, rng)), encoding="utf-8")
+        start = time.perf_counter()
+        index = WordIndex.from_file(path, cache_dir=directory)
+        build = time.perf_counter() - start
+        start = time.perf_counter()
+        WordIndex.from_file(path, cache_dir=directory)
+        load = time.perf_counter() - start
+    print(
+        f"index of {len(index):,} words: built in {build * 1e3:.0f} ms, "
+        f"loaded from cache in {load * 1e3:.0f} ms ({build / load:.1f}x)"
+    )
+
+    search = CreativeSearch(index, time_budget=10.0)
+    for words in WORD_COUNTS:
+        phrase = " ".join(
+            rng.choice(STOP_WORDS) if position % 3 == 2 else rng.choice(WORDS)
+            for position in range(words)
+        )
+        combinations = 1
+        for word in clean_tokens(phrase):
+            combinations *= len(search.choices(word))
+        start = time.perf_counter()
+        best = search.search(phrase, top=1)[0]
+        beam = time.perf_counter() - start
+        line = f"{words:>2} words, {combinations:>10,} combinations: "
+        line += f"beam {beam * 1e3:7.2f} ms"
+        if combinations <= MAX_COMBINATIONS:
+            start = time.perf_counter()
+            optimum = exhaustive(search, phrase)
+            full = time.perf_counter() - start
+            line += (
+                f", exhaustive {full * 1e3:9.1f} ms ({full / beam:,.1f}x), "
+                f"best score {best.score:.2f} vs {optimum.score:.2f}"
+            )
+        else:
+            line += ", exhaustive skipped"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Compare regenerating acronyms for a whole phrase file with an incremental
+update after a small edit.
+
+Usage:
+    python -m benchmarks.bench_incremental [SIZES...]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.corpus import generate_phrases
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+from src.acronymcreator.incremental import IncrementalFile, read_text
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+EDITED_LINES = 10
+
+
+def write_lines(path, lines):
+    """Rewrite a phrase file and move its modification time forward."""
+    stat = path.stat() if path.exists() else None
+    path.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+    if stat is not None:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main(argv=None):
+    argv = argv or sys.argv[1:]
+    sizes = [int(size) for size in argv] or DEFAULT_SIZES
+    creator = AcronymCreator()
+    options = AcronymOptions()
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            path = Path(directory) / f"phrases-{size}.txt"
+            state = Path(directory) / f"state-{size}"
+            lines = generate_phrases(size)
+            write_lines(path, lines)
+            IncrementalFile(path, state, creator, options).update()
+
+            # A few lines edited in place, one inserted and one removed
+            edited = list(lines)
+            rng = random.Random(size)
+            for index in rng.sample(range(size), EDITED_LINES):
+                edited[index] = f"{edited[index]} Revised Edition"
+            edited.insert(size // 2, "Freshly Added Phrase")
+            del edited[size // 3]
+            write_lines(path, edited)
+
+            full, _ = timed(
+                lambda: list(
+                    creator.create_basic_acronym_many(
+                        read_text(path).splitlines(), options
+                    )
+                )
+            )
+
+            # Both timings include loading the state, as a new process would
+            def load_and_update():
+                watched = IncrementalFile(path, state, creator, options)
+                return watched.update(), watched.recomputed
+
+            incremental, (changes, recomputed) = timed(load_and_update)
+            unchanged, _ = timed(load_and_update)
+            print(
+                f"{size:>9,} lines, {len(changes):>3} changes: "
+                f"full {full * 1e3:8.1f} ms, incremental {incremental * 1e3:7.1f} ms "
+                f"({recomputed} recomputed, "
+                f"{full / incremental:.1f}x), unchanged check "
+                f"{unchanged * 1e6:5.0f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
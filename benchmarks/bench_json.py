@@ -0,0 +1,88 @@
+"""
+Compare JSON serialization throughput: the pretty-printed single-phrase
+output and default JSON Lines batch output against compact output from
+each installed backend.
+
+Usage:
+    python -m benchmarks.bench_json [SIZE]
+"""
+
+import io
+import sys
+import time
+
+from benchmarks.corpus import generate_phrases
+from src.acronymcreator.batch import get_writer
+from src.acronymcreator.cli import _render
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+from src.acronymcreator.json_backend import BACKENDS, get_backend
+
+DEFAULT_SIZE = 200_000
+
+
+def installed_backends():
+    """Return every backend that can be loaded here."""
+    backends = []
+    for name in BACKENDS:
+        try:
+            backends.append(get_backend(name))
+        except ImportError:
+            print(f"{name}: not installed, skipped")
+    return backends
+
+
+def time_single(results, options, backend):
+    """Render each result the way the single-phrase CLI path does."""
+    start = time.perf_counter()
+    for phrase, acronym in results:
+        _render(phrase, acronym, options, "json", backend)
+    return time.perf_counter() - start
+
+
+def time_batch(results, options, backend):
+    """Stream all results through the JSON Lines writer."""
+    stream = io.BytesIO()
+    writer_options = {} if backend is None else {"backend": backend}
+    start = time.perf_counter()
+    writer = get_writer("json", stream, options, **writer_options)
+    for phrase, acronym in results:
+        writer.write(phrase, acronym)
+    writer.close()
+    return time.perf_counter() - start, len(stream.getvalue())
+
+
+def main(argv=None):
+    argv = argv or sys.argv[1:]
+    size = int(argv[0]) if argv else DEFAULT_SIZE
+    options = AcronymOptions()
+    phrases = generate_phrases(size)
+    results = list(
+        zip(phrases, AcronymCreator().create_basic_acronym_many(phrases, options))
+    )
+    backends = installed_backends()
+
+    print(f"{size:,} records")
+    baseline = time_single(results, options, None)
+    print(f"{'single json indent=2':<24} {baseline / size * 1e6:>8.2f} us/record")
+    for backend in backends:
+        seconds = time_single(results, options, backend)
+        print(
+            f"{'single compact ' + backend.name:<24} {seconds / size * 1e6:>8.2f} "
+            f"us/record {baseline / seconds:>7.2f}x"
+        )
+
+    baseline, baseline_bytes = time_batch(results, options, None)
+    print(
+        f"{'batch json.dumps':<24} {baseline / size * 1e6:>8.2f} us/record "
+        f"{baseline_bytes / size:>7.1f} B/record"
+    )
+    for backend in backends:
+        seconds, size_bytes = time_batch(results, options, backend)
+        print(
+            f"{'batch compact ' + backend.name:<24} {seconds / size * 1e6:>8.2f} "
+            f"us/record {size_bytes / size:>7.1f} B/record {baseline / seconds:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Compare line-by-line text reading with the memory-mapped reader, for
+reading alone and for a full single-process batch run.
+
+Usage:
+    python -m benchmarks.bench_mmap [SIZE]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.corpus import generate_phrases
+from src.acronymcreator.batch import iter_phrases
+from src.acronymcreator.core import AcronymOptions
+from src.acronymcreator.mapped import MappedPhraseFile
+from src.acronymcreator.parallel import ParallelAcronymEngine
+
+DEFAULT_SIZE = 2_000_000
+
+
+def read_text(path):
+    with open(path, encoding="utf-8") as stream:
+        return sum(1 for _ in iter_phrases([stream]))
+
+
+def read_mapped(path):
+    with MappedPhraseFile(path) as mapped:
+        return sum(len(mapped.phrases(start, end)) for start, end in mapped.ranges())
+
+
+def run_text(engine, path, options):
+    with open(path, encoding="utf-8") as stream:
+        return sum(
+            len(acronyms)
+            for _, _, acronyms in engine.chunks(iter_phrases([stream]), options)
+        )
+
+
+def run_mapped(engine, path, options):
+    return sum(len(acronyms) for _, _, acronyms in engine.file_chunks(path, options))
+
+
+def main(argv=None):
+    argv = argv or sys.argv[1:]
+    size = int(argv[0]) if argv else DEFAULT_SIZE
+    options = AcronymOptions()
+    engine = ParallelAcronymEngine(workers=1)
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as corpus:
+        corpus.write("\n".join(generate_phrases(size)) + "\n")
+    try:
+        megabytes = os.path.getsize(corpus.name) / 1e6
+        print(f"{size:,} phrases, {megabytes:.1f} MB")
+        for label, text_func, mapped_func, args in [
+            ("read", read_text, read_mapped, (corpus.name,)),
+            ("batch", run_text, run_mapped, (engine, corpus.name, options)),
+        ]:
+            timings = {}
+            for name, func in [("text", text_func), ("mmap", mapped_func)]:
+                start = time.perf_counter()
+                assert func(*args) == size
+                timings[name] = time.perf_counter() - start
+            print(
+                f"{label:<6} text {timings['text']:>7.3f}s  "
+                f"mmap {timings['mmap']:>7.3f}s  "
+                f"{timings['text'] / timings['mmap']:>6.2f}x"
+            )
+    finally:
+        os.unlink(corpus.name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compare the Unicode normalizer with the regex punctuation stripping that
+the tokenizer applies by default, on ASCII and multilingual corpora.
+
+Cleaning is timed on its own, then end to end as basic acronyms for the
+whole corpus.
+
+Usage:
+    python -m benchmarks.bench_normalize [SIZE]
+"""
+
+import sys
+import time
+
+from benchmarks.corpus import generate_corpus
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+from src.acronymcreator.normalize import Normalizer
+from src.acronymcreator.tokenizer import PUNCTUATION_PATTERN
+
+DEFAULT_SIZE = 1_000_000
+KINDS = ("mixed", "multilingual", "unicode")
+
+NORMALIZERS = {
+    "nfkc": Normalizer(),
+    "nfkc+accents": Normalizer(strip_accents=True),
+    "nfkc+cjk": Normalizer(cjk="split"),
+}
+
+
+def regex_clean(phrase):
+    """Strip punctuation the way the default tokenizer does."""
+    return PUNCTUATION_PATTERN.sub("", phrase)
+
+
+def rate(size, seconds):
+    return f"{size / seconds:>12,.0f} phrases/s"
+
+
+def timed(function, phrases):
+    start = time.perf_counter()
+    for _ in map(function, phrases):
+        pass
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    argv = argv or sys.argv[1:]
+    size = int(argv[0]) if argv else DEFAULT_SIZE
+    options = AcronymOptions()
+    for kind in KINDS:
+        phrases = generate_corpus(size, kind)
+        print(f"{size:,} {kind} phrases")
+
+        baseline = timed(regex_clean, phrases)
+        print(f"  clean    regex         {rate(size, baseline)}")
+        for name, normalizer in NORMALIZERS.items():
+            seconds = timed(normalizer, phrases)
+            print(
+                f"  clean    {name:<13} {rate(size, seconds)} "
+                f"({baseline / seconds:.2f}x regex)"
+            )
+
+        start = time.perf_counter()
+        list(AcronymCreator().create_basic_acronym_many(phrases, options))
+        baseline = time.perf_counter() - start
+        print(f"  acronyms regex         {rate(size, baseline)}")
+        for name, normalizer in NORMALIZERS.items():
+            creator = AcronymCreator(normalizer=normalizer)
+            start = time.perf_counter()
+            list(creator.create_basic_acronym_many(phrases, options))
+            seconds = time.perf_counter() - start
+            print(
+                f"  acronyms {name:<13} {rate(size, seconds)} "
+                f"({baseline / seconds:.2f}x regex)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Measure how ParallelAcronymEngine scales from 1 to N worker processes.
+
+Usage:
+    python -m benchmarks.bench_parallel [SIZE] [MAX_WORKERS]
+"""
+
+import os
+import sys
+import time
+
+from benchmarks.corpus import generate_phrases
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+from src.acronymcreator.parallel import ParallelAcronymEngine
+
+DEFAULT_SIZE = 1_000_000
+
+
+def main(argv=None):
+    argv = argv or sys.argv[1:]
+    size = int(argv[0]) if argv else DEFAULT_SIZE
+    max_workers = int(argv[1]) if len(argv) > 1 else (os.cpu_count() or 1)
+    options = AcronymOptions()
+    phrases = generate_phrases(size)
+    expected = list(AcronymCreator().create_basic_acronym_many(phrases, options))
+
+    print(f"{size:,} phrases")
+    print(f"{'workers':>8} {'phrases/s':>12} {'speedup':>8}")
+    baseline = None
+    for workers in range(1, max_workers + 1):
+        engine = ParallelAcronymEngine(workers=workers)
+        start = time.perf_counter()
+        actual = list(engine.map(phrases, options))
+        seconds = time.perf_counter() - start
+        assert actual == expected, "parallel results differ from the serial path"
+        baseline = baseline or seconds
+        print(f"{workers:>8} {size / seconds:>12,.0f} {baseline / seconds:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
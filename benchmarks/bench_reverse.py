@@ -0,0 +1,97 @@
+"""
+Measure building the reverse lookup index and the latency of exact and
+prefix lookups, against a linear scan over the corpus.
+
+Usage:
+    python -m benchmarks.bench_reverse [SIZES...]
+"""
+
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.corpus import generate_phrases
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+from src.acronymcreator.reverse import ReverseIndex
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+LOOKUPS = 1_000
+# Rows returned per prefix lookup, as for autocompletion
+PREFIX_LIMIT = 50
+# Each scan recomputes every acronym; larger corpora would take minutes
+SCAN_LIMIT = 100_000
+SCAN_LOOKUPS = 20
+
+
+def percentiles(timings):
+    """Return the p50 and p99 of timings, in microseconds."""
+    cuts = statistics.quantiles(timings, n=100)
+    return cuts[49] * 1e6, cuts[98] * 1e6
+
+
+def time_queries(query, keys):
+    timings = []
+    for key in keys:
+        start = time.perf_counter()
+        query(key)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def linear_scan(phrases, creator, options, acronym):
+    """Find phrases for an acronym without an index."""
+    return [
+        phrase
+        for phrase in phrases
+        if creator.create_basic_acronym(phrase, options) == acronym
+    ]
+
+
+def main(argv=None):
+    argv = argv or sys.argv[1:]
+    sizes = [int(size) for size in argv] or DEFAULT_SIZES
+    creator = AcronymCreator()
+    options = AcronymOptions()
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            phrases = generate_phrases(size)
+            path = Path(directory) / f"index-{size}.sqlite3"
+            with ReverseIndex(path) as index:
+                start = time.perf_counter()
+                index.add(phrases[: size // 2])
+                build = time.perf_counter() - start
+                start = time.perf_counter()
+                index.add(phrases)
+                grow = time.perf_counter() - start
+                sample = random.Random(size).sample(phrases, LOOKUPS)
+                keys = [creator.create_basic_acronym(p, options) for p in sample]
+                exact = percentiles(time_queries(index.lookup, keys))
+                prefix = percentiles(
+                    time_queries(lambda key: index.prefix(key[:2], PREFIX_LIMIT), keys)
+                )
+                print(
+                    f"{size:>9,} phrases, {index.acronym_count():>7,} acronyms: "
+                    f"build half {build:6.2f} s, add rest {grow:6.2f} s, "
+                    f"{path.stat().st_size / 1e6:6.1f} MB"
+                )
+            print(
+                f"{'':>10} exact p50 {exact[0]:7.1f} us, p99 {exact[1]:7.1f} us; "
+                f"prefix p50 {prefix[0]:7.1f} us, p99 {prefix[1]:7.1f} us"
+            )
+            if size <= SCAN_LIMIT:
+                scans = time_queries(
+                    lambda key: linear_scan(phrases, creator, options, key),
+                    keys[:: max(1, len(keys) // SCAN_LOOKUPS)],
+                )
+                scan = statistics.median(scans) * 1e6
+                print(
+                    f"{'':>10} linear scan p50 {scan:10.1f} us "
+                    f"({scan / exact[0]:,.0f}x exact lookup)"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Measure acronymcreator start-up: module import cost via ``-X importtime``
+and wall-clock time of the entry point for each output format.
+
+Usage:
+    python -m benchmarks.bench_startup [RUNS]
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+FORMATS = ["text", "json", "yaml", "csv", "tsv", "toml"]
+DEFAULT_RUNS = 10
+
+
+def run_python(*args):
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    return subprocess.run(
+        [sys.executable, *args], env=env, capture_output=True, text=True, check=True
+    )
+
+
+def slowest_imports(limit=10):
+    """Return the modules with the largest cumulative import time."""
+    result = run_python("-X", "importtime", "-c", "import acronymcreator.cli")
+    rows = []
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "cumulative" not in line:
+            _, cumulative, name = line.split("|")
+            rows.append((int(cumulative), name.rstrip()))
+    return sorted(rows, reverse=True)[:limit]
+
+
+def main(argv=None):
+    argv = argv or sys.argv[1:]
+    runs = int(argv[0]) if argv else DEFAULT_RUNS
+
+    print("Slowest imports (cumulative):")
+    for cumulative, name in slowest_imports():
+        print(f"  {cumulative / 1000:>8.1f} ms {name}")
+
+    print(f"\nEntry point wall clock (best of {runs}):")
+    for format in FORMATS:
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            run_python("-m", "acronymcreator.cli", "Hello World", "--format", format)
+            timings.append(time.perf_counter() - start)
+        print(f"  {format:<6} {min(timings) * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
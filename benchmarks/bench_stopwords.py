@@ -0,0 +1,90 @@
+"""
+Measure tokenization with stop-word dictionaries of 20, 1k and 50k entries,
+a fifth of them multi-word phrases, against a naive scan that tests every
+multi-word entry against each phrase.
+
+Usage:
+    python -m benchmarks.bench_stopwords [PHRASES]
+"""
+
+import random
+import string
+import sys
+import time
+
+from benchmarks.corpus import generate_phrases
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+from src.acronymcreator.stopwords import StopWords
+
+DEFAULT_PHRASES = 100_000
+SIZES = (20, 1_000, 50_000)
+DOMAIN_PHRASES = ["in order to", "with respect to", "a number of", "as well as"]
+# The naive scan is too slow for the full corpus at large sizes
+NAIVE_SAMPLE = 2_000
+
+
+def stop_list(size, rng):
+    """Return ``size`` entries: built-ins, domain phrases and random fillers."""
+    entries = [*AcronymCreator.COMMON_WORDS, *DOMAIN_PHRASES][:size]
+    while len(entries) < size:
+        words = [
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8)))
+            for _ in range(rng.choice((1, 1, 1, 1, 2, 3)))
+        ]
+        entries.append(" ".join(words))
+    return entries
+
+
+def naive_words(phrase, single, multi):
+    """Remove multi-word entries by substring search, then single words."""
+    text = f" {' '.join(phrase.lower().split())} "
+    for entry in multi:
+        text = text.replace(f" {entry} ", " ")
+    return [word for word in text.split() if word not in single]
+
+
+def timed(func, phrases):
+    start = time.perf_counter()
+    for phrase in phrases:
+        func(phrase)
+    return (time.perf_counter() - start) / len(phrases) * 1e9
+
+
+def main(argv=None):
+    argv = argv or sys.argv[1:]
+    count = int(argv[0]) if argv else DEFAULT_PHRASES
+    rng = random.Random(42)
+    phrases = [
+        f"{phrase} {rng.choice(DOMAIN_PHRASES)} {phrase.split()[-1]}"
+        for phrase in generate_phrases(count)
+    ]
+    options = AcronymOptions()
+    baseline = AcronymCreator().compile(options).tokenize
+    base_ns = timed(lambda phrase: list(baseline(phrase)), phrases)
+    print(f"{count:,} phrases")
+    print(f"{'built-in frozenset':<24} {base_ns:>9.1f} ns/phrase")
+
+    for size in SIZES:
+        entries = stop_list(size, rng)
+        start = time.perf_counter()
+        stop_words = StopWords(entries)
+        compile_ms = (time.perf_counter() - start) * 1e3
+        tokenize = AcronymCreator(stop_words=stop_words).compile(options).tokenize
+        trie_ns = timed(lambda phrase: list(tokenize(phrase)), phrases)
+        multi = [" ".join(phrase) for phrase in stop_words.phrases]
+        sample = phrases[:NAIVE_SAMPLE]
+        naive_ns = timed(
+            lambda phrase: naive_words(phrase, stop_words.words, multi), sample
+        )
+        print(
+            f"{f'trie, {size:,} entries':<24} {trie_ns:>9.1f} ns/phrase "
+            f"(compiled in {compile_ms:.1f} ms)"
+        )
+        print(
+            f"{f'naive, {size:,} entries':<24} {naive_ns:>9.1f} ns/phrase "
+            f"{naive_ns / trie_ns:>8.1f}x the trie time"
+        )
+
+
+if __name__ == "__main__":
+    main()
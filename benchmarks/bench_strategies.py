@@ -0,0 +1,75 @@
+"""
+Compare shared-tokenization generate_multiple_options against running
+each strategy separately.
+
+Usage:
+    python -m benchmarks.bench_strategies [SIZE]
+"""
+
+import sys
+import time
+
+from benchmarks.corpus import generate_phrases
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+
+DEFAULT_SIZE = 100_000
+
+
+def independent_options(creator, phrase):
+    """The previous implementation: tokenize once per strategy."""
+    basic = creator.create_basic_acronym(phrase, AcronymOptions())
+    with_articles = creator.create_basic_acronym(
+        phrase, AcronymOptions(include_articles=True)
+    )
+    creative = []
+    if basic:
+        lowercase = creator.create_basic_acronym(
+            phrase, AcronymOptions(force_uppercase=False)
+        )
+        if lowercase.lower() != basic.lower():
+            creative.append(lowercase)
+        limited = creator.create_basic_acronym(phrase, AcronymOptions(max_words=3))
+        if limited and limited != basic:
+            creative.append(limited)
+    syllable = creator.create_syllable_acronym(phrase, AcronymOptions())
+    return {
+        "basic": [basic] if basic else [],
+        "with_articles": [with_articles] if with_articles else [],
+        "creative": creative,
+        "syllable": [syllable] if syllable else [],
+    }
+
+
+def main(argv=None):
+    argv = argv or sys.argv[1:]
+    size = int(argv[0]) if argv else DEFAULT_SIZE
+    phrases = generate_phrases(size)
+    creator = AcronymCreator()
+
+    start = time.perf_counter()
+    expected = [independent_options(creator, phrase) for phrase in phrases]
+    independent_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single = [creator.generate_multiple_options(phrase) for phrase in phrases]
+    single_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = list(creator.generate_multiple_options_many(phrases))
+    batch_seconds = time.perf_counter() - start
+
+    assert single == batch == expected, "shared tokenization changed the results"
+    print(f"{size:,} phrases")
+    for label, seconds in [
+        ("independent", independent_seconds),
+        ("shared/phrase", single_seconds),
+        ("shared/batch", batch_seconds),
+    ]:
+        print(
+            f"{label:<14} {seconds / size * 1e6:>8.2f} us/phrase "
+            f"{independent_seconds / seconds:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Compare syllable acronyms with the legacy rule, the vowel-group model and,
+given a pattern file, the hyphenation model, with and without the per-word
+cache.
+
+Usage:
+    python -m benchmarks.bench_syllables [PHRASES] [PATTERN_FILE]
+"""
+
+import sys
+import time
+
+from benchmarks.corpus import generate_phrases
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+from src.acronymcreator.syllables import HyphenationSyllabifier, VowelGroupSyllabifier
+
+DEFAULT_PHRASES = 100_000
+
+
+def timed(creator, phrases, options):
+    start = time.perf_counter()
+    for phrase in phrases:
+        creator.create_syllable_acronym(phrase, options)
+    return (time.perf_counter() - start) / len(phrases) * 1e9
+
+
+def main(argv=None):
+    argv = argv or sys.argv[1:]
+    count = int(argv[0]) if argv else DEFAULT_PHRASES
+    phrases = generate_phrases(count)
+    options = AcronymOptions()
+
+    models = [("legacy", lambda cache_size: None)]
+    models.append(("vowel", lambda cache_size: VowelGroupSyllabifier(1, cache_size)))
+    if len(argv) > 1:
+        patterns = argv[1]
+        start = time.perf_counter()
+        HyphenationSyllabifier.from_file(patterns)
+        print(f"patterns compiled in {(time.perf_counter() - start) * 1e3:.1f} ms")
+        models.append(
+            (
+                "pattern",
+                lambda cache_size: HyphenationSyllabifier.from_file(
+                    patterns, cache_size=cache_size
+                ),
+            )
+        )
+    else:
+        print("pattern: no pattern file given, skipped")
+
+    print(f"{count:,} phrases")
+    for name, build in models:
+        cached = build(None)
+        if cached is None:
+            ns = timed(AcronymCreator(), phrases, options)
+            print(f"{name:<8} {ns:>9.1f} ns/phrase")
+            continue
+        uncached_ns = timed(AcronymCreator(syllabifier=build(0)), phrases, options)
+        cached_ns = timed(AcronymCreator(syllabifier=cached), phrases, options)
+        print(
+            f"{name:<8} {uncached_ns:>9.1f} ns/phrase uncached, "
+            f"{cached_ns:>9.1f} cached ({uncached_ns / cached_ns:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
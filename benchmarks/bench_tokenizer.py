@@ -0,0 +1,57 @@
+"""
+Microbenchmark the single-pass Tokenizer against the original
+clean_phrase + split + filter steps.
+
+Usage:
+    python -m benchmarks.bench_tokenizer [SIZE]
+"""
+
+import re
+import sys
+import time
+
+from benchmarks.corpus import generate_phrases
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+
+DEFAULT_SIZE = 200_000
+
+
+def legacy_extract_words(phrase, options, common_words):
+    """The pre-tokenizer implementation of extract_words."""
+    if not phrase.strip():
+        return []
+    cleaned = re.sub(r"[^\w\s]", "", phrase)
+    words = re.sub(r"\s+", " ", cleaned).strip().split()
+    if not options.include_articles:
+        words = [word for word in words if word.lower() not in common_words]
+    return [word for word in words if len(word) >= options.min_word_length]
+
+
+def main(argv=None):
+    argv = argv or sys.argv[1:]
+    size = int(argv[0]) if argv else DEFAULT_SIZE
+    phrases = generate_phrases(size)
+    creator = AcronymCreator()
+    options = AcronymOptions()
+
+    start = time.perf_counter()
+    expected = [
+        legacy_extract_words(phrase, options, creator.COMMON_WORDS)
+        for phrase in phrases
+    ]
+    legacy_seconds = time.perf_counter() - start
+
+    tokenize = creator.tokenizer(options).tokenize
+    start = time.perf_counter()
+    actual = [list(tokenize(phrase)) for phrase in phrases]
+    tokenizer_seconds = time.perf_counter() - start
+
+    assert actual == expected, "tokenizer output differs from legacy extraction"
+    print(f"{size:,} phrases")
+    print(f"legacy:    {size / legacy_seconds:>12,.0f} phrases/s")
+    print(f"tokenizer: {size / tokenizer_seconds:>12,.0f} phrases/s")
+    print(f"speedup:   {legacy_seconds / tokenizer_seconds:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Synthetic phrase corpora for AcronymCreator benchmarks.
+"""
+
+import random
+from typing import List, Optional
+
+WORDS = [
+    "application",
+    "programming",
+    "interface",
+    "data",
+    "platform",
+    "engineering",
+    "customer",
+    "relationship",
+    "management",
+    "system",
+    "quick",
+    "brown",
+    "fox",
+    "portable",
+    "document",
+    "format",
+    "network",
+    "security",
+    "operations",
+    "research",
+    "development",
+    "analytics",
+    "infrastructure",
+    "service",
+]
+
+# Accented, Cyrillic, Greek and CJK words for Unicode-heavy corpora
+UNICODE_WORDS = [
+    "café",
+    "naïve",
+    "façade",
+    "über",
+    "straße",
+    "résumé",
+    "Ångström",
+    "наука",
+    "данные",
+    "платформа",
+    "σύστημα",
+    "δεδομένα",
+    "データ",
+    "基盤",
+    "工程",
+    "ｄａｔａ",
+    "ﬁnance",
+]
+
+# Stop words and punctuation mixed in so the filters have work to do
+FILLERS = ["the", "of", "and", "for", "a", "to", "in", "with"]
+PUNCTUATION = ["", "", "", ",", "!", "-", "'s", "."]
+UNICODE_PUNCTUATION = ["", "", "、", "。", "’s", "—", "！", "«»"]
+
+# Word counts and vocabularies for the named corpus kinds
+KINDS = {
+    "short": (1, 4, WORDS, PUNCTUATION),
+    "mixed": (1, 8, WORDS, PUNCTUATION),
+    "long": (20, 40, WORDS, PUNCTUATION),
+    "unicode": (1, 8, UNICODE_WORDS, UNICODE_PUNCTUATION),
+    "multilingual": (
+        1,
+        8,
+        WORDS + UNICODE_WORDS,
+        PUNCTUATION + UNICODE_PUNCTUATION,
+    ),
+}
+
+
+def generate_phrases(count: int, seed: int = 42, max_words: int = 8) -> List[str]:
+    """Generate a reproducible list of product/department style phrases."""
+    return generate_corpus(count, "mixed", seed, max_words=max_words)
+
+
+def generate_corpus(
+    count: int, kind: str = "mixed", seed: int = 42, max_words: Optional[int] = None
+) -> List[str]:
+    """Generate a reproducible corpus of the given kind.
+
+    Kinds are ``short`` (1-4 words), ``mixed`` (1-8), ``long`` (20-40),
+    ``unicode`` (1-8 words drawn from accented, non-Latin and full-width
+    vocabulary) and ``multilingual`` (1-8 words drawn from both).
+    """
+    min_words, kind_max_words, words, punctuation = KINDS[kind]
+    max_words = max_words or kind_max_words
+    rng = random.Random(seed)
+    phrases = []
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(min_words, max_words)):
+            if rng.random() < 0.25:
+                parts.append(rng.choice(FILLERS))
+            else:
+                word = rng.choice(words)
+                if rng.random() < 0.5:
+                    word = word.capitalize()
+                parts.append(word + rng.choice(punctuation))
+        phrases.append(" ".join(parts))
+    return phrases
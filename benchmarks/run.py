@@ -0,0 +1,293 @@
+"""
+Reproducible benchmark suite for AcronymCreator.
+
+Runs every core method over short, long and Unicode-heavy synthetic
+corpora, plus end-to-end CLI runs for each output format, and writes
+machine-readable JSON results.
+
+Usage:
+    python -m benchmarks.run run [--size N] [--repeat R] [--filter TEXT]
+                                 [--output FILE] [--src DIR]
+    python -m benchmarks.run compare BASE.json HEAD.json [--threshold 0.1]
+    python -m benchmarks.run compare-commits BASE_REV [HEAD_REV] [--size N]
+
+``compare`` exits with status 1 when any benchmark's throughput dropped by
+more than the threshold. ``compare-commits`` benchmarks the ``src/`` tree
+of two git revisions with the current suite and compares them.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.corpus import generate_corpus
+
+ROOT = Path(__file__).resolve().parent.parent
+CORPUS_KINDS = ["short", "long", "unicode"]
+FORMATS = ["text", "json", "yaml", "csv", "tsv", "toml"]
+# Extra CLI variants benchmarked as (name, arguments)
+CLI_VARIANTS = [
+    ("json-compact", ["--format", "json", "--compact"]),
+]
+DEFAULT_SIZE = 20_000
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 0.10
+
+
+def load_package(src):
+    """Import acronymcreator from the given source directory."""
+    sys.path.insert(0, str(src))
+    core = importlib.import_module("acronymcreator.core")
+    return core.AcronymCreator, core.AcronymOptions
+
+
+def core_cases(src, size):
+    """Yield (name, phrases, callable) for every core method and corpus."""
+    creator_class, options_class = load_package(src)
+    creator = creator_class()
+    options = options_class()
+    methods = {
+        "create_basic_acronym": lambda phrase: creator.create_basic_acronym(
+            phrase, options
+        ),
+        "create_syllable_acronym": lambda phrase: creator.create_syllable_acronym(
+            phrase, options
+        ),
+        "extract_words": lambda phrase: creator.extract_words(phrase, options),
+        "clean_phrase": creator.clean_phrase,
+        "generate_multiple_options": creator.generate_multiple_options,
+    }
+    for kind in CORPUS_KINDS:
+        phrases = generate_corpus(size, kind)
+        for method_name, method in methods.items():
+
+            def run(phrases=phrases, method=method):
+                for phrase in phrases:
+                    method(phrase)
+
+            yield f"core.{method_name}.{kind}", len(phrases), run
+
+
+def cli_cases(src, size):
+    """Yield (name, phrases, callable) for end-to-end CLI runs per format."""
+    env = dict(os.environ, PYTHONPATH=str(src))
+    command = [sys.executable, "-m", "acronymcreator.cli"]
+    with tempfile.TemporaryDirectory() as directory:
+        # Removed once the caller has run every case
+        corpus = Path(directory) / "corpus.txt"
+        corpus.write_text(
+            "\n".join(generate_corpus(size, "short")) + "\n", encoding="utf-8"
+        )
+
+        variants = [(format, ["--format", format]) for format in FORMATS]
+        for format, arguments in variants + CLI_VARIANTS:
+
+            def single(arguments=arguments):
+                subprocess.run(
+                    [*command, "Application Programming Interface", *arguments],
+                    env=env,
+                    check=True,
+                    capture_output=True,
+                )
+
+            def batch(arguments=arguments):
+                subprocess.run(
+                    [*command, "--input", str(corpus), *arguments],
+                    env=env,
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+
+            yield f"cli.single.{format}", 1, single
+            yield f"cli.batch.{format}", size, batch
+
+
+def measure(run, repeat):
+    """Return the best wall-clock time of ``repeat`` runs."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def git_commit(src):
+    """Return the commit the source tree belongs to, if known."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=src,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(src, size, repeat, pattern=None, commit=None):
+    """Run every matching benchmark and return the results document."""
+    results = []
+    for cases in (core_cases, cli_cases):
+        for name, phrases, run in cases(src, size):
+            if pattern and pattern not in name:
+                continue
+            try:
+                seconds = measure(run, repeat)
+            except (AttributeError, subprocess.CalledProcessError) as error:
+                # Older source trees may lack a method or CLI option
+                print(f"{name:<45} skipped ({error.__class__.__name__})")
+                continue
+            results.append(
+                {
+                    "name": name,
+                    "phrases": phrases,
+                    "seconds": seconds,
+                    "per_second": phrases / seconds,
+                }
+            )
+            print(f"{name:<45} {phrases / seconds:>14,.0f} phrases/s")
+    return {
+        "meta": {
+            "commit": commit or git_commit(src),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+            "size": size,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(base, head, threshold):
+    """Print a comparison table and return the names of regressed benchmarks."""
+    base_results = {result["name"]: result for result in base["results"]}
+    regressions = []
+    print(f"{'benchmark':<45} {'base/s':>14} {'head/s':>14} {'change':>8}")
+    for result in head["results"]:
+        previous = base_results.get(result["name"])
+        if previous is None:
+            continue
+        change = result["per_second"] / previous["per_second"] - 1
+        flag = ""
+        if change < -threshold:
+            regressions.append(result["name"])
+            flag = "  REGRESSION"
+        print(
+            f"{result['name']:<45} {previous['per_second']:>14,.0f} "
+            f"{result['per_second']:>14,.0f} {change:>+7.1%}{flag}"
+        )
+    return regressions
+
+
+def export_src(revision, destination):
+    """Write the src/ tree of a git revision into ``destination``."""
+    archive = subprocess.run(
+        ["git", "archive", revision, "src"], cwd=ROOT, check=True, capture_output=True
+    ).stdout
+    subprocess.run(["tar", "-x", "-C", str(destination)], input=archive, check=True)
+    return Path(destination) / "src"
+
+
+def benchmark_revision(revision, args, directory):
+    """Run the current suite against a revision in a fresh interpreter."""
+    src = export_src(revision, directory)
+    output = Path(directory) / "results.json"
+    commit = subprocess.run(
+        ["git", "rev-parse", revision],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+    print(f"\n== {revision} ({commit[:12]})")
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.run",
+            "run",
+            "--src",
+            str(src),
+            "--size",
+            str(args.size),
+            "--repeat",
+            str(args.repeat),
+            "--output",
+            str(output),
+            "--commit",
+            commit,
+            *(["--filter", args.filter] if args.filter else []),
+        ],
+        cwd=ROOT,
+        check=True,
+    )
+    return json.loads(output.read_text(encoding="utf-8"))
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the suite")
+    run.add_argument("--output", type=Path, help="write JSON results here")
+    run.add_argument("--src", type=Path, default=ROOT / "src")
+    run.add_argument("--commit", help=argparse.SUPPRESS)
+
+    compare_files = commands.add_parser("compare", help="compare two result files")
+    compare_files.add_argument("base", type=Path)
+    compare_files.add_argument("head", type=Path)
+
+    compare_commits = commands.add_parser(
+        "compare-commits", help="benchmark and compare two git revisions"
+    )
+    compare_commits.add_argument("base")
+    compare_commits.add_argument("head", nargs="?", default="HEAD")
+
+    for command in (run, compare_commits):
+        command.add_argument("--size", type=int, default=DEFAULT_SIZE)
+        command.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+        command.add_argument("--filter", help="only run benchmarks containing TEXT")
+    for command in (compare_files, compare_commits):
+        command.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv if argv is not None else sys.argv[1:])
+
+    if args.command == "run":
+        document = run_suite(args.src, args.size, args.repeat, args.filter, args.commit)
+        if args.output:
+            args.output.write_text(json.dumps(document, indent=2), encoding="utf-8")
+        return 0
+
+    if args.command == "compare":
+        base = json.loads(args.base.read_text(encoding="utf-8"))
+        head = json.loads(args.head.read_text(encoding="utf-8"))
+    else:
+        with tempfile.TemporaryDirectory() as base_dir:
+            base = benchmark_revision(args.base, args, base_dir)
+        with tempfile.TemporaryDirectory() as head_dir:
+            head = benchmark_revision(args.head, args, head_dir)
+        print()
+
+    regressions = compare(base, head, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+asyncio facade for AcronymCreator.
+"""
+
+import asyncio
+import functools
+from collections import deque
+from concurrent.futures import Executor
+from typing import AsyncIterable, AsyncIterator, Iterable, List, Optional, Union
+
+from .core import AcronymCreator, AcronymOptions
+
+DEFAULT_MAX_IN_FLIGHT = 64
+
+STRATEGIES = ("basic", "syllable", "multiple")
+
+
+def _run_strategy(creator: AcronymCreator, strategy: str, phrases, options) -> List:
+    """Executor entry point: run one strategy over a batch of phrases."""
+    if strategy == "basic":
+        return list(creator.create_basic_acronym_many(phrases, options))
+    if strategy == "syllable":
+        return [creator.create_syllable_acronym(phrase, options) for phrase in phrases]
+    return list(creator.generate_multiple_options_many(phrases))
+
+
+async def _aiter(phrases: Union[AsyncIterable[str], Iterable[str]]):
+    if hasattr(phrases, "__aiter__"):
+        async for phrase in phrases:
+            yield phrase
+    else:
+        for phrase in phrases:
+            yield phrase
+
+
+class AsyncAcronymCreator:
+    """Run AcronymCreator work off the event loop with bounded concurrency.
+
+    Every call is executed on ``executor`` (the loop's default thread pool
+    when None; pass a ``ProcessPoolExecutor`` to use more cores). At most
+    ``max_in_flight`` jobs are submitted at once across all callers; further
+    calls wait, which applies backpressure to producers. Results are
+    identical to the synchronous API because the same creator does the work.
+    """
+
+    def __init__(
+        self,
+        creator: Optional[AcronymCreator] = None,
+        executor: Optional[Executor] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.creator = creator or AcronymCreator()
+        self.executor = executor
+        self.max_in_flight = max_in_flight
+        self._semaphore = None
+
+    def _limit(self) -> asyncio.Semaphore:
+        # Created lazily so the semaphore belongs to the running loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        return self._semaphore
+
+    async def _submit(self, strategy: str, phrases: List[str], options) -> List:
+        async with self._limit():
+            loop = asyncio.get_running_loop()
+            job = functools.partial(
+                _run_strategy, self.creator, strategy, phrases, options
+            )
+            return await loop.run_in_executor(self.executor, job)
+
+    async def create_basic_acronym(self, phrase: str, options: AcronymOptions) -> str:
+        """Create a basic acronym without blocking the event loop."""
+        (result,) = await self._submit("basic", [phrase], options)
+        return result
+
+    async def create_syllable_acronym(
+        self, phrase: str, options: AcronymOptions
+    ) -> str:
+        """Create a syllable acronym without blocking the event loop."""
+        (result,) = await self._submit("syllable", [phrase], options)
+        return result
+
+    async def generate_multiple_options(self, phrase: str) -> dict:
+        """Generate every strategy's acronyms without blocking the event loop."""
+        (result,) = await self._submit("multiple", [phrase], None)
+        return result
+
+    async def map(
+        self,
+        phrases: Union[AsyncIterable[str], Iterable[str]],
+        options: Optional[AcronymOptions] = None,
+        strategy: str = "basic",
+        batch_size: int = 1,
+    ) -> AsyncIterator:
+        """Yield results for each phrase, in input order.
+
+        Phrases are pulled from ``phrases`` only while fewer than
+        ``max_in_flight`` batches are pending, so a fast producer is slowed
+        to the pace of the consumer. Larger ``batch_size`` values trade
+        latency for throughput. Closing or cancelling the iteration cancels
+        batches that have not started yet.
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"unknown strategy: {strategy}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        options = options if options is not None else AcronymOptions()
+
+        pending = deque()
+        batch = []
+        try:
+            async for phrase in _aiter(phrases):
+                batch.append(phrase)
+                if len(batch) < batch_size:
+                    continue
+                pending.append(
+                    asyncio.ensure_future(self._submit(strategy, batch, options))
+                )
+                batch = []
+                if len(pending) >= self.max_in_flight:
+                    for result in await pending.popleft():
+                        yield result
+            if batch:
+                pending.append(
+                    asyncio.ensure_future(self._submit(strategy, batch, options))
+                )
+            while pending:
+                for result in await pending.popleft():
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
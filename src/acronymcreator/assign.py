@@ -0,0 +1,166 @@
+"""
+Collision-aware bulk assignment of unique acronyms.
+
+``AcronymAssigner`` keeps a hash index of every acronym issued so far,
+optionally seeded from a registry file of acronyms already in use. Each
+name tries a fixed sequence of candidates and takes the first one that is
+free:
+
+1. the basic acronym ("DP" for "Data Platform");
+2. more letters, adding one letter to one word at a time from left to
+   right, up to ``max_letters`` per word ("DAP", "DAPL", "DATPL", ...);
+3. the syllable acronym;
+4. the basic acronym with the next free numeric suffix ("DP2", "DP3").
+
+Candidates per name are bounded and suffix counters are kept per base
+acronym, so assigning N names takes near-linear time. Acronyms are compared
+case-insensitively. The same name always gets the same acronym.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from .core import AcronymCreator, AcronymOptions
+
+DEFAULT_MAX_LETTERS = 3
+
+# Strategy names reported in assignments, in escalation order
+ASSIGN_STRATEGIES = ("registry", "basic", "letters", "syllable", "suffix")
+
+RegistryEntry = Tuple[str, Optional[str]]
+
+
+class Assignment(NamedTuple):
+    """The acronym issued for a name and the strategy that produced it.
+
+    Names without usable words get an empty acronym and strategy "empty".
+    """
+
+    name: str
+    acronym: str
+    strategy: str
+
+
+def read_registry(path: Union[str, Path]) -> List[RegistryEntry]:
+    """Read ``ACRONYM<TAB>name`` lines; the name is optional.
+
+    Blank lines and lines starting with ``#`` are skipped.
+    """
+    entries = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            line = line.rstrip("\r\n")
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            acronym, _, name = line.partition("\t")
+            entries.append((acronym.strip(), name or None))
+    return entries
+
+
+def write_registry(path: Union[str, Path], entries: Iterable[RegistryEntry]) -> None:
+    """Write registry entries, replacing the file only once complete."""
+    path = Path(path)
+    partial = path.with_name(f".{path.name}.partial")
+    try:
+        with open(partial, "w", encoding="utf-8", newline="\n") as file:
+            for acronym, name in entries:
+                file.write(f"{acronym}\t{name}\n" if name else f"{acronym}\n")
+        os.replace(partial, path)
+    finally:
+        if partial.exists():
+            partial.unlink()
+
+
+class AcronymAssigner:
+    """Issue unique acronyms for names, escalating on collisions.
+
+    ``registry`` holds ``(acronym, name)`` pairs already in use; a pair
+    with a name reserves that acronym for the name, one without just marks
+    the acronym as taken.
+    """
+
+    def __init__(
+        self,
+        creator: Optional[AcronymCreator] = None,
+        options: Optional[AcronymOptions] = None,
+        registry: Iterable[RegistryEntry] = (),
+        max_letters: int = DEFAULT_MAX_LETTERS,
+    ):
+        if max_letters < 1:
+            raise ValueError("max_letters must be at least 1")
+        self.creator = creator or AcronymCreator()
+        self.options = options or AcronymOptions()
+        self.compiled = self.creator.compile(self.options)
+        self.max_letters = max_letters
+        # Uppercase acronym -> (acronym as issued, name or None)
+        self._issued: Dict[str, RegistryEntry] = {}
+        self._assigned: Dict[str, Assignment] = {}
+        # Next numeric suffix to try per uppercase base acronym
+        self._suffixes: Dict[str, int] = {}
+        for acronym, name in registry:
+            self.reserve(acronym, name)
+
+    def reserve(self, acronym: str, name: Optional[str] = None) -> None:
+        """Mark ``acronym`` as taken, for ``name`` when given."""
+        self._issued[acronym.upper()] = (acronym, name)
+        if name is not None:
+            self._assigned[name] = Assignment(name, acronym, "registry")
+
+    def is_taken(self, acronym: str) -> bool:
+        """Return True if ``acronym`` has been issued or reserved."""
+        return acronym.upper() in self._issued
+
+    def candidates(self, name: str) -> Iterator[Tuple[str, str]]:
+        """Yield ``(strategy, acronym)`` pairs for ``name`` before suffixes."""
+        words = self.compiled.words(name)
+        if not words:
+            return
+        change_case = self.compiled.change_case
+        yield "basic", change_case("".join(word[0] for word in words))
+        sizes = [1] * len(words)
+        for _ in range(self.max_letters - 1):
+            for index, word in enumerate(words):
+                if sizes[index] < min(self.max_letters, len(word)):
+                    sizes[index] += 1
+                    yield "letters", change_case(
+                        "".join(word[:size] for word, size in zip(words, sizes))
+                    )
+        yield "syllable", self.creator.create_syllable_acronym(name, self.options)
+
+    def assign(self, name: str) -> Assignment:
+        """Return the unique acronym for ``name``, issuing one if needed."""
+        assignment = self._assigned.get(name)
+        if assignment is not None:
+            return assignment
+        base = None
+        for strategy, acronym in self.candidates(name):
+            if base is None:
+                base = acronym
+            if acronym.upper() not in self._issued:
+                return self._issue(Assignment(name, acronym, strategy))
+        if base is None:
+            assignment = self._assigned[name] = Assignment(name, "", "empty")
+            return assignment
+        key = base.upper()
+        suffix = self._suffixes.get(key, 2)
+        while f"{key}{suffix}" in self._issued:
+            suffix += 1
+        self._suffixes[key] = suffix + 1
+        return self._issue(Assignment(name, f"{base}{suffix}", "suffix"))
+
+    def assign_many(self, names: Iterable[str]) -> Iterator[Assignment]:
+        """Assign acronyms to names in order."""
+        return map(self.assign, names)
+
+    def registry(self) -> List[RegistryEntry]:
+        """Return every issued and reserved acronym, in issue order."""
+        return list(self._issued.values())
+
+    def _issue(self, assignment: Assignment) -> Assignment:
+        self._issued[assignment.acronym.upper()] = (assignment.acronym, assignment.name)
+        self._assigned[assignment.name] = assignment
+        return assignment
+
+    def __len__(self) -> int:
+        return len(self._issued)
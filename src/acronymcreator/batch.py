@@ -0,0 +1,309 @@
+"""
+Batch processing helpers for AcronymCreator.
+
+Writers serialize one record at a time into an ``OutputBuffer``, which
+encodes records once and hands them to a binary stream in large writes,
+so no run ever holds a whole document in memory. Serialization libraries
+are imported by the writer that needs them, so importing this module
+stays cheap.
+"""
+
+import io
+from typing import BinaryIO, Iterable, Iterator, Optional, TextIO, Type, Union
+
+from .core import AcronymOptions
+
+# Phrases per chunk handed to each worker process
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Encoded output accumulated before a write to the underlying stream
+DEFAULT_FLUSH_BYTES = 64 * 1024
+
+FIELDS = [
+    "phrase",
+    "acronym",
+    "include_articles",
+    "min_word_length",
+    "max_words",
+    "lowercase",
+]
+
+
+def iter_phrases(streams: Iterable[TextIO]) -> Iterator[str]:
+    """Yield newline-delimited phrases from each stream in turn.
+
+    Lines are read lazily so memory use does not depend on the input size.
+    Every input line produces exactly one phrase, blank lines included, so
+    output rows stay aligned with input rows.
+    """
+    for stream in streams:
+        for line in stream:
+            yield line.rstrip("\n")
+
+
+class OutputBuffer:
+    """Accumulate encoded records and write them to a stream in batches.
+
+    Pending output is written once ``flush_records`` records or
+    ``flush_bytes`` encoded bytes have accumulated, whichever comes first;
+    either policy can be disabled with None. Use ``for_stream`` to wrap a
+    text stream: its binary buffer is used directly when it has one.
+    """
+
+    def __init__(
+        self,
+        raw: Union[BinaryIO, TextIO],
+        flush_records: Optional[int] = None,
+        flush_bytes: Optional[int] = DEFAULT_FLUSH_BYTES,
+        encoding: str = "utf-8",
+    ):
+        if flush_records is not None and flush_records < 1:
+            raise ValueError("flush_records must be at least 1")
+        if flush_bytes is not None and flush_bytes < 1:
+            raise ValueError("flush_bytes must be at least 1")
+        self.raw = raw
+        self.flush_records = flush_records
+        self.flush_bytes = flush_bytes
+        self.encoding = encoding
+        # Text-only targets such as io.StringIO get decoded output
+        self.text = isinstance(raw, io.TextIOBase)
+        self.bytes_written = 0
+        self._chunks = []
+        self._pending_bytes = 0
+        self._pending_records = 0
+
+    @classmethod
+    def for_stream(cls, stream: Union[BinaryIO, TextIO], **policy) -> "OutputBuffer":
+        """Wrap ``stream``, bypassing its text layer when it has a binary one."""
+        if isinstance(stream, cls):
+            return stream
+        raw = getattr(stream, "buffer", None)
+        if raw is None:
+            return cls(stream, **policy)
+        # Keep anything already written as text ahead of our output
+        stream.flush()
+        return cls(raw, encoding=getattr(stream, "encoding", None) or "utf-8", **policy)
+
+    def write(self, text: str) -> int:
+        """Encode and queue ``text``; returns the number of characters."""
+        self.write_bytes(text.encode(self.encoding))
+        return len(text)
+
+    def write_bytes(self, data: bytes) -> int:
+        """Queue already-encoded output."""
+        self._chunks.append(data)
+        self._pending_bytes += len(data)
+        return len(data)
+
+    def end_record(self) -> None:
+        """Mark the end of a record and flush if the policy says so."""
+        self._pending_records += 1
+        if (
+            self.flush_records is not None
+            and self._pending_records >= self.flush_records
+        ) or (self.flush_bytes is not None and self._pending_bytes >= self.flush_bytes):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all pending output to the underlying stream."""
+        if self._chunks:
+            data = b"".join(self._chunks)
+            self.raw.write(data.decode(self.encoding) if self.text else data)
+            self.bytes_written += len(data)
+            self._chunks = []
+            self._pending_bytes = 0
+        self._pending_records = 0
+        self.raw.flush()
+
+
+class BatchWriter:
+    """Base class for writers that stream one record per phrase.
+
+    Subclasses implement ``write_record``; ``write`` adds flush handling.
+    """
+
+    def __init__(self, stream: OutputBuffer, options: AcronymOptions):
+        self.stream = stream
+        self.options = options
+
+    def write(self, phrase: str, acronym: str) -> None:
+        """Write a single result."""
+        self.write_record(phrase, acronym)
+        self.stream.end_record()
+
+    def write_record(self, phrase: str, acronym: str) -> None:
+        """Serialize a single result into the output buffer."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Write any trailer and flush pending output."""
+        self.stream.flush()
+
+    def options_dict(self) -> dict:
+        """Return the options as they appear in structured output."""
+        return {
+            "include_articles": self.options.include_articles,
+            "min_word_length": self.options.min_word_length,
+            "max_words": self.options.max_words,
+            "lowercase": not self.options.force_uppercase,
+        }
+
+
+class TextWriter(BatchWriter):
+    """Write one acronym per line."""
+
+    def write_record(self, phrase: str, acronym: str) -> None:
+        self.stream.write(acronym + "\n")
+
+
+class JsonLinesWriter(BatchWriter):
+    """Write one JSON object per line (JSON Lines).
+
+    Pass a ``JsonBackend`` as ``backend`` for compact output encoded
+    straight to bytes; by default records match ``json.dumps``.
+    """
+
+    def __init__(self, stream: OutputBuffer, options: AcronymOptions, backend=None):
+        super().__init__(stream, options)
+        if backend is None:
+            import json
+
+            dumps = json.dumps
+
+            def encode(record: dict) -> bytes:
+                return dumps(record).encode(stream.encoding)
+
+            self.encode = encode
+        else:
+            self.encode = backend.dumps
+
+    def record(self, phrase: str, acronym: str) -> dict:
+        """Return the structured record for one result."""
+        return {"phrase": phrase, "acronym": acronym, "options": self.options_dict()}
+
+    def write_record(self, phrase: str, acronym: str) -> None:
+        self.stream.write_bytes(self.encode(self.record(phrase, acronym)) + b"\n")
+
+
+class JsonArrayWriter(JsonLinesWriter):
+    """Write a single JSON array, one element per line, streamed."""
+
+    def __init__(self, stream: OutputBuffer, options: AcronymOptions, backend=None):
+        super().__init__(stream, options, backend)
+        self.separator = b"[\n"
+
+    def write_record(self, phrase: str, acronym: str) -> None:
+        self.stream.write_bytes(
+            self.separator + self.encode(self.record(phrase, acronym))
+        )
+        self.separator = b",\n"
+
+    def close(self) -> None:
+        self.stream.write("[]\n" if self.separator == b"[\n" else "\n]\n")
+        super().close()
+
+
+class YamlWriter(BatchWriter):
+    """Write a multi-document YAML stream, one document per phrase."""
+
+    def __init__(self, stream: OutputBuffer, options: AcronymOptions):
+        super().__init__(stream, options)
+        import yaml
+
+        self.dump = yaml.dump
+
+    def write_record(self, phrase: str, acronym: str) -> None:
+        record = {"phrase": phrase, "acronym": acronym, "options": self.options_dict()}
+        self.stream.write(
+            self.dump(record, default_flow_style=False, explicit_start=True)
+        )
+
+
+class DelimitedWriter(BatchWriter):
+    """Write CSV or TSV rows with a single header line."""
+
+    delimiter = ","
+
+    def __init__(self, stream: OutputBuffer, options: AcronymOptions):
+        super().__init__(stream, options)
+        import csv
+
+        self.writer = csv.writer(stream, delimiter=self.delimiter, lineterminator="\n")
+        self.writer.writerow(FIELDS)
+        max_words = options.max_words
+        self.option_columns = [
+            str(options.include_articles).lower(),
+            options.min_word_length,
+            max_words if max_words is not None else "",
+            str(not options.force_uppercase).lower(),
+        ]
+
+    def write_record(self, phrase: str, acronym: str) -> None:
+        self.writer.writerow([phrase, acronym, *self.option_columns])
+
+
+class TsvWriter(DelimitedWriter):
+    """Write TSV rows with a single header line."""
+
+    delimiter = "\t"
+
+
+class TomlWriter(BatchWriter):
+    """Write a TOML array of tables, one ``[[acronyms]]`` table per phrase."""
+
+    def __init__(self, stream: OutputBuffer, options: AcronymOptions):
+        super().__init__(stream, options)
+        import tomli_w
+
+        self.dumps = tomli_w.dumps
+        self.separator = ""
+
+    def write_record(self, phrase: str, acronym: str) -> None:
+        max_words = self.options.max_words
+        record = {
+            "phrase": phrase,
+            "acronym": acronym,
+            "include_articles": self.options.include_articles,
+            "min_word_length": self.options.min_word_length,
+            "max_words": max_words if max_words is not None else "",
+            "lowercase": not self.options.force_uppercase,
+        }
+        self.stream.write(self.separator + self.dumps({"acronyms": [record]}))
+        self.separator = "\n"
+
+
+WRITERS = {
+    "text": TextWriter,
+    "json": JsonLinesWriter,
+    "json-array": JsonArrayWriter,
+    "yaml": YamlWriter,
+    "csv": DelimitedWriter,
+    "tsv": TsvWriter,
+    "toml": TomlWriter,
+}
+
+
+def register_writer(format: str, writer: Type[BatchWriter]) -> None:
+    """Make ``writer`` available to ``get_writer`` under ``format``."""
+    WRITERS[format.lower()] = writer
+
+
+def get_writer(
+    format: str,
+    stream: Union[BinaryIO, TextIO, OutputBuffer],
+    options: AcronymOptions,
+    flush_records: Optional[int] = None,
+    flush_bytes: Optional[int] = DEFAULT_FLUSH_BYTES,
+    **writer_options,
+) -> BatchWriter:
+    """Create the batch writer for the given output format.
+
+    ``stream`` may be a binary or text stream, or an ``OutputBuffer``; the
+    flush policy applies when a new buffer is created around it. Extra
+    keyword arguments, such as ``backend`` for the JSON writers, are passed
+    to the writer.
+    """
+    buffer = OutputBuffer.for_stream(
+        stream, flush_records=flush_records, flush_bytes=flush_bytes
+    )
+    return WRITERS[format.lower()](buffer, options, **writer_options)
@@ -2,35 +2,198 @@
 Command line interface for AcronymCreator.
 """
 
-import csv
-import io
-import json
-import yaml
-import tomli_w
+import dataclasses
+import os
+import sys
+import time
+from pathlib import Path
+
 import click
+from .batch import DEFAULT_CHUNK_SIZE, DEFAULT_FLUSH_BYTES
+from .assign import DEFAULT_MAX_LETTERS as ASSIGN_MAX_LETTERS
 from .core import AcronymCreator, AcronymOptions
+from .creative import (
+    DEFAULT_BEAM_WIDTH,
+    DEFAULT_DICTIONARY,
+    DEFAULT_MAX_LETTERS,
+    DEFAULT_TIME_BUDGET,
+    DEFAULT_TOP,
+)
+from .stopwords import StopWords
 
 # Trigger CI build
 
+# Formatter, multiprocessing and cache modules are imported where they are
+# used, so a run only pays for what it needs; tests/test_startup.py enforces
+# this.
 
-@click.command()
-@click.argument("phrase", required=True)
-@click.option(
-    "--include-articles",
-    is_flag=True,
-    default=False,
-    help="Include articles (a, an, the) in the acronym",
-)
-@click.option(
-    "--min-length",
-    type=int,
-    default=2,
-    help="Minimum word length to include (default: 2)",
-)
-@click.option("--max-words", type=int, help="Maximum number of words to process")
+
+class DefaultCommandGroup(click.Group):
+    """Group that runs ``default_command`` when no subcommand is named.
+
+    This keeps ``acronymcreator "PHRASE" [OPTIONS]`` working alongside
+    subcommands such as ``acronymcreator cache compact``. A first argument
+    that names a subcommand always runs it; ``acronymcreator create WORD``
+    or ``acronymcreator -- WORD`` reads a subcommand name as a phrase.
+    """
+
+    def __init__(self, *args, default_command: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.default_command = default_command
+
+    def parse_args(self, ctx, args):
+        group_options = ctx.help_option_names + ["--version"]
+        if not args or (args[0] not in self.commands and args[0] not in group_options):
+            args = [self.default_command, *args]
+        return super().parse_args(ctx, args)
+
+
+def stop_words_option(func):
+    """Add the option extending the built-in stop words from files."""
+    return click.option(
+        "--stop-words",
+        "stop_word_files",
+        type=click.Path(exists=True, dir_okay=False),
+        multiple=True,
+        help="Also skip the words and phrases listed in FILE, one per line "
+        "('#' starts a comment). Repeatable.",
+    )(func)
+
+
+def acronym_options(func):
+    """Add the options that map onto ``AcronymOptions`` and the stop words."""
+    decorators = [
+        click.option(
+            "--include-articles",
+            is_flag=True,
+            default=False,
+            help="Include articles (a, an, the) in the acronym",
+        ),
+        click.option(
+            "--min-length",
+            type=int,
+            default=2,
+            help="Minimum word length to include (default: 2)",
+        ),
+        click.option(
+            "--max-words", type=int, help="Maximum number of words to process"
+        ),
+        click.option(
+            "--lowercase",
+            is_flag=True,
+            default=False,
+            help="Output acronym in lowercase",
+        ),
+        stop_words_option,
+    ]
+    for decorator in reversed(decorators):
+        func = decorator(func)
+    return func
+
+
+def _load_stop_words(paths):
+    """Return the built-in stop words extended by ``paths``, or None."""
+    if not paths:
+        return None
+    try:
+        return StopWords.from_files(paths, base=AcronymCreator.COMMON_WORDS)
+    except (OSError, UnicodeDecodeError) as error:
+        raise click.UsageError(f"Cannot read stop words: {error}")
+
+
+def normalize_options(func):
+    """Add the options that configure a ``Normalizer``."""
+    decorators = [
+        click.option(
+            "--normalize",
+            is_flag=True,
+            default=False,
+            help="Normalize Unicode and punctuation before splitting words: "
+            "NFKC folding, and hyphens split words. Implied by the options below.",
+        ),
+        click.option(
+            "--unicode-form",
+            type=click.Choice(["NFKC", "NFC", "NFKD", "NFD", "none"]),
+            help="Unicode normalization form (default: NFKC)",
+        ),
+        click.option(
+            "--strip-accents",
+            is_flag=True,
+            default=False,
+            help="Remove accents and other combining diacritics",
+        ),
+        click.option(
+            "--hyphens",
+            type=click.Choice(["split", "join"]),
+            help="Whether dashes and underscores split or join words "
+            "(default: split)",
+        ),
+        click.option(
+            "--apostrophes",
+            type=click.Choice(["join", "split"]),
+            help="Whether apostrophes split or join words (default: join)",
+        ),
+        click.option(
+            "--cjk",
+            type=click.Choice(["word", "split"]),
+            help="Keep runs of Han ideographs as one word, or split them into "
+            "one word per ideograph (default: word)",
+        ),
+    ]
+    for decorator in reversed(decorators):
+        func = decorator(func)
+    return func
+
+
+def _build_normalizer(
+    normalize, unicode_form, strip_accents, hyphens, apostrophes, cjk
+):
+    """Return the ``Normalizer`` selected by the options, or None."""
+    policies = {
+        "form": unicode_form,
+        "strip_accents": strip_accents or None,
+        "hyphens": hyphens,
+        "apostrophes": apostrophes,
+        "cjk": cjk,
+    }
+    policies = {name: value for name, value in policies.items() if value is not None}
+    if not normalize and not policies:
+        return None
+    from .normalize import Normalizer
+
+    return Normalizer(**policies)
+
+
+@click.group(cls=DefaultCommandGroup, default_command="create")
+@click.version_option(version="0.1.0", prog_name="acronymcreator")
+def main():
+    """Generate acronyms from phrases.
+
+    Run without a command to create an acronym for PHRASE (see
+    'acronymcreator create --help' for all options):
+
+        acronymcreator "The Quick Brown Fox" --include-articles
+
+        acronymcreator --input phrases.txt --format csv
+
+    A command name always runs that command. To create an acronym for a
+    phrase that is also a command name, use 'acronymcreator create WORD' or
+    'acronymcreator -- WORD'.
+    """
+
+
+@main.command()
+@click.argument("phrase", required=False)
 @click.option(
-    "--lowercase", is_flag=True, default=False, help="Output acronym in lowercase"
+    "--input",
+    "-i",
+    "inputs",
+    type=click.File("r", encoding="utf-8"),
+    multiple=True,
+    help="Read newline-delimited phrases from FILE ('-' for stdin). Repeatable.",
 )
+@acronym_options
+@normalize_options
 @click.option(
     "--format",
     type=click.Choice(
@@ -39,12 +202,130 @@ from .core import AcronymCreator, AcronymOptions
     default="text",
     help="Output format (default: text)",
 )
-@click.version_option(version="0.1.0", prog_name="acronymcreator")
-def main(phrase, include_articles, min_length, max_words, lowercase, format):
+@click.option(
+    "--json-array",
+    is_flag=True,
+    default=False,
+    help="With --input and --format json, write one JSON array instead of "
+    "JSON Lines",
+)
+@click.option(
+    "--compact",
+    is_flag=True,
+    default=False,
+    help="With --format json, write compact single-line JSON for machines",
+)
+@click.option(
+    "--json-backend",
+    type=click.Choice(["auto", "orjson", "msgspec", "json"]),
+    default="auto",
+    envvar="ACRONYMCREATOR_JSON_BACKEND",
+    help="Serializer for --compact: the fastest installed (default: auto), "
+    "or a specific one",
+)
+@click.option(
+    "--flush-every",
+    type=click.IntRange(min=1),
+    help="With --input, flush output after every N records",
+)
+@click.option(
+    "--flush-bytes",
+    type=click.IntRange(min=1),
+    default=DEFAULT_FLUSH_BYTES,
+    help=f"With --input, flush output once N bytes are pending "
+    f"(default: {DEFAULT_FLUSH_BYTES})",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Worker processes for --input batches (default: 1)",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CHUNK_SIZE,
+    help=f"Phrases per worker chunk (default: {DEFAULT_CHUNK_SIZE})",
+)
+@click.option(
+    "--unordered",
+    is_flag=True,
+    default=False,
+    help="Emit batch results as chunks finish instead of in input order",
+)
+@click.option(
+    "--mmap",
+    "use_mmap",
+    is_flag=True,
+    default=False,
+    help="Memory-map --input files (not stdin) and split them across workers "
+    "by byte offset instead of reading line by line",
+)
+@click.option(
+    "--cache/--no-cache",
+    "use_cache",
+    default=False,
+    envvar="ACRONYMCREATOR_CACHE",
+    help="Reuse results from the on-disk cache for single phrases "
+    "(default: off, or set ACRONYMCREATOR_CACHE=1)",
+)
+@click.option(
+    "--daemon/--no-daemon",
+    "use_daemon",
+    default=False,
+    envvar="ACRONYMCREATOR_DAEMON",
+    help="Ask a running 'acronymcreator serve' daemon first, falling back "
+    "to in-process execution (default: off, or set ACRONYMCREATOR_DAEMON=1)",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Print a stage-by-stage timing breakdown and counters to stderr",
+)
+@click.option(
+    "--profile-output",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Run under cProfile and write pstats data to FILE",
+)
+@click.pass_context
+def create(
+    ctx,
+    phrase,
+    inputs,
+    include_articles,
+    min_length,
+    max_words,
+    lowercase,
+    stop_word_files,
+    normalize,
+    unicode_form,
+    strip_accents,
+    hyphens,
+    apostrophes,
+    cjk,
+    format,
+    json_array,
+    compact,
+    json_backend,
+    flush_every,
+    flush_bytes,
+    workers,
+    chunk_size,
+    unordered,
+    use_mmap,
+    use_cache,
+    use_daemon,
+    profile,
+    profile_output,
+):
     """Generate acronyms from phrases.
 
     PHRASE: The phrase to create an acronym from
 
+    Use --input instead of PHRASE to process one phrase per line from files
+    or stdin in a single run.
+
     Examples:
 
         acronymcreator "The Quick Brown Fox"
@@ -52,8 +333,57 @@ def main(phrase, include_articles, min_length, max_words, lowercase, format):
         acronymcreator "Application Programming Interface" --include-articles
 
         acronymcreator "Very Long Phrase With Many Words" --max-words 3
+
+        acronymcreator "Steps In Order To Win" --stop-words domain.txt
+
+        acronymcreator "State-of-the-Art Ｄａｔａ Café" --normalize --strip-accents
+
+        acronymcreator --input phrases.txt --format csv
+
+        acronymcreator --input phrases.txt --workers 8
+
+        acronymcreator --input huge.txt --mmap --workers 8
+
+        acronymcreator --input phrases.txt --format json --json-array
+
+        acronymcreator --input phrases.txt --format json --compact
+
+        acronymcreator --input phrases.txt --profile > /dev/null
     """
-    creator = AcronymCreator()
+    if phrase is not None and inputs:
+        raise click.UsageError("PHRASE cannot be combined with --input.")
+    if phrase is None and not inputs:
+        raise click.UsageError("Missing argument 'PHRASE' (or use --input).")
+    if json_array and format.lower() != "json":
+        raise click.UsageError("--json-array requires --format json.")
+    if compact and format.lower() != "json":
+        raise click.UsageError("--compact requires --format json.")
+
+    backend = None
+    if compact:
+        from .json_backend import get_backend
+
+        try:
+            backend = get_backend(json_backend)
+        except ImportError:
+            raise click.UsageError(f"JSON backend {json_backend!r} is not installed.")
+
+    profiler = None
+    if profile:
+        from .profiling import Profiler
+
+        profiler = Profiler()
+        ctx.call_on_close(lambda: click.echo(profiler.snapshot().format(), err=True))
+    if profile_output:
+        _start_cprofile(ctx, profile_output)
+
+    stop_words = _load_stop_words(stop_word_files)
+    normalizer = _build_normalizer(
+        normalize, unicode_form, strip_accents, hyphens, apostrophes, cjk
+    )
+    creator = AcronymCreator(
+        profiler=profiler, stop_words=stop_words, normalizer=normalizer
+    )
     options = AcronymOptions(
         include_articles=include_articles,
         min_word_length=min_length,
@@ -61,11 +391,102 @@ def main(phrase, include_articles, min_length, max_words, lowercase, format):
         force_uppercase=not lowercase,
     )
 
-    result = creator.create_basic_acronym(phrase, options)
+    if inputs:
+        from .batch import get_writer, iter_phrases
+        from .parallel import ParallelAcronymEngine
 
-    if not result:
-        click.echo("No acronym could be generated from the given phrase.", err=True)
-        raise click.Abort()
+        engine = ParallelAcronymEngine(workers, chunk_size, creator=creator)
+        writer = get_writer(
+            "json-array" if json_array else format,
+            sys.stdout,
+            options,
+            flush_records=flush_every,
+            flush_bytes=flush_bytes,
+            **({"backend": backend} if backend is not None else {}),
+        )
+        if use_mmap:
+            chunks = _mapped_chunks(engine, inputs, options, not unordered)
+        else:
+            chunks = engine.chunks(iter_phrases(inputs), options, not unordered)
+        _run_batch(chunks, writer, profiler)
+        return
+
+    cache_key = f"{format}{'-compact' if compact else ''}:{options.freeze()}"
+    if stop_words is not None:
+        cache_key += f":{stop_words.fingerprint}"
+    if normalizer is not None:
+        cache_key += f":{normalizer!r}"
+    store = None
+    if use_cache:
+        from .persistent import PersistentCache
+
+        store = PersistentCache()
+    try:
+        output = store.get(phrase, cache_key) if store is not None else None
+        if output is None:
+            # The daemon only knows the built-in stop words and no normalizer
+            ask_daemon = use_daemon and stop_words is None and normalizer is None
+            result = _daemon_acronym(phrase, options) if ask_daemon else None
+            if result is None:
+                result = creator.create_basic_acronym(phrase, options)
+
+            if not result:
+                click.echo(
+                    "No acronym could be generated from the given phrase.", err=True
+                )
+                raise click.Abort()
+
+            render = (
+                _render if profiler is None else profiler.timed("serialize", _render)
+            )
+            output = render(phrase, result, options, format, backend)
+            if store is not None:
+                store.put(phrase, cache_key, output)
+    finally:
+        if store is not None:
+            store.close()
+
+    if profiler is not None:
+        profiler.count("bytes.emitted", len(output.encode("utf-8")) + 1)
+    click.echo(output)
+
+
+def _start_cprofile(ctx, path):
+    """Profile the rest of the command and write pstats data on exit."""
+    import cProfile
+
+    cprofile = cProfile.Profile()
+
+    def finish():
+        cprofile.disable()
+        cprofile.dump_stats(path)
+
+    ctx.call_on_close(finish)
+    cprofile.enable()
+
+
+def _daemon_acronym(phrase, options):
+    """Return the acronym from a running daemon, or None if none answers."""
+    from .server import send_request
+
+    try:
+        response = send_request(
+            {"phrase": phrase, "options": dataclasses.asdict(options)}
+        )
+    except (OSError, ValueError):
+        return None
+    return response.get("acronym")
+
+
+def _render(phrase, result, options, format, json_backend=None):
+    """Render a single result in the requested output format.
+
+    With a ``json_backend``, JSON is rendered compactly by that backend.
+    """
+    include_articles = options.include_articles
+    min_length = options.min_word_length
+    max_words = options.max_words
+    lowercase = not options.force_uppercase
 
     if format == "json":
         output = {
@@ -78,8 +499,14 @@ def main(phrase, include_articles, min_length, max_words, lowercase, format):
                 "lowercase": lowercase,
             },
         }
-        click.echo(json.dumps(output, indent=2))
+        if json_backend is not None:
+            return json_backend.dumps(output).decode("utf-8")
+        import json
+
+        return json.dumps(output, indent=2)
     elif format == "yaml":
+        import yaml
+
         output = {
             "phrase": phrase,
             "acronym": result,
@@ -90,8 +517,11 @@ def main(phrase, include_articles, min_length, max_words, lowercase, format):
                 "lowercase": lowercase,
             },
         }
-        click.echo(yaml.dump(output, default_flow_style=False))
+        return yaml.dump(output, default_flow_style=False)
     elif format == "csv":
+        import csv
+        import io
+
         output_buffer = io.StringIO()
         csv_writer = csv.writer(output_buffer)
         # Write header
@@ -116,8 +546,11 @@ def main(phrase, include_articles, min_length, max_words, lowercase, format):
                 str(lowercase).lower(),
             ]
         )
-        click.echo(output_buffer.getvalue().rstrip())
+        return output_buffer.getvalue().rstrip()
     elif format == "tsv":
+        import csv
+        import io
+
         output_buffer = io.StringIO()
         tsv_writer = csv.writer(output_buffer, delimiter="\t")
         # Write header
@@ -142,8 +575,10 @@ def main(phrase, include_articles, min_length, max_words, lowercase, format):
                 str(lowercase).lower(),
             ]
         )
-        click.echo(output_buffer.getvalue().rstrip())
+        return output_buffer.getvalue().rstrip()
     elif format == "toml":
+        import tomli_w
+
         output = {
             "phrase": phrase,
             "acronym": result,
@@ -152,9 +587,810 @@ def main(phrase, include_articles, min_length, max_words, lowercase, format):
             "max_words": max_words if max_words is not None else "",
             "lowercase": lowercase,
         }
-        click.echo(tomli_w.dumps(output).rstrip())
+        return tomli_w.dumps(output).rstrip()
+    else:
+        return result
+
+
+@main.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    help="Socket path (default: $ACRONYMCREATOR_SOCKET, then "
+    "$XDG_RUNTIME_DIR/acronymcreator.sock)",
+)
+@click.option(
+    "--cache-size",
+    type=click.IntRange(min=1),
+    default=100_000,
+    help="Results kept in the daemon's memory cache (default: 100000)",
+)
+def serve(socket_path, cache_size):
+    """Run a daemon that answers acronym requests over a Unix socket.
+
+    Requests and responses are JSON Lines; see acronymcreator.server for the
+    protocol. Use 'acronymcreator --daemon PHRASE' as a client.
+    """
+    from .cache import LRUCache
+    from .server import AcronymServer, AcronymService
+
+    service = AcronymService(AcronymCreator(cache=LRUCache(cache_size)))
+    try:
+        server = AcronymServer(socket_path, service)
+    except OSError as error:
+        raise click.ClickException(str(error))
+
+    click.echo(f"Listening on {server.path}", err=True)
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            click.echo("Shutting down.", err=True)
+
+
+@main.group()
+def cache():
+    """Manage the on-disk result cache."""
+
+
+@cache.command()
+@click.option(
+    "--max-entries",
+    type=click.IntRange(min=1),
+    help="Entries to keep (default: 100000)",
+)
+def compact(max_entries):
+    """Remove stale and excess entries and reclaim disk space."""
+    from .persistent import PersistentCache
+
+    with PersistentCache(max_entries=max_entries) as persistent:
+        removed = persistent.compact()
+        click.echo(f"Removed {removed} entries; {len(persistent)} remain.")
+
+
+@cache.command()
+def clear():
+    """Remove every cached result."""
+    from .persistent import PersistentCache
+
+    with PersistentCache() as persistent:
+        persistent.clear()
+    click.echo("Cache cleared.")
+
+
+@cache.command()
+def info():
+    """Show the cache location and size."""
+    from .persistent import PersistentCache
+
+    with PersistentCache() as persistent:
+        click.echo(f"Path: {persistent.path}")
+        click.echo(f"Entries: {len(persistent)}")
+        click.echo(f"Size: {persistent.path.stat().st_size} bytes")
+
+
+@main.command()
+@click.argument("source", type=click.Path(exists=True, dir_okay=False))
+@click.argument("destination", type=click.Path(dir_okay=False, writable=True))
+@click.option("--column", "-c", required=True, help="Column holding the phrases")
+@click.option(
+    "--output-column",
+    default="acronym",
+    help="Name of the added column (default: acronym)",
+)
+@click.option(
+    "--strategy",
+    type=click.Choice(["basic", "syllable"]),
+    default="basic",
+    help="Acronym strategy (default: basic)",
+)
+@click.option(
+    "--syllable-model",
+    type=click.Choice(["legacy", "vowel", "pattern"]),
+    default="legacy",
+    help="How --strategy syllable splits words: the original 2-3 letter rule "
+    "(default: legacy), vowel groups, or hyphenation patterns",
+)
+@click.option(
+    "--patterns",
+    "patterns_file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Liang/TeX hyphenation pattern file for --syllable-model pattern",
+)
+@click.option(
+    "--syllables",
+    "syllable_count",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Leading syllables taken from each word (default: 1)",
+)
+@acronym_options
+@click.option(
+    "--format",
+    type=click.Choice(["csv", "tsv", "parquet"], case_sensitive=False),
+    help="File format (default: from the SOURCE extension)",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Worker processes (default: 1)",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CHUNK_SIZE,
+    help=f"Rows per chunk (default: {DEFAULT_CHUNK_SIZE})",
+)
+@click.option(
+    "--progress/--no-progress",
+    default=None,
+    help="Show a progress bar on stderr (default: when stderr is a terminal)",
+)
+def transform(
+    source,
+    destination,
+    column,
+    output_column,
+    strategy,
+    syllable_model,
+    patterns_file,
+    syllable_count,
+    include_articles,
+    min_length,
+    max_words,
+    lowercase,
+    stop_word_files,
+    format,
+    workers,
+    chunk_size,
+    progress,
+):
+    """Copy a CSV, TSV or Parquet file, adding an acronym column.
+
+    SOURCE is read in chunks of --chunk-size rows, so files of any size are
+    processed in bounded memory. Parquet files need pyarrow.
+
+    Examples:
+
+        acronymcreator transform staff.csv staff-out.csv --column department
+
+        acronymcreator transform names.parquet out.parquet -c name --workers 8
+
+        acronymcreator transform t.csv out.csv -c title --strategy syllable \
+            --syllable-model pattern --patterns hyph-en-us.tex
+    """
+    from .parallel import ParallelAcronymEngine
+    from .syllables import get_syllabifier
+    from .transform import open_transform
+
+    options = AcronymOptions(
+        include_articles=include_articles,
+        min_word_length=min_length,
+        max_words=max_words,
+        force_uppercase=not lowercase,
+    )
+    if strategy != "syllable" and (
+        syllable_model != "legacy" or patterns_file or syllable_count != 1
+    ):
+        raise click.UsageError("Syllable options require --strategy syllable.")
+    if patterns_file and syllable_model != "pattern":
+        raise click.UsageError("--patterns requires --syllable-model pattern.")
+    try:
+        syllabifier = get_syllabifier(syllable_model, patterns_file, syllable_count)
+    except (OSError, UnicodeDecodeError, ValueError) as error:
+        raise click.UsageError(str(error))
+    creator = AcronymCreator(
+        stop_words=_load_stop_words(stop_word_files), syllabifier=syllabifier
+    )
+    engine = ParallelAcronymEngine(
+        workers, chunk_size, creator=creator, strategy=strategy
+    )
+    try:
+        job = open_transform(source, destination, column, output_column, format)
+        if progress is None:
+            progress = sys.stderr.isatty()
+        if not progress:
+            rows = job.run(engine, options)
+        else:
+            with click.progressbar(
+                length=job.total, label="Transforming", file=sys.stderr
+            ) as bar:
+                rows = job.run(engine, options, bar.update)
+    except ImportError:
+        raise click.ClickException(
+            "Parquet support requires pyarrow "
+            "(pip install 'acronymcreator[parquet]')."
+        )
+    except ValueError as error:
+        raise click.ClickException(str(error))
+    click.echo(f"Wrote {rows} rows to {destination}", err=True)
+
+
+@main.command()
+@click.argument("phrase")
+@click.option(
+    "--dictionary",
+    "-d",
+    type=click.Path(exists=True, dir_okay=False),
+    help=f"Word list to find real words in, one per line "
+    f"(default: {DEFAULT_DICTIONARY} when present)",
+)
+@click.option(
+    "--top",
+    type=click.IntRange(min=1),
+    default=DEFAULT_TOP,
+    help=f"Number of candidates to show (default: {DEFAULT_TOP})",
+)
+@click.option(
+    "--max-letters",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_LETTERS,
+    help=f"Most letters taken from one word (default: {DEFAULT_MAX_LETTERS})",
+)
+@click.option(
+    "--beam-width",
+    type=click.IntRange(min=1),
+    default=DEFAULT_BEAM_WIDTH,
+    help=f"Partial acronyms kept per word (default: {DEFAULT_BEAM_WIDTH})",
+)
+@click.option(
+    "--time-budget",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_TIME_BUDGET * 1000,
+    help=f"Search time limit in milliseconds "
+    f"(default: {DEFAULT_TIME_BUDGET * 1000:g})",
+)
+@click.option(
+    "--index-cache/--no-index-cache",
+    default=True,
+    help="Reuse the compiled dictionary from the cache directory (default: on)",
+)
+@stop_words_option
+@click.option(
+    "--format",
+    type=click.Choice(["text", "json"], case_sensitive=False),
+    default="text",
+    help="Output format (default: text)",
+)
+def creative(
+    phrase,
+    dictionary,
+    top,
+    max_letters,
+    beam_width,
+    time_budget,
+    index_cache,
+    stop_word_files,
+    format,
+):
+    """Search for pronounceable or real-word acronyms of PHRASE.
+
+    Each word may contribute up to --max-letters leading letters, and stop
+    words may be skipped. Candidates that spell a dictionary word score
+    highest, then pronounceable ones; the best --top are listed with their
+    scores.
+
+    Examples:
+
+        acronymcreator creative "Light Amplification by Stimulated Emission"
+
+        acronymcreator creative "Customer Data Platform" -d words.txt --top 5
+    """
+    from .creative import CreativeSearch, WordIndex
+
+    if dictionary is None and DEFAULT_DICTIONARY.is_file():
+        dictionary = DEFAULT_DICTIONARY
+    index = None
+    if dictionary is not None:
+        try:
+            index = WordIndex.from_file(dictionary, cache=index_cache)
+        except OSError as error:
+            raise click.UsageError(f"Cannot read dictionary: {error}")
+    stop_words = _load_stop_words(stop_word_files)
+    search = CreativeSearch(
+        index,
+        AcronymCreator.COMMON_WORDS if stop_words is None else stop_words,
+        max_letters=max_letters,
+        beam_width=beam_width,
+        time_budget=time_budget / 1000,
+    )
+    candidates = search.search(phrase, top)
+    if not candidates:
+        click.echo("No acronym could be generated from the given phrase.", err=True)
+        raise click.Abort()
+    if format.lower() == "json":
+        import json
+
+        click.echo(
+            json.dumps(
+                [candidate._asdict() for candidate in candidates],
+                indent=2,
+                ensure_ascii=False,
+            )
+        )
+        return
+    for candidate in candidates:
+        marker = "  (word)" if candidate.is_word else ""
+        click.echo(f"{candidate.acronym:<12} {candidate.score:6.2f}{marker}")
+
+
+@main.command()
+@click.option(
+    "--input",
+    "-i",
+    "inputs",
+    type=click.File("r", encoding="utf-8"),
+    multiple=True,
+    help="Read newline-delimited names from FILE ('-' for stdin, the default). "
+    "Repeatable.",
+)
+@acronym_options
+@click.option(
+    "--registry",
+    type=click.Path(dir_okay=False),
+    help="Acronyms already in use, one 'ACRONYM<TAB>name' per line "
+    "(the name is optional)",
+)
+@click.option(
+    "--update-registry",
+    is_flag=True,
+    default=False,
+    help="Write the new assignments back to --registry",
+)
+@click.option(
+    "--max-letters",
+    type=click.IntRange(min=1),
+    default=ASSIGN_MAX_LETTERS,
+    help=f"Most letters taken from one word before falling back to the "
+    f"syllable acronym and numeric suffixes (default: {ASSIGN_MAX_LETTERS})",
+)
+@click.option(
+    "--format",
+    type=click.Choice(["text", "tsv", "json"], case_sensitive=False),
+    default="text",
+    help="Output format: acronyms only (default: text), or name, acronym and "
+    "strategy as TSV or JSON Lines",
+)
+def assign(
+    inputs,
+    include_articles,
+    min_length,
+    max_words,
+    lowercase,
+    stop_word_files,
+    registry,
+    update_registry,
+    max_letters,
+    format,
+):
+    """Assign a unique acronym to every name, one name per input line.
+
+    Collisions with earlier names or the registry escalate through more
+    letters per word, the syllable acronym and finally a numeric suffix.
+    Output has one line per input line; repeated names get the same acronym.
+
+    Examples:
+
+        acronymcreator assign -i teams.txt
+
+        acronymcreator assign -i services.txt --registry registry.tsv \
+            --update-registry --format tsv
+    """
+    import json
+
+    from .assign import AcronymAssigner, read_registry, write_registry
+    from .batch import iter_phrases
+
+    if update_registry and not registry:
+        raise click.UsageError("--update-registry requires --registry.")
+    entries = []
+    if registry and (os.path.exists(registry) or not update_registry):
+        try:
+            entries = read_registry(registry)
+        except (OSError, UnicodeDecodeError) as error:
+            raise click.UsageError(f"Cannot read registry: {error}")
+
+    creator = AcronymCreator(stop_words=_load_stop_words(stop_word_files))
+    options = AcronymOptions(
+        include_articles=include_articles,
+        min_word_length=min_length,
+        max_words=max_words,
+        force_uppercase=not lowercase,
+    )
+    assigner = AcronymAssigner(creator, options, entries, max_letters)
+    names = iter_phrases(inputs or (sys.stdin,))
+    write = sys.stdout.write
+    format = format.lower()
+    if format == "tsv":
+        write("name\tacronym\tstrategy\n")
+    for assignment in assigner.assign_many(names):
+        if format == "text":
+            write(f"{assignment.acronym}\n")
+        elif format == "tsv":
+            write("\t".join(assignment) + "\n")
+        else:
+            write(json.dumps(assignment._asdict(), ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+    if update_registry:
+        write_registry(registry, assigner.registry())
+
+
+@main.group()
+def index():
+    """Build and query the reverse index from acronyms to phrases."""
+
+
+def index_path_option(func):
+    """Add the option choosing the reverse index file."""
+    return click.option(
+        "--index",
+        "-x",
+        "index_path",
+        type=click.Path(dir_okay=False),
+        envvar="ACRONYMCREATOR_INDEX",
+        help="Index file (default: reverse-index.sqlite3 in the cache "
+        "directory, or set ACRONYMCREATOR_INDEX)",
+    )(func)
+
+
+def _open_index(index_path, mode="ro", **settings):
+    """Open a reverse index, turning setting mismatches into usage errors.
+
+    Only ``index build`` passes ``mode="rwc"``; the other commands refuse a
+    missing index instead of creating an empty one.
+    """
+    from .reverse import ReverseIndex
+
+    try:
+        return ReverseIndex(index_path, mode=mode, **settings)
+    except FileNotFoundError as error:
+        raise click.UsageError(
+            f"{error}; run 'acronymcreator index build' to create it"
+        )
+    except ValueError as error:
+        raise click.UsageError(str(error))
+
+
+def _index_corpus(reverse_index, corpus, workers):
+    """Add every corpus line to the index and report the totals."""
+    from .batch import iter_phrases
+    from .parallel import ParallelAcronymEngine
+
+    engine = ParallelAcronymEngine(
+        workers, creator=reverse_index.creator, strategy=reverse_index.strategy
+    )
+    added = reverse_index.add(iter_phrases(corpus), engine)
+    click.echo(
+        f"Added {added} postings; {len(reverse_index)} postings for "
+        f"{reverse_index.acronym_count()} acronyms in {reverse_index.path}",
+        err=True,
+    )
+
+
+@index.command("build")
+@click.argument(
+    "corpus", type=click.File("r", encoding="utf-8"), nargs=-1, required=True
+)
+@index_path_option
+@click.option(
+    "--strategy",
+    type=click.Choice(["basic", "syllable"]),
+    default="basic",
+    help="Acronym strategy (default: basic)",
+)
+@acronym_options
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Worker processes (default: 1)",
+)
+def index_build(
+    corpus,
+    index_path,
+    strategy,
+    include_articles,
+    min_length,
+    max_words,
+    lowercase,
+    stop_word_files,
+    workers,
+):
+    """Build a new index from CORPUS files, one phrase per line.
+
+    Any existing index at the same path is replaced. The acronym options
+    and stop words are stored in the index and reused by 'index add'.
+
+    Examples:
+
+        acronymcreator index build glossary.txt
+
+        acronymcreator index build corpus.txt -x corpus.idx --workers 8
+    """
+    from .reverse import default_index_path
+
+    path = Path(index_path) if index_path else default_index_path()
+    if path.exists():
+        path.unlink()
+    options = AcronymOptions(
+        include_articles=include_articles,
+        min_word_length=min_length,
+        max_words=max_words,
+        force_uppercase=not lowercase,
+    )
+    creator = AcronymCreator(stop_words=_load_stop_words(stop_word_files))
+    with _open_index(
+        path, mode="rwc", options=options, strategy=strategy, creator=creator
+    ) as reverse_index:
+        _index_corpus(reverse_index, corpus, workers)
+
+
+@index.command("add")
+@click.argument(
+    "corpus", type=click.File("r", encoding="utf-8"), nargs=-1, required=True
+)
+@index_path_option
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Worker processes (default: 1)",
+)
+def index_add(corpus, index_path, workers):
+    """Add new phrases from CORPUS files to an index.
+
+    Phrases are processed with the settings the index was built with, and
+    phrases already indexed are skipped.
+    """
+    with _open_index(index_path, mode="rw") as reverse_index:
+        _index_corpus(reverse_index, corpus, workers)
+
+
+@index.command("lookup")
+@click.argument("acronym")
+@index_path_option
+@click.option(
+    "--prefix",
+    "by_prefix",
+    is_flag=True,
+    default=False,
+    help="Match every acronym starting with ACRONYM",
+)
+@click.option("--limit", type=click.IntRange(min=1), help="Show at most N phrases")
+@click.option(
+    "--format",
+    type=click.Choice(["text", "json"], case_sensitive=False),
+    default="text",
+    help="Output format (default: text)",
+)
+def index_lookup(acronym, index_path, by_prefix, limit, format):
+    """List the indexed phrases whose acronym is ACRONYM.
+
+    Matching ignores case. With --prefix, each line shows the acronym and
+    the phrase separated by a tab.
+
+    Examples:
+
+        acronymcreator index lookup API
+
+        acronymcreator index lookup DP --prefix --limit 20
+    """
+    with _open_index(index_path) as reverse_index:
+        if by_prefix:
+            results = reverse_index.prefix(acronym, limit)
+        else:
+            results = [
+                (acronym.upper(), phrase)
+                for phrase in reverse_index.lookup(acronym, limit)
+            ]
+    if not results:
+        click.echo(f"No indexed phrases for {acronym!r}.", err=True)
+        raise click.Abort()
+    if format.lower() == "json":
+        import json
+
+        for found, phrase in results:
+            click.echo(json.dumps({"acronym": found, "phrase": phrase}))
+    elif by_prefix:
+        for found, phrase in results:
+            click.echo(f"{found}\t{phrase}")
     else:
-        click.echo(result)
+        for _, phrase in results:
+            click.echo(phrase)
+
+
+@index.command("info")
+@index_path_option
+def index_info(index_path):
+    """Show the index location, settings and size."""
+    with _open_index(index_path) as reverse_index:
+        click.echo(f"Path: {reverse_index.path}")
+        click.echo(f"Strategy: {reverse_index.strategy}")
+        click.echo(f"Options: {reverse_index.options}")
+        click.echo(f"Postings: {len(reverse_index)}")
+        click.echo(f"Acronyms: {reverse_index.acronym_count()}")
+
+
+@main.command()
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@acronym_options
+@normalize_options
+@click.option(
+    "--strategy",
+    type=click.Choice(["basic", "syllable"]),
+    default="basic",
+    help="Acronym strategy (default: basic)",
+)
+@click.option(
+    "--state",
+    "state_path",
+    type=click.Path(dir_okay=False),
+    help="State file holding a copy of PATH's text and every acronym "
+    "(default: under the cache directory, named after PATH)",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False),
+    help="Also write every acronym to this file, one per input line",
+)
+@click.option(
+    "--once",
+    is_flag=True,
+    default=False,
+    help="Update once and exit instead of watching",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Seconds between checks of PATH (default: 1)",
+)
+@click.option(
+    "--format",
+    type=click.Choice(["text", "json"], case_sensitive=False),
+    default="text",
+    help="Output format of the changes (default: text)",
+)
+def watch(
+    path,
+    include_articles,
+    min_length,
+    max_words,
+    lowercase,
+    stop_word_files,
+    normalize,
+    unicode_form,
+    strip_accents,
+    hyphens,
+    apostrophes,
+    cjk,
+    strategy,
+    state_path,
+    output,
+    once,
+    interval,
+    format,
+):
+    """Recompute acronyms for the changed lines of PATH as it is edited.
+
+    A copy of the file's text and the acronym of every line are kept in a
+    state file, so only added or edited lines are recomputed. The state file
+    is about as large as PATH and holds its full text. Each update prints
+    the acronym changes: "+LINE" for added lines, "-LINE" for removed ones
+    and "~LINE" for lines whose acronym changed. The first run reports every
+    line, and unchanged parts of the file are skipped without splitting them
+    into lines.
+
+    Examples:
+
+        acronymcreator watch glossary.txt
+
+        acronymcreator watch glossary.txt --once -o glossary.acronyms
+    """
+    from .incremental import DEFAULT_INTERVAL, IncrementalFile
+
+    creator = AcronymCreator(
+        stop_words=_load_stop_words(stop_word_files),
+        normalizer=_build_normalizer(
+            normalize, unicode_form, strip_accents, hyphens, apostrophes, cjk
+        ),
+    )
+    options = AcronymOptions(
+        include_articles=include_articles,
+        min_word_length=min_length,
+        max_words=max_words,
+        force_uppercase=not lowercase,
+    )
+    watched = IncrementalFile(path, state_path, creator, options, strategy)
+    try:
+        while True:
+            try:
+                changes = watched.update()
+            except FileNotFoundError:
+                if once:
+                    raise click.UsageError(f"{path} no longer exists.")
+                # Editors that save by renaming remove the file briefly
+                changes = None
+            except UnicodeDecodeError as error:
+                raise click.UsageError(f"Cannot read {path}: {error}")
+            updated = changes is not None and (changes or watched.recomputed)
+            if updated:
+                _echo_changes(changes, format.lower())
+                click.echo(
+                    f"{path}: {len(changes)} changes, {watched.recomputed} of "
+                    f"{len(watched)} lines recomputed",
+                    err=True,
+                )
+            if output and (updated or not os.path.exists(output)):
+                _write_acronyms(output, watched.acronyms)
+            if once:
+                return
+            time.sleep(interval or DEFAULT_INTERVAL)
+    except KeyboardInterrupt:
+        pass
+
+
+def _echo_changes(changes, format):
+    """Print acronym changes from ``IncrementalFile.update``."""
+    write = sys.stdout.write
+    if format == "json":
+        import json
+
+        for change in changes:
+            record = {
+                key: value
+                for key, value in change._asdict().items()
+                if value is not None
+            }
+            write(json.dumps(record, ensure_ascii=False) + "\n")
+    else:
+        for change in changes:
+            if change.change == "added":
+                write(f"+{change.line}\t{change.acronym}\t{change.phrase}\n")
+            elif change.change == "removed":
+                write(f"-{change.line}\t{change.acronym}\t{change.phrase}\n")
+            else:
+                write(
+                    f"~{change.line}\t{change.old_acronym} -> {change.acronym}"
+                    f"\t{change.phrase}\n"
+                )
+    sys.stdout.flush()
+
+
+def _write_acronyms(path, acronyms):
+    """Replace ``path`` with one acronym per line once fully written."""
+    partial = f"{path}.partial"
+    with open(partial, "w", encoding="utf-8", newline="\n") as file:
+        file.writelines(f"{acronym}\n" for acronym in acronyms)
+    os.replace(partial, path)
+
+
+def _mapped_chunks(engine, inputs, options, ordered):
+    """Yield processed chunks per input, memory-mapping regular files."""
+    from .batch import iter_phrases
+
+    for stream in inputs:
+        if stream.name == "-" or not os.path.isfile(stream.name):
+            yield from engine.chunks(iter_phrases([stream]), options, ordered)
+        else:
+            yield from engine.file_chunks(stream.name, options, ordered)
+
+
+def _run_batch(chunks, writer, profiler=None):
+    """Stream every processed chunk through one writer."""
+    write = writer.write
+    if profiler is not None:
+        write = profiler.timed("serialize", write)
+    try:
+        for _, chunk, acronyms in chunks:
+            for phrase, acronym in zip(chunk, acronyms):
+                write(phrase, acronym)
+    finally:
+        writer.close()
+        if profiler is not None:
+            profiler.count("bytes.emitted", writer.stream.bytes_written)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,122 @@
+"""
+Columnar bulk API for AcronymCreator.
+
+``acronym_column`` turns a whole column of phrases into a same-length
+column of acronyms. Each distinct phrase is processed once and the results
+are scattered back, so columns with repeated values (names, departments,
+product lines) cost one acronym per unique value. NumPy and pyarrow inputs
+are handled natively when those libraries are installed; neither is
+required, and neither is imported unless the input comes from it.
+"""
+
+import sys
+from typing import Callable, Iterable, List, Optional
+
+from .core import AcronymCreator, AcronymOptions
+
+COLUMN_STRATEGIES = ("basic", "syllable")
+
+
+def _is_null(value) -> bool:
+    """Return True for None and float NaN (as used by NumPy and pandas)."""
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def _check_phrases(phrases: List) -> None:
+    for phrase in phrases:
+        if not isinstance(phrase, str):
+            raise TypeError(
+                f"acronym columns must contain str or null values, "
+                f"not {type(phrase).__name__}"
+            )
+
+
+def _list_column(values: Iterable, acronyms_for: Callable) -> List[str]:
+    """Map a plain sequence, computing each distinct phrase once."""
+    values = values if isinstance(values, list) else list(values)
+    results = dict.fromkeys(values)
+    phrases = [value for value in results if not _is_null(value)]
+    _check_phrases(phrases)
+    results.update(zip(phrases, acronyms_for(phrases)))
+    # Nulls were never computed and still map to None
+    return [results[value] or "" for value in values]
+
+
+def _numpy_column(values, acronyms_for: Callable):
+    """Map a 1-D NumPy string or object array to an array of acronyms."""
+    import numpy as np
+
+    if values.ndim != 1:
+        raise ValueError("acronym columns must be one-dimensional")
+    if values.dtype.kind not in "UO":
+        raise TypeError(
+            f"acronym columns must have a string or object dtype, not {values.dtype}"
+        )
+    # Hash-based deduplication beats np.unique, which sorts the strings
+    acronyms = _list_column(values.tolist(), acronyms_for)
+    return np.array(acronyms, dtype=str if values.dtype.kind == "U" else object)
+
+
+def _arrow_column(values, acronyms_for: Callable):
+    """Map a pyarrow string Array or ChunkedArray to a string column."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if isinstance(values, pa.ChunkedArray):
+        return pa.chunked_array(
+            [_arrow_column(chunk, acronyms_for) for chunk in values.chunks],
+            type=pa.string(),
+        )
+    if not (pa.types.is_string(values.type) or pa.types.is_large_string(values.type)):
+        raise TypeError(f"acronym columns must have a string type, not {values.type}")
+    # Nulls become null indices, so each distinct phrase is computed once
+    encoded = pc.dictionary_encode(values)
+    acronyms = pa.array(acronyms_for(encoded.dictionary.to_pylist()), type=pa.string())
+    return pc.fill_null(acronyms.take(encoded.indices), "")
+
+
+def acronym_column(
+    values,
+    options: Optional[AcronymOptions] = None,
+    strategy: str = "basic",
+    creator: Optional[AcronymCreator] = None,
+):
+    """Return one acronym per value, in the same order.
+
+    ``values`` may be any iterable of strings (a list is returned), a 1-D
+    NumPy string or object array (an array is returned) or a pyarrow string
+    ``Array``/``ChunkedArray`` (a pyarrow string column is returned). Nulls
+    (None, NaN, Arrow nulls) and empty strings yield "", as the scalar API
+    does for phrases without words. ``strategy`` is "basic" or "syllable".
+    """
+    if strategy not in COLUMN_STRATEGIES:
+        raise ValueError(
+            f"Unknown strategy {strategy!r}; choose from {', '.join(COLUMN_STRATEGIES)}"
+        )
+    creator = creator or AcronymCreator()
+    options = options or AcronymOptions()
+
+    if strategy == "basic":
+
+        def acronyms_for(phrases: List[str]) -> List[str]:
+            return list(creator.create_basic_acronym_many(phrases, options))
+
+    else:
+
+        def acronyms_for(phrases: List[str]) -> List[str]:
+            return [
+                creator.create_syllable_acronym(phrase, options) for phrase in phrases
+            ]
+
+    # Only inputs from an already imported library can be its arrays
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return _numpy_column(values, acronyms_for)
+    pyarrow = sys.modules.get("pyarrow")
+    if pyarrow is not None and isinstance(
+        values, (pyarrow.Array, pyarrow.ChunkedArray)
+    ):
+        return _arrow_column(values, acronyms_for)
+    if isinstance(values, str):
+        raise TypeError("acronym_column expects a column of phrases, not a str")
+    return _list_column(values, acronyms_for)
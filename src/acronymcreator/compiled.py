@@ -0,0 +1,106 @@
+"""
+Frozen and compiled acronym options for AcronymCreator.
+"""
+
+from functools import lru_cache
+from typing import AbstractSet, Callable, List, NamedTuple, Optional
+
+from .stopwords import StopWords
+from .tokenizer import Tokenizer
+
+# Number of distinct (options, stop words, normalizer) combinations kept
+# compiled
+COMPILED_CACHE_SIZE = 64
+
+
+class FrozenAcronymOptions(NamedTuple):
+    """Immutable, hashable counterpart of ``AcronymOptions``.
+
+    Being a named tuple it has no per-instance ``__dict__`` and can be used
+    directly as a cache key.
+    """
+
+    include_articles: bool = False
+    min_word_length: int = 2
+    max_words: Optional[int] = None
+    force_uppercase: bool = True
+
+    @classmethod
+    def from_options(cls, options) -> "FrozenAcronymOptions":
+        """Freeze any object with the ``AcronymOptions`` fields."""
+        if isinstance(options, cls):
+            return options
+        return cls(
+            options.include_articles,
+            options.min_word_length,
+            options.max_words,
+            options.force_uppercase,
+        )
+
+
+class CompiledOptions:
+    """Options specialized into a tokenizer, truncation and case transform.
+
+    Calling an instance with a phrase returns its basic acronym, so hot
+    loops can skip option handling entirely.
+    """
+
+    __slots__ = ("options", "tokenizer", "tokenize", "max_words", "change_case")
+
+    def __init__(
+        self,
+        options: FrozenAcronymOptions,
+        common_words: AbstractSet[str],
+        normalizer: Optional[Callable[[str], str]] = None,
+    ):
+        self.options = options
+        self.tokenizer = Tokenizer.for_options(options, common_words, normalizer)
+        self.tokenize = self.tokenizer.tokenize
+        self.max_words = options.max_words
+        self.change_case = str.upper if options.force_uppercase else str.lower
+
+    def words(self, phrase: str) -> List[str]:
+        """Return the filtered words of a phrase, truncated to ``max_words``."""
+        words = list(self.tokenize(phrase))
+        if self.max_words is not None:
+            words = words[: self.max_words]
+        return words
+
+    def __call__(self, phrase: str) -> str:
+        """Create the basic acronym for a phrase."""
+        initials = [word[0] for word in self.tokenize(phrase)]
+        if self.max_words is not None:
+            initials = initials[: self.max_words]
+        return self.change_case("".join(initials))
+
+
+@lru_cache(maxsize=COMPILED_CACHE_SIZE)
+def _compile(
+    options: FrozenAcronymOptions,
+    common_words: AbstractSet[str],
+    normalizer: Optional[Callable[[str], str]],
+) -> CompiledOptions:
+    return CompiledOptions(options, common_words, normalizer)
+
+
+def compile_options(
+    options,
+    common_words: AbstractSet[str],
+    normalizer: Optional[Callable[[str], str]] = None,
+) -> CompiledOptions:
+    """Return the shared compiled form of ``options`` and ``common_words``.
+
+    Accepts ``AcronymOptions`` or ``FrozenAcronymOptions``. Compiled options
+    are interned in a small LRU cache, so services that only use a handful
+    of option combinations compile each one once. A ``normalizer`` is part
+    of the cache key, so it must be hashable.
+    """
+    if not isinstance(common_words, (frozenset, StopWords)):
+        common_words = frozenset(common_words)
+    return _compile(
+        FrozenAcronymOptions.from_options(options), common_words, normalizer
+    )
+
+
+compiled_cache_info = _compile.cache_info
+compiled_cache_clear = _compile.cache_clear
@@ -4,7 +4,18 @@ Core functionality for AcronymCreator.
 
 import re
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, AbstractSet, Iterable, Iterator, Optional
+
+from .cache import LRUCache
+from .compiled import CompiledOptions, FrozenAcronymOptions, compile_options
+from .stopwords import StopWords
+from .strategies import MultiStrategyEngine, syllables
+from .tokenizer import PUNCTUATION_PATTERN, Tokenizer
+
+if TYPE_CHECKING:
+    from .normalize import Normalizer
+    from .profiling import Profiler
+    from .syllables import Syllabifier
 
 
 @dataclass
@@ -16,9 +27,26 @@ class AcronymOptions:
     max_words: Optional[int] = None
     force_uppercase: bool = True
 
+    def freeze(self) -> FrozenAcronymOptions:
+        """Return an immutable, hashable copy of these options."""
+        return FrozenAcronymOptions.from_options(self)
+
 
 class AcronymCreator:
-    """Main class for creating acronyms from phrases."""
+    """Main class for creating acronyms from phrases.
+
+    Pass an ``LRUCache`` as ``cache`` to memoize results for repeated
+    phrases; results are keyed on the phrase, the strategy, the options and
+    the creator's stop words, syllabifier and normalizer.
+    Pass a ``Profiler`` as ``profiler`` to record per-stage timings and
+    word counters. Pass ``stop_words`` to replace ``COMMON_WORDS``, either
+    with a set of words or with a ``StopWords`` dictionary that may also
+    hold multi-word entries such as "in order to". Pass a ``Syllabifier``
+    as ``syllabifier`` to choose how syllable acronyms split words; without
+    one the original two-to-three character rule is used. Pass a
+    ``Normalizer`` as ``normalizer`` to apply Unicode normalization and
+    explicit hyphen, apostrophe and CJK policies before tokenizing.
+    """
 
     # Common articles and prepositions to potentially exclude
     COMMON_WORDS = {
@@ -44,32 +72,92 @@ class AcronymCreator:
         "during",
     }
 
+    def __init__(
+        self,
+        cache: Optional[LRUCache] = None,
+        profiler: Optional["Profiler"] = None,
+        stop_words: Optional[AbstractSet[str]] = None,
+        syllabifier: Optional["Syllabifier"] = None,
+        normalizer: Optional["Normalizer"] = None,
+    ):
+        self.cache = cache
+        self.profiler = profiler
+        self.syllabifier = syllabifier
+        self.normalizer = normalizer
+        if stop_words is not None:
+            # Freeze plain sets once; compiled options are looked up by them
+            if isinstance(stop_words, StopWords):
+                # Multi-word entries must split like the phrases they match
+                stop_words = stop_words.with_normalizer(normalizer)
+            elif not isinstance(stop_words, frozenset):
+                stop_words = frozenset(stop_words)
+            self.COMMON_WORDS = stop_words
+
     def create_basic_acronym(self, phrase: str, options: AcronymOptions) -> str:
         """Create a basic acronym by taking first letters."""
-        if not phrase.strip():
-            return ""
-
-        # Use the extract_words method to get filtered words
-        words = self.extract_words(phrase, options)
-
-        # Limit number of words if max_words is specified
-        if options.max_words is not None:
-            words = words[: options.max_words]
-
-        acronym = "".join(word[0] for word in words)
-
-        if options.force_uppercase:
-            acronym = acronym.upper()
-        else:
-            acronym = acronym.lower()
-
-        return acronym
+        compiled = self.compile(options)
+        if self.cache is None:
+            return compiled(phrase)
+        key = ("basic", phrase, compiled.options, self._settings())
+        return self.cache.get_or_compute(key, lambda: compiled(phrase))
+
+    def create_basic_acronym_many(
+        self, phrases: Iterable[str], options: AcronymOptions
+    ) -> Iterator[str]:
+        """Create basic acronyms for many phrases sharing the same options.
+
+        Yields the same results as calling create_basic_acronym for each
+        phrase, but resolves the option-dependent filtering and case handling
+        once per batch rather than once per phrase.
+        """
+        if self.cache is not None:
+            return (self.create_basic_acronym(phrase, options) for phrase in phrases)
+        return map(self.compile(options), phrases)
+
+    def _settings(self) -> tuple:
+        """Return the creator settings that results depend on besides options.
+
+        Part of every cache key, so creators with different stop words,
+        syllabifiers or normalizers can share one ``LRUCache``.
+        """
+        return (self._stop_words(), self.syllabifier, self.normalizer)
+
+    def _stop_words(self) -> AbstractSet[str]:
+        """Return ``COMMON_WORDS`` in hashable form.
+
+        The class-level set stays mutable so callers can customize it; it is
+        frozen here, when results are cached, so later changes take effect.
+        """
+        words = self.COMMON_WORDS
+        if isinstance(words, (frozenset, StopWords)):
+            return words
+        return frozenset(words)
+
+    def compile(self, options: AcronymOptions) -> CompiledOptions:
+        """Return the cached compiled form of options with these stop words."""
+        compiled = compile_options(options, self.COMMON_WORDS, self.normalizer)
+        if self.profiler is not None:
+            return self.profiler.instrument(compiled)
+        return compiled
+
+    def tokenizer(self, options: AcronymOptions) -> Tokenizer:
+        """Return the single-pass tokenizer for the given options."""
+        return self.compile(options).tokenizer
 
     def clean_phrase(self, phrase: str) -> str:
         """Clean a phrase by removing special characters and normalizing whitespace."""
+        if self.profiler is not None:
+            with self.profiler.stage("clean"):
+                return self._clean_phrase(phrase)
+        return self._clean_phrase(phrase)
+
+    def _clean_phrase(self, phrase: str) -> str:
+        if self.normalizer is not None:
+            return " ".join(self.normalizer(phrase).split())
+
         # Remove special characters and punctuation, keep only letters,
         # numbers, and spaces
-        cleaned = re.sub(r"[^\w\s]", "", phrase)
+        cleaned = PUNCTUATION_PATTERN.sub("", phrase)
 
         # Normalize whitespace - replace multiple spaces with single space and strip
         cleaned = re.sub(r"\s+", " ", cleaned).strip()
@@ -78,104 +166,49 @@ class AcronymCreator:
 
     def extract_words(self, phrase: str, options: AcronymOptions) -> list:
         """Extract words from a phrase based on the given options."""
-        if not phrase.strip():
-            return []
-
-        # Clean the phrase first
-        cleaned_phrase = self.clean_phrase(phrase)
-        words = cleaned_phrase.split()
-
-        # Filter out articles and common words if requested
-        if not options.include_articles:
-            words = [word for word in words if word.lower() not in self.COMMON_WORDS]
-
-        # Filter by minimum word length if specified
-        words = [word for word in words if len(word) >= options.min_word_length]
-
-        return words
+        # Clean, split and filter in a single pass
+        return list(self.compile(options).tokenize(phrase))
 
     def create_syllable_acronym(self, phrase: str, options: AcronymOptions) -> str:
         """Create a syllable-based acronym by taking syllables from each word."""
-        if not phrase.strip():
-            return ""
-
-        words = self.extract_words(phrase, options)
-
-        # Limit number of words if max_words is specified
-        if options.max_words is not None:
-            words = words[: options.max_words]
-
-        syllables = []
-        for word in words:
-            # Syllable extraction: create 2-3 character syllables
-            if len(word) <= 2:
-                syllables.append(word)
-            elif len(word) <= 4:
-                # Short words: take first 2 characters
-                syllables.append(word[:2])
-            else:
-                # Longer words: take first 2-3 characters based on vowel patterns
-                vowels = "aeiouAEIOU"
-                if word[0] in vowels:
-                    # Word starts with vowel: take 3 chars
-                    syllables.append(word[:3])
-                elif len(word) >= 5 and word[1] in vowels:
-                    # Second char is vowel: take first 3 chars
-                    syllables.append(word[:3])
-                else:
-                    # Default: take first 2 chars
-                    syllables.append(word[:2])
-
-        acronym = "".join(syllables)
-
-        if options.force_uppercase:
-            acronym = acronym.upper()
-        else:
-            acronym = acronym.lower()
-
-        return acronym
+        compiled = self.compile(options)
+        join = syllables if self.syllabifier is None else self.syllabifier.join
+
+        def compute():
+            return compiled.change_case(join(compiled.words(phrase)))
+
+        if self.profiler is not None:
+            compute = self.profiler.timed("syllable", compute)
+        if self.cache is None:
+            return compute()
+        return self.cache.get_or_compute(
+            ("syllable", phrase, compiled.options, self._settings()), compute
+        )
+
+    def strategies(self) -> MultiStrategyEngine:
+        """Return an engine deriving every strategy from one tokenization."""
+        engine = MultiStrategyEngine(
+            self.COMMON_WORDS,
+            syllables if self.syllabifier is None else self.syllabifier.join,
+            self.normalizer,
+        )
+        if self.profiler is not None:
+            return self.profiler.instrument_strategies(engine)
+        return engine
 
     def generate_multiple_options(self, phrase: str) -> dict:
         """Generate multiple acronym options using different strategies."""
-        if not phrase.strip():
-            return {"basic": [], "with_articles": [], "creative": [], "syllable": []}
-
-        results = {}
-
-        # Basic acronym (excludes articles)
-        basic_options = AcronymOptions(include_articles=False)
-        basic_result = self.create_basic_acronym(phrase, basic_options)
-        results["basic"] = [basic_result] if basic_result else []
-
-        # With articles
-        with_articles_options = AcronymOptions(include_articles=True)
-        with_articles_result = self.create_basic_acronym(phrase, with_articles_options)
-        results["with_articles"] = (
-            [with_articles_result] if with_articles_result else []
+        if self.cache is None:
+            return self.strategies().generate(phrase)
+        results = self.cache.get_or_compute(
+            ("multiple", phrase, self._settings()),
+            lambda: self.strategies().generate(phrase),
         )
-
-        # Creative variations (different word limits, case options)
-        creative_results = []
-        if basic_result:
-            # Lowercase version
-            lowercase_options = AcronymOptions(
-                include_articles=False, force_uppercase=False
-            )
-            lowercase_result = self.create_basic_acronym(phrase, lowercase_options)
-            if lowercase_result.lower() != basic_result.lower():
-                creative_results.append(lowercase_result)
-
-            # Limited words version
-            limited_options = AcronymOptions(include_articles=False, max_words=3)
-            limited_result = self.create_basic_acronym(phrase, limited_options)
-            if limited_result and limited_result != basic_result:
-                creative_results.append(limited_result)
-
-        results["creative"] = creative_results
-
-        # Syllable-based
-        syllable_options = AcronymOptions(include_articles=False)
-        syllable_result = self.create_syllable_acronym(phrase, syllable_options)
-        results["syllable"] = [syllable_result] if syllable_result else []
-
-        return results
+        # Copy so callers cannot mutate the cached lists
+        return {name: list(values) for name, values in results.items()}
+
+    def generate_multiple_options_many(self, phrases: Iterable[str]) -> Iterator[dict]:
+        """Generate multiple acronym options for each phrase in a batch."""
+        if self.cache is not None:
+            return map(self.generate_multiple_options, phrases)
+        return self.strategies().generate_many(phrases)
@@ -0,0 +1,269 @@
+"""
+Creative acronym search over per-word letter choices.
+
+Each word of a phrase contributes its first one to ``max_letters`` letters,
+and stop words may also be skipped, so a phrase of n words has up to
+(max_letters + 1) ** n candidate acronyms. Rather than enumerating them,
+``CreativeSearch`` runs a beam search word by word: partial acronyms are
+ranked by how pronounceable they are and whether they can still grow into
+a dictionary word, and only the best ``beam_width`` survive each step. A
+time budget bounds the search; when it runs out the remaining words
+contribute their initials so every result is a complete acronym.
+
+Dictionary lookups use a ``WordIndex``, which stores each node of the word
+trie as its prefix string. A compiled index is cached on disk next to the
+persistent result cache, so large word lists are parsed once.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import (
+    AbstractSet,
+    Callable,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .core import AcronymCreator
+from .syllables import ONSETS
+from .tokenizer import clean_tokens
+
+# Bump when the on-disk index layout changes
+INDEX_FORMAT = 1
+
+# Longer dictionary words are never reached by acronyms of typical phrases
+MAX_WORD_LENGTH = 12
+
+DEFAULT_MAX_LETTERS = 3
+DEFAULT_BEAM_WIDTH = 64
+DEFAULT_TIME_BUDGET = 0.05
+DEFAULT_TOP = 10
+
+# Acronym length that scores best; each letter away from it costs a little
+IDEAL_LENGTH = 4
+
+DEFAULT_DICTIONARY = Path("/usr/share/dict/words")
+
+VOWELS = frozenset("aeiouy")
+
+
+def read_words(path: Union[str, Path]) -> List[str]:
+    """Read a word list with one word per line."""
+    with open(path, encoding="utf-8", errors="replace") as file:
+        return file.read().split()
+
+
+class WordIndex:
+    """Dictionary words with every prefix indexed for the search.
+
+    ``prefixes`` holds the nodes of the word trie, one string per node, so
+    extending a partial acronym is a single set lookup. Words are lowercased
+    and only alphabetic words of 2 to ``max_length`` letters are kept.
+    """
+
+    def __init__(self, words: Iterable[str], max_length: int = MAX_WORD_LENGTH):
+        kept = set()
+        for word in words:
+            word = word.lower()
+            if 2 <= len(word) <= max_length and word.isalpha():
+                kept.add(word)
+        self.words = frozenset(kept)
+        self.prefixes = frozenset(
+            word[:end] for word in kept for end in range(1, len(word) + 1)
+        )
+
+    @classmethod
+    def from_file(
+        cls,
+        path: Union[str, Path],
+        cache: bool = True,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ) -> "WordIndex":
+        """Load a word list, reusing its compiled index from the disk cache.
+
+        Compiled indexes are keyed by the list's path, size and modification
+        time, so editing the list rebuilds it. ``cache_dir`` defaults to the
+        persistent cache directory; an unwritable cache is ignored.
+        """
+        path = Path(path).resolve()
+        if not cache:
+            return cls(read_words(path))
+        import hashlib
+        import marshal
+        import sys
+
+        if cache_dir is None:
+            from .persistent import default_cache_dir
+
+            cache_dir = default_cache_dir()
+        stat = path.stat()
+        key = f"{path}:{stat.st_size}:{stat.st_mtime_ns}:{INDEX_FORMAT}"
+        key += f":{MAX_WORD_LENGTH}:{sys.version_info[:2]}"
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        cached = Path(cache_dir) / f"words-{digest}.marshal"
+        try:
+            with open(cached, "rb") as file:
+                words, prefixes = marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+        else:
+            index = cls.__new__(cls)
+            index.words = words
+            index.prefixes = prefixes
+            return index
+
+        index = cls(read_words(path))
+        partial = cached.with_name(f".{cached.name}.{os.getpid()}.partial")
+        try:
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            with open(partial, "wb") as file:
+                marshal.dump((index.words, index.prefixes), file)
+            os.replace(partial, cached)
+        except OSError:
+            if partial.exists():
+                partial.unlink()
+        return index
+
+    def __contains__(self, word: object) -> bool:
+        return word in self.words
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+
+def pronounceability(text: str) -> float:
+    """Score from 0 to 1 how easily ``text`` reads as a word.
+
+    Letters in runs of three or more vowels or consonants count against
+    it, as does a leading consonant pair that cannot start a syllable
+    ("pd"); text without vowels scores 0.
+    """
+    vowels = 0
+    penalty = 0
+    if len(text) > 1 and text[0] not in VOWELS and text[1] not in VOWELS:
+        penalty += text[:2] not in ONSETS
+    run = 0
+    previous = None
+    for char in text:
+        vowel = char in VOWELS
+        vowels += vowel
+        run = run + 1 if vowel == previous else 1
+        previous = vowel
+        if run > 2:
+            penalty += 1
+    if not vowels:
+        return 0.0
+    return 1.0 - penalty / len(text)
+
+
+class Candidate(NamedTuple):
+    """A creative acronym with the letters taken from each word."""
+
+    acronym: str
+    score: float
+    parts: Tuple[str, ...]
+    is_word: bool
+
+
+class CreativeSearch:
+    """Beam search for pronounceable or dictionary-word acronyms.
+
+    ``index`` is an optional ``WordIndex``; without one candidates are
+    ranked on pronounceability alone. ``time_budget`` is in seconds.
+    """
+
+    def __init__(
+        self,
+        index: Optional[WordIndex] = None,
+        stop_words: AbstractSet[str] = AcronymCreator.COMMON_WORDS,
+        max_letters: int = DEFAULT_MAX_LETTERS,
+        beam_width: int = DEFAULT_BEAM_WIDTH,
+        time_budget: float = DEFAULT_TIME_BUDGET,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        if max_letters < 1:
+            raise ValueError("max_letters must be at least 1")
+        if beam_width < 1:
+            raise ValueError("beam_width must be at least 1")
+        self.index = index
+        # StopWords dictionaries keep their single words in a frozenset
+        self.stop_words = getattr(stop_words, "words", stop_words)
+        self.max_letters = max_letters
+        self.beam_width = beam_width
+        self.time_budget = time_budget
+        self.clock = clock
+
+    def choices(self, word: str) -> List[str]:
+        """Return the letter groups ``word`` may contribute, "" to skip it."""
+        choices = [
+            word[:size] for size in range(1, min(self.max_letters, len(word)) + 1)
+        ]
+        if word.lower() in self.stop_words:
+            choices.insert(0, "")
+        return choices
+
+    def _rank(self, text: str, parts: Tuple[str, ...]) -> float:
+        """Score a partial acronym for the beam."""
+        score = 2 * pronounceability(text) - 0.25 * _extra_letters(parts)
+        if self.index is not None and text in self.index.prefixes:
+            score += 1
+        return score
+
+    def score(self, text: str, parts: Tuple[str, ...]) -> Candidate:
+        """Score a complete acronym built from ``parts``."""
+        is_word = self.index is not None and text in self.index.words
+        score = (
+            2 * pronounceability(text)
+            + (3 if is_word else 0)
+            - 0.25 * _extra_letters(parts)
+            - 0.2 * abs(len(text) - IDEAL_LENGTH)
+        )
+        return Candidate(text.upper(), round(score, 3), parts, is_word)
+
+    def search(self, phrase: str, top: int = DEFAULT_TOP) -> List[Candidate]:
+        """Return up to ``top`` acronyms of two or more letters, best first."""
+        words = clean_tokens(phrase)
+        deadline = self.clock() + self.time_budget
+        beam = [("", ())]
+        for position, word in enumerate(words):
+            if self.clock() > deadline:
+                beam = [
+                    self._complete(text, parts, words[position:])
+                    for text, parts in beam
+                ]
+                break
+            expanded = {}
+            for text, parts in beam:
+                for choice in self.choices(word):
+                    extended = text + choice.lower()
+                    # The beam is best first, so the first route is kept
+                    if extended not in expanded:
+                        expanded[extended] = parts + (choice,)
+            beam = sorted(
+                expanded.items(),
+                key=lambda item: self._rank(*item),
+                reverse=True,
+            )[: self.beam_width]
+
+        candidates = [self.score(text, parts) for text, parts in beam if len(text) > 1]
+        candidates.sort(key=lambda candidate: (-candidate.score, candidate.acronym))
+        return candidates[:top]
+
+    def _complete(
+        self, text: str, parts: Tuple[str, ...], words: List[str]
+    ) -> Tuple[str, Tuple[str, ...]]:
+        """Finish a partial acronym with initials, skipping stop words."""
+        rest = tuple(
+            "" if word.lower() in self.stop_words else word[0] for word in words
+        )
+        return text + "".join(rest).lower(), parts + rest
+
+
+def _extra_letters(parts: Tuple[str, ...]) -> int:
+    """Count letters taken beyond one initial per word."""
+    return sum(len(part) - 1 for part in parts if part)
@@ -0,0 +1,390 @@
+"""
+Incremental acronym recomputation for phrase files that change a little at
+a time.
+
+``IncrementalFile`` keeps a state file with the previous text of a phrase
+file and the acronym of every line, both split into blocks of whole lines.
+On each update every stored block is checked against the new text at the
+current position with a single string comparison, so unchanged blocks cost
+one memory compare and no per-line work. When a block differs, the next
+stored blocks are searched for nearby to find where the edited region
+ends. Only that region is split into lines and diffed, reusing acronyms
+for lines whose text is unchanged, so ``AcronymCreator`` only sees new or
+edited lines. The work beyond reading the file therefore grows with the
+size of the edit, not the size of the file.
+
+The state also records the file's size and modification time, so checking
+an unchanged file reads nothing but its metadata.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from . import __version__
+from .core import AcronymCreator, AcronymOptions
+from .parallel import ParallelAcronymEngine
+
+# Bump when the state file layout changes
+STATE_FORMAT = 1
+
+# Seconds between checks of a watched file
+DEFAULT_INTERVAL = 1.0
+
+# Lines per stored block
+BLOCK_LINES = 256
+
+# Stored blocks tried, after an edited one, to find where an edit ends
+RESYNC_BLOCKS = 8
+
+WATCH_DIRNAME = "watch"
+
+Signature = Tuple[int, int]
+
+
+def default_state_path(path: Union[str, Path]) -> Path:
+    """Return the state file for ``path`` under the XDG cache directory."""
+    from .persistent import default_cache_dir
+
+    resolved = str(Path(path).resolve())
+    digest = hashlib.sha256(resolved.encode("utf-8")).hexdigest()[:16]
+    return default_cache_dir() / WATCH_DIRNAME / f"{digest}.marshal"
+
+
+def read_text(path: Union[str, Path]) -> str:
+    """Read a phrase file, ending its last line with a newline.
+
+    Line endings are translated as ``iter_phrases`` sees them.
+    """
+    with open(path, encoding="utf-8") as file:
+        text = file.read()
+    if text and not text.endswith("\n"):
+        text += "\n"
+    return text
+
+
+class LineChange(NamedTuple):
+    """One acronym change between two versions of a phrase file.
+
+    ``change`` is "added", "removed" or "changed". ``line`` is the 1-based
+    line number in the new file, or in the old one for removed lines.
+    """
+
+    change: str
+    line: int
+    acronym: str
+    phrase: str
+    old_acronym: Optional[str] = None
+
+
+class IncrementalFile:
+    """Acronyms for every line of a phrase file, updated incrementally.
+
+    ``state_path`` defaults to a file named after ``path`` under the cache
+    directory. Within an edited region a line counts as added if its text
+    was not in the old region and as removed if its text is not in the new
+    one, so lines moved within a region are not reported. A removed and an
+    added line in the same place are reported together as one changed line.
+    Lines without an acronym are not reported.
+
+    A state written with other options, strategy, stop words or tool
+    version is still diffed against, but none of its acronyms are reused,
+    so the update reports every acronym the new settings change.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        state_path: Optional[Union[str, Path]] = None,
+        creator: Optional[AcronymCreator] = None,
+        options: Optional[AcronymOptions] = None,
+        strategy: str = "basic",
+        block_lines: int = BLOCK_LINES,
+    ):
+        if block_lines < 1:
+            raise ValueError("block_lines must be at least 1")
+        self.path = Path(path)
+        self.state_path = (
+            Path(state_path) if state_path is not None else default_state_path(path)
+        )
+        self.creator = creator or AcronymCreator()
+        self.options = options or AcronymOptions()
+        self.engine = ParallelAcronymEngine(
+            workers=1, creator=self.creator, strategy=strategy
+        )
+        self.block_lines = block_lines
+        self.settings = self._settings_key()
+        self.signature: Optional[Signature] = None
+        # Parallel lists: block text, its acronyms one per line, line count
+        self._texts: List[str] = []
+        self._acronyms: List[str] = []
+        self._counts: List[int] = []
+        # Lines passed to the creator by the last update
+        self.recomputed = 0
+        self._reusable = True
+        self._load()
+
+    def _settings_key(self) -> str:
+        key = f"{__version__}:{self.engine.strategy}:{self.options.freeze()}"
+        # The default stop words are a mutable set, so they are keyed too
+        key += ":" + "\n".join(sorted(self.creator.COMMON_WORDS))
+        syllabifier = self.creator.syllabifier
+        if syllabifier is not None:
+            key += f":{syllabifier.key}"
+        normalizer = self.creator.normalizer
+        if normalizer is not None:
+            key += f":{normalizer!r}"
+        return key
+
+    def _load(self) -> None:
+        import marshal
+
+        try:
+            with open(self.state_path, "rb") as file:
+                state = marshal.load(file)
+            version, settings, signature, texts, acronyms, counts = state
+        except (OSError, EOFError, ValueError, TypeError):
+            return
+        if version != STATE_FORMAT or not len(texts) == len(acronyms) == len(counts):
+            return
+        self.signature = tuple(signature) if signature else None
+        self._texts = texts
+        self._acronyms = acronyms
+        self._counts = counts
+        self._reusable = settings == self.settings
+
+    def save(self) -> None:
+        """Write the state, replacing the old one only once complete."""
+        import marshal
+
+        state = (
+            STATE_FORMAT,
+            self.settings,
+            self.signature,
+            self._texts,
+            self._acronyms,
+            self._counts,
+        )
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.state_path.with_name(
+            f".{self.state_path.name}.{os.getpid()}.partial"
+        )
+        try:
+            with open(partial, "wb") as file:
+                marshal.dump(state, file)
+            os.replace(partial, self.state_path)
+        finally:
+            if partial.exists():
+                partial.unlink()
+
+    @property
+    def acronyms(self) -> List[str]:
+        """The acronym of every line, in file order."""
+        return "".join(self._acronyms).split("\n")[:-1]
+
+    def __len__(self) -> int:
+        return sum(self._counts)
+
+    def file_signature(self) -> Signature:
+        """Return the size and modification time of the phrase file."""
+        stat = os.stat(self.path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def update(self) -> List[LineChange]:
+        """Bring the state up to date with the file and save it.
+
+        Returns the acronym changes; nothing is read if the file is
+        unchanged.
+        """
+        signature = self.file_signature()
+        if signature == self.signature and self._reusable:
+            self.recomputed = 0
+            return []
+        changes = self.apply(read_text(self.path))
+        self.signature = signature
+        self.save()
+        return changes
+
+    def apply(self, text: str) -> List[LineChange]:
+        """Replace the stored text with ``text`` and return the changes.
+
+        ``text`` holds whole lines, each ending with a newline. Only the
+        in-memory state changes; ``update`` also saves it.
+        """
+        old_texts = self._texts
+        old_acronyms = self._acronyms
+        old_counts = self._counts
+        self._texts = []
+        self._acronyms = []
+        self._counts = []
+        self.recomputed = 0
+        if not self._reusable:
+            # Nothing can be reused, so the whole file is one region
+            changes = self._diff_region(
+                old_texts, old_acronyms, text, 0, 0, reuse=False
+            )
+            self._reusable = True
+            return changes
+
+        changes: List[LineChange] = []
+        position = 0
+        block = 0
+        old_line = 0
+        while block < len(old_texts):
+            if text.startswith(old_texts[block], position):
+                self._texts.append(old_texts[block])
+                self._acronyms.append(old_acronyms[block])
+                self._counts.append(old_counts[block])
+                position += len(old_texts[block])
+                old_line += old_counts[block]
+                block += 1
+                continue
+            end, end_position = self._resync(old_texts, block, text, position)
+            changes += self._diff_region(
+                old_texts[block:end],
+                old_acronyms[block:end],
+                text[position:end_position],
+                old_line,
+                len(self),
+            )
+            old_line += sum(old_counts[block:end])
+            block = end
+            position = end_position
+        if position < len(text):
+            changes += self._diff_region([], [], text[position:], old_line, len(self))
+        if len(self._texts) > 2 * len(self) // self.block_lines + 8:
+            self._reblock()
+        return changes
+
+    def _resync(
+        self, old_texts: List[str], block: int, text: str, position: int
+    ) -> Tuple[int, int]:
+        """Find where the edited region starting at ``block`` ends.
+
+        Returns the first stored block after it and that block's position
+        in the new text. Each block is only searched for near where it
+        would be if the region kept its size, so the search stays local.
+        """
+        span = 0
+        for end in range(block + 1, min(block + 1 + RESYNC_BLOCKS, len(old_texts))):
+            span += len(old_texts[end - 1])
+            limit = position + 2 * span + len(old_texts[end])
+            found = text.find(old_texts[end], position, limit)
+            # Blocks hold whole lines, so a match must start a line
+            while found > 0 and text[found - 1] != "\n":
+                found = text.find(old_texts[end], found + 1, limit)
+            if found >= 0:
+                return end, found
+        return len(old_texts), len(text)
+
+    def _diff_region(
+        self,
+        old_texts: List[str],
+        old_acronyms: List[str],
+        text: str,
+        old_start: int,
+        new_start: int,
+        reuse: bool = True,
+    ) -> List[LineChange]:
+        """Diff one edited region line by line and store its new blocks.
+
+        ``old_start`` and ``new_start`` are the line numbers, counted from
+        0, where the region starts in the old and new files.
+        """
+        old_lines = "".join(old_texts).split("\n")[:-1]
+        old_results = "".join(old_acronyms).split("\n")[:-1]
+        lines = text.split("\n")[:-1]
+        previous: Dict[str, str] = dict(zip(old_lines, old_results))
+        acronyms = [previous.get(line) if reuse else None for line in lines]
+        pending = [j for j, acronym in enumerate(acronyms) if acronym is None]
+        self.recomputed += len(pending)
+        if pending:
+            phrases = [lines[j] for j in pending]
+            for start, _, results in self.engine.chunks(phrases, self.options):
+                for offset, acronym in enumerate(results, start):
+                    acronyms[pending[offset]] = acronym
+
+        new_set = set(lines)
+        added = [j for j, line in enumerate(lines) if line not in previous]
+        removed = [i for i, line in enumerate(old_lines) if line not in new_set]
+        changes = _pair_changes(
+            (old_lines, old_results, removed, old_start),
+            (lines, acronyms, added, new_start),
+        )
+        if not reuse:
+            # Kept lines whose acronym the new settings change
+            for j, line in enumerate(lines):
+                old_acronym = previous.get(line)
+                if old_acronym is not None and old_acronym != acronyms[j]:
+                    change = LineChange(
+                        "changed", new_start + j + 1, acronyms[j], line, old_acronym
+                    )
+                    changes.append(((j, 1), change))
+            changes.sort(key=lambda item: item[0])
+
+        self._append_lines(lines, acronyms)
+        return [change for _, change in changes]
+
+    def _append_lines(self, lines: List[str], acronyms: List[str]) -> None:
+        """Store lines and their acronyms as new full blocks."""
+        size = self.block_lines
+        for start in range(0, len(lines), size):
+            chunk = lines[start : start + size]
+            self._texts.append("\n".join(chunk) + "\n")
+            self._acronyms.append("\n".join(acronyms[start : start + size]) + "\n")
+            self._counts.append(len(chunk))
+
+    def _reblock(self) -> None:
+        """Regroup lines into full blocks after many small edits."""
+        lines = "".join(self._texts).split("\n")[:-1]
+        acronyms = self.acronyms
+        self._texts = []
+        self._acronyms = []
+        self._counts = []
+        self._append_lines(lines, acronyms)
+
+
+_Side = Tuple[List[str], List[str], List[int], int]
+
+
+def _pair_changes(old: _Side, new: _Side) -> List[Tuple[Tuple[int, int], LineChange]]:
+    """Report removed and added lines, pairing those in the same place.
+
+    Each side is ``(lines, acronyms, indexes of removed or added lines,
+    first line number)``. A line's place is the number of kept lines before
+    it, which is the same in both versions when no kept line moved. Each
+    change comes with a key that orders it by position in the new region.
+    """
+    old_lines, old_acronyms, removed, old_start = old
+    lines, acronyms, added, new_start = new
+    changes = []
+    r = a = 0
+    while r < len(removed) or a < len(added):
+        old_place = removed[r] - r if r < len(removed) else None
+        new_place = added[a] - a if a < len(added) else None
+        if old_place is not None and old_place == new_place:
+            i = removed[r]
+            j = added[a]
+            if old_acronyms[i] != acronyms[j]:
+                change = LineChange(
+                    "changed", new_start + j + 1, acronyms[j], lines[j], old_acronyms[i]
+                )
+                changes.append(((j, 1), change))
+            r += 1
+            a += 1
+        elif new_place is None or (old_place is not None and old_place < new_place):
+            i = removed[r]
+            if old_acronyms[i]:
+                change = LineChange(
+                    "removed", old_start + i + 1, old_acronyms[i], old_lines[i]
+                )
+                changes.append(((old_place + a, 0), change))
+            r += 1
+        else:
+            j = added[a]
+            if acronyms[j]:
+                change = LineChange("added", new_start + j + 1, acronyms[j], lines[j])
+                changes.append(((j, 1), change))
+            a += 1
+    return changes
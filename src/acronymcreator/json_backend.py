@@ -0,0 +1,69 @@
+"""
+JSON serializer backends for compact, machine-oriented output.
+
+Every backend produces the same bytes: UTF-8, no insignificant whitespace,
+keys in insertion order and non-ASCII characters left unescaped. orjson
+and msgspec are used when installed; the standard library is the fallback.
+"""
+
+from functools import lru_cache
+from typing import Callable, NamedTuple
+
+# Preference order for "auto"
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+class JsonBackend(NamedTuple):
+    """A named compact JSON encoder returning UTF-8 bytes."""
+
+    name: str
+    dumps: Callable[[object], bytes]
+
+
+def _orjson() -> JsonBackend:
+    import orjson
+
+    return JsonBackend("orjson", orjson.dumps)
+
+
+def _msgspec() -> JsonBackend:
+    import msgspec
+
+    return JsonBackend("msgspec", msgspec.json.Encoder().encode)
+
+
+def _stdlib() -> JsonBackend:
+    import json
+
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+    def dumps(obj: object) -> bytes:
+        return encode(obj).encode("utf-8")
+
+    return JsonBackend("json", dumps)
+
+
+_LOADERS = {"orjson": _orjson, "msgspec": _msgspec, "json": _stdlib}
+
+
+@lru_cache(maxsize=None)
+def get_backend(name: str = "auto") -> JsonBackend:
+    """Return the named backend, or the fastest installed one for "auto".
+
+    Raises ValueError for unknown names and ImportError when a specific
+    backend is requested but not installed.
+    """
+    if name == "auto":
+        for candidate in BACKENDS[:-1]:
+            try:
+                return _LOADERS[candidate]()
+            except ImportError:
+                continue
+        return _stdlib()
+    try:
+        loader = _LOADERS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown JSON backend {name!r}; choose from auto, {', '.join(BACKENDS)}"
+        ) from None
+    return loader()
@@ -0,0 +1,82 @@
+"""
+Memory-mapped reader for newline-delimited phrase files.
+
+The file is mapped read-only and split into byte ranges that end on line
+boundaries. Each range is decoded with one ``bytes.decode`` and one
+``str.split`` instead of per-line text I/O, and worker processes can be
+handed ``(path, start, end)`` to map and decode their own range, so phrases
+never have to be pickled across process boundaries.
+
+Lines are split on "\\n" with a trailing "\\r" removed, matching text-mode
+reading of "\\n" and "\\r\\n" files; a lone "\\r" is not a line break here.
+"""
+
+import mmap
+import os
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+
+# Bytes per range handed to a worker; ranges are extended to a line end
+DEFAULT_RANGE_BYTES = 4 * 1024 * 1024
+
+
+class MappedPhraseFile:
+    """Read-only memory map of a phrase file, one phrase per line.
+
+    Use as a context manager, or call ``close`` when done.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self.size = os.fstat(self._file.fileno()).st_size
+        # Empty files cannot be mapped
+        self._map = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self.size
+            else b""
+        )
+
+    def ranges(
+        self, range_bytes: int = DEFAULT_RANGE_BYTES
+    ) -> Iterator[Tuple[int, int]]:
+        """Yield ``(start, end)`` byte ranges covering whole lines.
+
+        Each range spans at least ``range_bytes`` bytes, extended to the end
+        of the line it stops in, except for the last one.
+        """
+        if range_bytes < 1:
+            raise ValueError("range_bytes must be at least 1")
+        start = 0
+        while start < self.size:
+            end = start + range_bytes
+            if end < self.size:
+                newline = self._map.find(b"\n", end - 1)
+                end = self.size if newline == -1 else newline + 1
+            else:
+                end = self.size
+            yield start, end
+            start = end
+
+    def phrases(self, start: int = 0, end: Optional[int] = None) -> List[str]:
+        """Decode the lines in ``[start, end)``, which must be a whole range."""
+        text = self._map[start : self.size if end is None else end].decode("utf-8")
+        lines = text.split("\n")
+        if lines[-1] == "":
+            # A final newline ends the last line rather than starting one
+            lines.pop()
+        if "\r" in text:
+            lines = [line[:-1] if line.endswith("\r") else line for line in lines]
+        return lines
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        if self.size:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "MappedPhraseFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
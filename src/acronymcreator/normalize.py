@@ -0,0 +1,186 @@
+"""
+Unicode normalization applied to phrases before tokenization.
+
+The default tokenizer strips punctuation with ``[^\\w\\s]``, which keeps
+full-width letters and ligatures as they are, deletes combining marks but
+not precomposed accents, and removes hyphens and apostrophes so that
+"state-of-the-art" becomes a single word. A ``Normalizer`` replaces that
+step with explicit policies: a Unicode normalization form, optional accent
+stripping, and what hyphens, apostrophes and Han ideographs do to word
+boundaries.
+
+Every policy is resolved per code point into a ``str.translate`` table
+shared by all normalizers with the same policies. Latin-1 is resolved when
+the table is built and any other character the first time it is seen, so
+normalizing a phrase is at most two ``unicodedata.normalize`` calls and one
+``str.translate`` call, all in C. ASCII phrases skip Unicode normalization.
+"""
+
+import unicodedata
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+FORMS = ("NFKC", "NFC", "NFKD", "NFD", "none")
+HYPHEN_POLICIES = ("split", "join")
+APOSTROPHE_POLICIES = ("join", "split")
+CJK_POLICIES = ("word", "split")
+
+# Apostrophes and the quote-like marks commonly typed in their place
+APOSTROPHES = frozenset("'`´ʻʼ‘’‛′＇")
+
+# Combining diacritical mark blocks removed by accent stripping. Marks of
+# other blocks, such as Indic vowel signs or kana voicing marks, are part
+# of the letter and kept.
+DIACRITIC_RANGES = (
+    (0x0300, 0x036F),
+    (0x1AB0, 0x1AFF),
+    (0x1DC0, 0x1DFF),
+    (0x20D0, 0x20FF),
+    (0xFE20, 0xFE2F),
+)
+
+HAN_RANGES = (
+    (0x3400, 0x4DBF),
+    (0x4E00, 0x9FFF),
+    (0xF900, 0xFAFF),
+    (0x20000, 0x323AF),
+)
+
+# Invisible characters that separate words in scripts written without spaces
+WORD_SEPARATORS = frozenset("\u200b")
+
+# Code points resolved when a table is built
+PRECOMPUTED = 0x100
+
+Translation = Union[None, int, str]
+
+
+def _in_ranges(code: int, ranges: Tuple[Tuple[int, int], ...]) -> bool:
+    return any(low <= code <= high for low, high in ranges)
+
+
+def _translate_char(
+    code: int, strip_accents: bool, hyphens: str, apostrophes: str, cjk: str
+) -> Translation:
+    """Return the ``str.translate`` value for one code point."""
+    char = chr(code)
+    if char.isspace() or char in WORD_SEPARATORS:
+        return " "
+    if char in APOSTROPHES:
+        return " " if apostrophes == "split" else None
+    category = unicodedata.category(char)
+    if category in ("Pd", "Pc"):
+        return " " if hyphens == "split" else None
+    if strip_accents and category == "Mn" and _in_ranges(code, DIACRITIC_RANGES):
+        return None
+    if cjk == "split" and _in_ranges(code, HAN_RANGES):
+        return f" {char} "
+    if category[0] in "PS":
+        # Full-width punctuation such as "、" and "。" is written without
+        # surrounding spaces, so it separates words rather than joining them
+        if unicodedata.east_asian_width(char) in ("W", "F"):
+            return " "
+        return None
+    if category in ("Cc", "Cf"):
+        return None
+    return code
+
+
+class _CharTable(dict):
+    """Translation table that resolves each code point once, on first use."""
+
+    __slots__ = ("policies",)
+
+    def __init__(self, *policies):
+        super().__init__()
+        self.policies = policies
+        for code in range(PRECOMPUTED):
+            self[code] = _translate_char(code, *policies)
+
+    def __missing__(self, code: int) -> Translation:
+        value = self[code] = _translate_char(code, *self.policies)
+        return value
+
+
+@lru_cache(maxsize=None)
+def _table(strip_accents: bool, hyphens: str, apostrophes: str, cjk: str) -> dict:
+    return _CharTable(strip_accents, hyphens, apostrophes, cjk)
+
+
+def _check(name: str, value: str, choices: Tuple[str, ...]) -> None:
+    if value not in choices:
+        raise ValueError(f"Unknown {name} {value!r}; choose from {', '.join(choices)}")
+
+
+class Normalizer:
+    """Normalize phrases into space-separated words before tokenizing.
+
+    ``form`` is the Unicode normalization form; the default NFKC folds
+    full-width letters, ligatures and other compatibility characters to
+    their plain equivalents. ``strip_accents`` removes combining diacritics,
+    so "Ångström" becomes "Angstrom". ``hyphens`` and ``apostrophes`` choose
+    whether dashes, underscores and apostrophes ``split`` words or ``join``
+    them: the defaults turn "state-of-the-art" into four words and "don't"
+    into one. ``cjk="split"`` makes every Han ideograph its own one-letter
+    word, so it is usually combined with a minimum word length of 1.
+
+    Other punctuation and symbols are removed, as with the default
+    tokenizer. Instances are callable, hashable and cheap to create.
+    """
+
+    __slots__ = ("key", "_table", "_before", "_after")
+
+    def __init__(
+        self,
+        form: str = "NFKC",
+        strip_accents: bool = False,
+        hyphens: str = "split",
+        apostrophes: str = "join",
+        cjk: str = "word",
+    ):
+        _check("normalization form", form, FORMS)
+        _check("hyphen policy", hyphens, HYPHEN_POLICIES)
+        _check("apostrophe policy", apostrophes, APOSTROPHE_POLICIES)
+        _check("CJK policy", cjk, CJK_POLICIES)
+        self.key = (form, bool(strip_accents), hyphens, apostrophes, cjk)
+        self._table = _table(bool(strip_accents), hyphens, apostrophes, cjk)
+        self._before: Optional[str] = None if form == "none" else form
+        self._after: Optional[str] = None
+        if strip_accents and form in ("NFKC", "NFC", "none"):
+            # Diacritics can only be removed from decomposed text; recompose
+            # whatever is left afterwards
+            self._before = "NFKD" if form == "NFKC" else "NFD"
+            self._after = "NFC"
+
+    def __call__(self, phrase: str) -> str:
+        """Return ``phrase`` normalized, with punctuation resolved."""
+        if phrase.isascii():
+            return phrase.translate(self._table)
+        if self._before is not None:
+            phrase = unicodedata.normalize(self._before, phrase)
+        phrase = phrase.translate(self._table)
+        if self._after is not None:
+            phrase = unicodedata.normalize(self._after, phrase)
+        return phrase
+
+    def normalize_many(self, phrases: Iterable[str]) -> Iterator[str]:
+        """Normalize each phrase of a batch."""
+        return map(self, phrases)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Normalizer):
+            return NotImplemented
+        return self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __repr__(self) -> str:
+        form, strip_accents, hyphens, apostrophes, cjk = self.key
+        return (
+            f"Normalizer(form={form!r}, strip_accents={strip_accents}, "
+            f"hyphens={hyphens!r}, apostrophes={apostrophes!r}, cjk={cjk!r})"
+        )
+
+    def __reduce__(self):
+        return (Normalizer, self.key)
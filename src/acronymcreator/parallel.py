@@ -0,0 +1,224 @@
+"""
+Multiprocess batch engine for AcronymCreator.
+"""
+
+import itertools
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .batch import DEFAULT_CHUNK_SIZE
+from .columnar import COLUMN_STRATEGIES
+from .core import AcronymCreator, AcronymOptions
+from .mapped import DEFAULT_RANGE_BYTES, MappedPhraseFile
+
+Chunk = Tuple[int, List[str], List[str]]
+
+
+def _process_chunk(
+    creator: AcronymCreator,
+    phrases: List[str],
+    options: AcronymOptions,
+    strategy: str = "basic",
+) -> List[str]:
+    """Worker entry point: create acronyms for one chunk of phrases."""
+    if strategy == "basic":
+        return list(creator.create_basic_acronym_many(phrases, options))
+    return [creator.create_syllable_acronym(phrase, options) for phrase in phrases]
+
+
+def _process_range(
+    creator: AcronymCreator,
+    path: str,
+    start: int,
+    end: int,
+    options: AcronymOptions,
+    strategy: str = "basic",
+) -> List[str]:
+    """Worker entry point: map a file and process the lines in one byte range."""
+    with MappedPhraseFile(path) as mapped:
+        phrases = mapped.phrases(start, end)
+    return _process_chunk(creator, phrases, options, strategy)
+
+
+def _chunked(phrases: Iterable[str], size: int) -> Iterator[Tuple[int, List[str]]]:
+    """Split phrases into (start index, chunk) pairs without reading ahead."""
+    iterator = iter(phrases)
+    start = 0
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def _numbered(chunks: Iterable[List[str]]) -> Iterator[Tuple[int, List[str]]]:
+    """Pair each chunk with the index of its first phrase."""
+    start = 0
+    for chunk in chunks:
+        yield start, chunk
+        start += len(chunk)
+
+
+class ParallelAcronymEngine:
+    """Create acronyms for large phrase corpora on a pool of worker processes.
+
+    Input is consumed lazily in chunks of ``chunk_size`` phrases and at most
+    ``max_pending`` chunks are in flight at once, so memory use is bounded
+    regardless of corpus size. With a single worker everything runs in the
+    current process. ``strategy`` is "basic" or "syllable".
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_pending: Optional[int] = None,
+        creator: Optional[AcronymCreator] = None,
+        strategy: str = "basic",
+    ):
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if strategy not in COLUMN_STRATEGIES:
+            raise ValueError(
+                f"Unknown strategy {strategy!r}; "
+                f"choose from {', '.join(COLUMN_STRATEGIES)}"
+            )
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending or self.workers * 2
+        self.creator = creator or AcronymCreator()
+        self.strategy = strategy
+
+    def chunks(
+        self, phrases: Iterable[str], options: AcronymOptions, ordered: bool = True
+    ) -> Iterator[Chunk]:
+        """Yield (start index, phrases, acronyms) for each processed chunk.
+
+        Chunks come back in input order unless ``ordered`` is False, in which
+        case each chunk is yielded as soon as its worker finishes.
+        """
+        return self._process(_chunked(phrases, self.chunk_size), options, ordered)
+
+    def process_chunks(
+        self,
+        chunks: Iterable[List[str]],
+        options: AcronymOptions,
+        ordered: bool = True,
+    ) -> Iterator[Chunk]:
+        """Like ``chunks``, for input that is already split into chunks.
+
+        Callers that carry other data alongside each chunk, such as the
+        rows of a table, can keep their own chunk boundaries this way.
+        """
+        return self._process(_numbered(chunks), options, ordered)
+
+    def file_chunks(
+        self,
+        path: str,
+        options: AcronymOptions,
+        ordered: bool = True,
+        range_bytes: int = DEFAULT_RANGE_BYTES,
+    ) -> Iterator[Chunk]:
+        """Yield (start byte, phrases, acronyms) for a memory-mapped file.
+
+        The file is split into newline-aligned ranges of about
+        ``range_bytes``. Workers receive only the path and byte offsets and
+        map the file themselves; the phrases of each finished range are
+        decoded again in this process only when it is yielded.
+        """
+        with MappedPhraseFile(path) as mapped:
+            ranges = mapped.ranges(range_bytes)
+            if self.workers == 1:
+                chunks = ((start, mapped.phrases(start, end)) for start, end in ranges)
+                yield from self._process(chunks, options, ordered)
+                return
+
+            path = str(mapped.path)
+            tasks = (
+                (
+                    start,
+                    end,
+                    _process_range,
+                    (self.creator, path, start, end, options, self.strategy),
+                )
+                for start, end in ranges
+            )
+            for start, end, acronyms in self._execute(tasks, ordered):
+                yield start, mapped.phrases(start, end), acronyms
+
+    def map_file(self, path: str, options: AcronymOptions) -> Iterator[str]:
+        """Yield an acronym for every line of a file, in order."""
+        for _, _, acronyms in self.file_chunks(path, options):
+            yield from acronyms
+
+    def _process(
+        self,
+        chunks: Iterator[Tuple[int, List[str]]],
+        options: AcronymOptions,
+        ordered: bool,
+    ) -> Iterator[Chunk]:
+        tasks = (
+            (
+                start,
+                chunk,
+                _process_chunk,
+                (self.creator, chunk, options, self.strategy),
+            )
+            for start, chunk in chunks
+        )
+        return self._execute(tasks, ordered)
+
+    def _execute(self, tasks: Iterator[tuple], ordered: bool) -> Iterator[tuple]:
+        """Run ``(start, payload, function, args)`` tasks, serially or pooled.
+
+        Yields ``(start, payload, function(*args))`` for each task.
+        """
+        if self.workers == 1:
+            for start, payload, function, args in tasks:
+                yield start, payload, function(*args)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            pending = deque()
+            try:
+                for start, payload, function, args in tasks:
+                    pending.append((start, payload, pool.submit(function, *args)))
+                    if len(pending) >= self.max_pending:
+                        yield from self._drain(pending, ordered)
+                while pending:
+                    yield from self._drain(pending, ordered)
+            finally:
+                for _, _, future in pending:
+                    future.cancel()
+
+    def _drain(self, pending: deque, ordered: bool) -> Iterator[Chunk]:
+        """Yield at least one finished chunk, removing it from ``pending``."""
+        if ordered:
+            start, chunk, future = pending.popleft()
+            yield start, chunk, future.result()
+            return
+
+        done, _ = wait(
+            [future for _, _, future in pending], return_when=FIRST_COMPLETED
+        )
+        for entry in [entry for entry in pending if entry[2] in done]:
+            pending.remove(entry)
+            start, chunk, future = entry
+            yield start, chunk, future.result()
+
+    def map(self, phrases: Iterable[str], options: AcronymOptions) -> Iterator[str]:
+        """Yield acronyms in input order, identical to the serial batch API."""
+        for _, _, acronyms in self.chunks(phrases, options):
+            yield from acronyms
+
+    def map_unordered(
+        self, phrases: Iterable[str], options: AcronymOptions
+    ) -> Iterator[Tuple[int, str]]:
+        """Yield (input index, acronym) pairs as soon as each chunk finishes."""
+        for start, _, acronyms in self.chunks(phrases, options, ordered=False):
+            yield from enumerate(acronyms, start)
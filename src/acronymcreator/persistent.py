@@ -0,0 +1,135 @@
+"""
+Persistent on-disk cache of rendered CLI output.
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+from typing import Optional, Union
+
+from . import __version__
+
+DEFAULT_MAX_ENTRIES = 100_000
+CACHE_FILENAME = "results.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    version TEXT NOT NULL,
+    options TEXT NOT NULL,
+    phrase TEXT NOT NULL,
+    output TEXT NOT NULL,
+    PRIMARY KEY (version, options, phrase)
+)
+"""
+
+
+def default_cache_dir() -> Path:
+    """Return the acronymcreator directory under the XDG cache directory."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(base) / "acronymcreator"
+
+
+def default_cache_path() -> Path:
+    """Return the cache file location under the XDG cache directory."""
+    return default_cache_dir() / CACHE_FILENAME
+
+
+class PersistentCache:
+    """SQLite-backed cache of CLI results keyed by phrase, options and version.
+
+    ``options`` is any string identifying everything that affects the
+    output, such as the acronym options and output format. Entries written
+    by other tool versions are never returned and are removed by
+    ``compact``. When the cache grows past ``max_entries`` (default
+    ``DEFAULT_MAX_ENTRIES``) the oldest entries are dropped.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_entries: Optional[int] = None,
+        version: str = __version__,
+    ):
+        if max_entries is None:
+            max_entries = DEFAULT_MAX_ENTRIES
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.path = Path(path) if path is not None else default_cache_path()
+        self.max_entries = max_entries
+        self.version = version
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.path))
+        self._connection.execute(_SCHEMA)
+
+    def get(self, phrase: str, options: str) -> Optional[str]:
+        """Return the cached output or None."""
+        row = self._connection.execute(
+            "SELECT output FROM results WHERE version = ? AND options = ? "
+            "AND phrase = ?",
+            (self.version, options, phrase),
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, phrase: str, options: str, output: str) -> None:
+        """Store output for a phrase, trimming the cache if it is too large."""
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (self.version, options, phrase, output),
+            )
+            self._trim()
+
+    def _trim(self) -> int:
+        """Delete the oldest entries beyond ``max_entries``."""
+        # The rowid span bounds the row count and is cheap to read, so the
+        # full count only runs when the cache might be over its limit
+        (span,) = self._connection.execute(
+            "SELECT COALESCE(MAX(rowid) - MIN(rowid) + 1, 0) FROM results"
+        ).fetchone()
+        if span <= self.max_entries:
+            return 0
+        count = len(self)
+        excess = count - self.max_entries
+        if excess <= 0:
+            return 0
+        self._connection.execute(
+            "DELETE FROM results WHERE rowid IN "
+            "(SELECT rowid FROM results ORDER BY rowid LIMIT ?)",
+            (excess,),
+        )
+        return excess
+
+    def __len__(self) -> int:
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM results").fetchone()
+        return count
+
+    def compact(self) -> int:
+        """Drop stale-version and excess entries, then reclaim disk space.
+
+        Returns the number of entries removed.
+        """
+        with self._connection:
+            removed = self._connection.execute(
+                "DELETE FROM results WHERE version != ?", (self.version,)
+            ).rowcount
+            removed += self._trim()
+        self._connection.execute("VACUUM")
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._connection:
+            self._connection.execute("DELETE FROM results")
+        self._connection.execute("VACUUM")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def __enter__(self) -> "PersistentCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,270 @@
+"""
+Opt-in profiling hooks for AcronymCreator.
+
+Pass a ``Profiler`` to ``AcronymCreator`` to record how long each stage of
+the pipeline takes and how many phrases and words flow through it. Without
+a profiler none of the instrumented code runs; the only cost is an
+``is None`` check on entry points that are not already specialized.
+"""
+
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional
+
+from .compiled import CompiledOptions
+from .tokenizer import PUNCTUATION_PATTERN, Tokenizer, match_phrase
+
+
+@dataclass(frozen=True)
+class StageStats:
+    """Calls and exclusive wall-clock time of one stage."""
+
+    calls: int
+    seconds: float
+
+
+@dataclass(frozen=True)
+class ProfileSnapshot:
+    """Point-in-time copy of a profiler's stage timings and counters.
+
+    Stage times are exclusive: time spent in a nested stage (for example
+    ``tokenize`` inside ``acronym``) is only counted once, for the inner
+    stage, so the stage times add up to the total instrumented time.
+    """
+
+    stages: Dict[str, StageStats]
+    counters: Dict[str, int]
+
+    @property
+    def total_seconds(self) -> float:
+        """Total time spent in instrumented stages."""
+        return sum(stage.seconds for stage in self.stages.values())
+
+    def format(self) -> str:
+        """Render the snapshot as a human-readable table."""
+        total = self.total_seconds
+        lines = [f"{'stage':<12} {'calls':>10} {'total ms':>10} {'µs/call':>9} share"]
+        for name, stage in sorted(
+            self.stages.items(), key=lambda item: item[1].seconds, reverse=True
+        ):
+            per_call = stage.seconds / stage.calls * 1e6 if stage.calls else 0.0
+            share = stage.seconds / total if total else 0.0
+            lines.append(
+                f"{name:<12} {stage.calls:>10} {stage.seconds * 1e3:>10.2f} "
+                f"{per_call:>9.2f} {share:>5.0%}"
+            )
+        if self.counters:
+            lines.append("")
+            lines.append(f"{'counter':<24} {'value':>10}")
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"{name:<24} {value:>10}")
+        return "\n".join(lines)
+
+
+def _disabled() -> None:
+    return None
+
+
+class Profiler:
+    """Thread-safe collector of per-stage timings and counters.
+
+    Stages nest; each thread keeps its own stack so concurrent callers do
+    not skew each other's exclusive times. A profiler is not carried into
+    worker processes: pickling one yields ``None``, so a pickled
+    ``AcronymCreator`` runs uninstrumented.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._compiled = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero every stage timer and counter."""
+        with self._lock:
+            self._calls = defaultdict(int)
+            self._seconds = defaultdict(float)
+            self._counters = defaultdict(int)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as stage ``name``."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        # Each frame is [start time, time spent in nested stages]
+        frame = [self.clock(), 0.0]
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            elapsed = self.clock() - frame[0]
+            stack.pop()
+            if stack:
+                stack[-1][1] += elapsed
+            with self._lock:
+                self._calls[name] += 1
+                self._seconds[name] += elapsed - frame[1]
+
+    def timed(self, name: str, func: Callable) -> Callable:
+        """Return ``func`` wrapped so each call is timed as stage ``name``."""
+
+        def wrapper(*args, **kwargs):
+            with self.stage(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Add ``amount`` to counter ``name``."""
+        with self._lock:
+            self._counters[name] += amount
+
+    def add_counts(self, counts: Dict[str, int]) -> None:
+        """Add several counters at once, skipping zeros."""
+        with self._lock:
+            for name, amount in counts.items():
+                if amount:
+                    self._counters[name] += amount
+
+    def snapshot(self) -> ProfileSnapshot:
+        """Return a copy of the current timings and counters."""
+        with self._lock:
+            return ProfileSnapshot(
+                stages={
+                    name: StageStats(calls, self._seconds[name])
+                    for name, calls in self._calls.items()
+                },
+                counters=dict(self._counters),
+            )
+
+    def instrument(self, compiled: CompiledOptions) -> "InstrumentedCompiledOptions":
+        """Return the instrumented counterpart of compiled options."""
+        tokenizer = compiled.tokenizer
+        key = (compiled.options, tokenizer.stop_words, tokenizer.normalize)
+        instrumented = self._compiled.get(key)
+        if instrumented is None:
+            instrumented = self._compiled[key] = InstrumentedCompiledOptions(
+                compiled, self
+            )
+        return instrumented
+
+    def instrument_strategies(self, engine):
+        """Instrument a ``MultiStrategyEngine`` in place and return it.
+
+        With multi-word stop entries the engine tokenizes each phrase twice,
+        and both passes are timed and counted.
+        """
+        engine.tokenizer = self._instrument_tokenizer(engine.tokenizer)
+        engine.tokenize = engine.tokenizer.tokenize
+        if engine.stop_tokenizer is not None:
+            engine.stop_tokenizer = self._instrument_tokenizer(engine.stop_tokenizer)
+            engine.stop_tokenize = engine.stop_tokenizer.tokenize
+        engine.generate = self.timed("multiple", engine.generate)
+        return engine
+
+    def _instrument_tokenizer(self, tokenizer: Tokenizer) -> "InstrumentedTokenizer":
+        return InstrumentedTokenizer(
+            tokenizer.stop_words, tokenizer.min_length, self, tokenizer.normalize
+        )
+
+    def __reduce__(self):
+        return (_disabled, ())
+
+
+class InstrumentedTokenizer(Tokenizer):
+    """Tokenizer that times itself and counts kept and dropped words.
+
+    Returns a list rather than a generator so the ``tokenize`` stage covers
+    the whole pass over the phrase. Multi-word stop entries are matched as
+    ``PhraseTokenizer`` does and counted per word as ``stop_phrase`` drops.
+    A normalizer, if any, is timed as its own ``normalize`` stage.
+    """
+
+    __slots__ = ("profiler", "normalize")
+
+    def __init__(
+        self,
+        stop_words,
+        min_length: int,
+        profiler: Profiler,
+        normalize: Optional[Callable[[str], str]] = None,
+    ):
+        super().__init__(stop_words, min_length)
+        self.profiler = profiler
+        self.normalize = normalize
+
+    def tokenize(self, phrase: str) -> List[str]:
+        """Return the words of ``phrase`` that survive cleaning and filtering."""
+        with self.profiler.stage("tokenize"):
+            stop_words = self.words
+            trie = self.phrases
+            min_length = self.min_length
+            tokens = []
+            punctuation = length = stop = stop_phrase = 0
+            if self.normalize is not None:
+                with self.profiler.stage("normalize"):
+                    tokens = self.normalize(phrase).split()
+            else:
+                for word in phrase.split():
+                    if not word.isalnum():
+                        word = PUNCTUATION_PATTERN.sub("", word)
+                        if not word:
+                            punctuation += 1
+                            continue
+                    tokens.append(word)
+            lowered = [word.lower() for word in tokens]
+            words = []
+            index = 0
+            while index < len(tokens):
+                if trie is not None:
+                    end = match_phrase(trie, lowered, index)
+                    if end:
+                        stop_phrase += end - index
+                        index = end
+                        continue
+                word = tokens[index]
+                if len(word) < min_length:
+                    length += 1
+                elif stop_words is not None and lowered[index] in stop_words:
+                    stop += 1
+                else:
+                    words.append(word)
+                index += 1
+        counts = {
+            "phrases": 1,
+            "words.kept": len(words),
+            "words.dropped.punctuation": punctuation,
+            "words.dropped.length": length,
+            "words.dropped.stop_word": stop,
+        }
+        if trie is not None:
+            counts["words.dropped.stop_phrase"] = stop_phrase
+        self.profiler.add_counts(counts)
+        return words
+
+    __call__ = tokenize
+
+
+class InstrumentedCompiledOptions(CompiledOptions):
+    """Compiled options whose tokenizer and acronym assembly are profiled."""
+
+    __slots__ = ("profiler",)
+
+    def __init__(self, compiled: CompiledOptions, profiler: Profiler):
+        self.options = compiled.options
+        self.tokenizer = profiler._instrument_tokenizer(compiled.tokenizer)
+        self.tokenize = self.tokenizer.tokenize
+        self.max_words = compiled.max_words
+        self.change_case = compiled.change_case
+        self.profiler = profiler
+
+    def __call__(self, phrase: str) -> str:
+        """Create the basic acronym for a phrase, timed as ``acronym``."""
+        with self.profiler.stage("acronym"):
+            return super().__call__(phrase)
@@ -0,0 +1,247 @@
+"""
+Reverse lookup index from acronyms back to the phrases that produce them.
+
+Postings are stored in SQLite in a ``WITHOUT ROWID`` table whose primary
+key is ``(acronym, phrase)``. The table is a B-tree sorted by acronym on
+disk, so an exact lookup is one seek and a prefix lookup is one range scan.
+Both answer in microseconds whatever the corpus size. New phrases are
+inserted into the tree directly, so the index grows incrementally without a
+rebuild. The options, strategy and stop words used to build an index are
+stored with it, together with the creator's normalizer if it has one, and
+reused when it is reopened.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+from .compiled import FrozenAcronymOptions
+from .core import AcronymCreator, AcronymOptions
+from .parallel import ParallelAcronymEngine
+from .stopwords import StopWords
+
+INDEX_FILENAME = "reverse-index.sqlite3"
+
+INDEX_STRATEGIES = ("basic", "syllable")
+
+# SQLite open modes: read-only, read-write, and read-write-create
+INDEX_MODES = ("ro", "rw", "rwc")
+
+# Sorts after every string that starts with a given prefix
+_PREFIX_END = "\U0010ffff"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS postings (
+    acronym TEXT NOT NULL,
+    phrase TEXT NOT NULL,
+    PRIMARY KEY (acronym, phrase)
+) WITHOUT ROWID;
+"""
+
+
+def default_index_path() -> Path:
+    """Return the default index location under the XDG cache directory."""
+    from .persistent import default_cache_dir
+
+    return default_cache_dir() / INDEX_FILENAME
+
+
+class ReverseIndex:
+    """On-disk index of acronym -> phrase postings.
+
+    A new index records ``options``, ``strategy`` and the creator's stop
+    words and normalizer; an existing one reuses what it recorded, and
+    raises ValueError if different ``options`` or ``strategy``, or a
+    ``creator`` with different stop words or normalizer, are passed
+    explicitly.
+    Acronyms are matched case-insensitively.
+
+    ``mode`` is ``rwc`` (default) to create the index if needed, ``rw`` to
+    update an existing index or ``ro`` to only read it. The last two raise
+    FileNotFoundError when ``path`` does not exist and ValueError when it
+    is not a reverse index, and never create files.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        options: Optional[AcronymOptions] = None,
+        strategy: Optional[str] = None,
+        creator: Optional[AcronymCreator] = None,
+        mode: str = "rwc",
+    ):
+        if strategy is not None and strategy not in INDEX_STRATEGIES:
+            raise ValueError(
+                f"Unknown strategy {strategy!r}; "
+                f"choose from {', '.join(INDEX_STRATEGIES)}"
+            )
+        if mode not in INDEX_MODES:
+            raise ValueError(
+                f"Unknown mode {mode!r}; choose from {', '.join(INDEX_MODES)}"
+            )
+        self.path = Path(path) if path is not None else default_index_path()
+        if mode == "rwc":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(self.path))
+            self._connection.executescript(_SCHEMA)
+        elif not self.path.is_file():
+            raise FileNotFoundError(f"No reverse index at {self.path}")
+        else:
+            # A URI keeps SQLite from creating or upgrading the file
+            uri = f"{self.path.resolve().as_uri()}?mode={mode}"
+            self._connection = sqlite3.connect(uri, uri=True)
+        try:
+            meta = dict(self._connection.execute("SELECT key, value FROM meta"))
+        except sqlite3.DatabaseError:
+            meta = {}
+        try:
+            if not meta and mode != "rwc":
+                raise ValueError(f"{self.path} is not a reverse index")
+            if meta:
+                self._load_meta(meta, options, strategy, creator)
+            else:
+                self._create_meta(options, strategy, creator)
+        except ValueError:
+            self._connection.close()
+            raise
+
+    def _create_meta(self, options, strategy, creator) -> None:
+        self.options = FrozenAcronymOptions.from_options(options or AcronymOptions())
+        self.strategy = strategy or "basic"
+        self.creator = creator or AcronymCreator()
+        meta = {
+            "options": json.dumps(self.options._asdict()),
+            "strategy": self.strategy,
+        }
+        stop_words = self.creator.COMMON_WORDS
+        if stop_words != AcronymCreator.COMMON_WORDS:
+            meta["stop_words"] = json.dumps(sorted(stop_words), ensure_ascii=False)
+        if self.creator.normalizer is not None:
+            meta["normalizer"] = json.dumps(self.creator.normalizer.key)
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO meta VALUES (?, ?)", sorted(meta.items())
+            )
+
+    def _load_meta(self, meta, options, strategy, creator) -> None:
+        self.options = FrozenAcronymOptions(**json.loads(meta["options"]))
+        self.strategy = meta["strategy"]
+        if options is not None and options.freeze() != self.options:
+            raise ValueError(
+                f"{self.path} was built with {self.options}; "
+                f"it cannot be used with {options.freeze()}"
+            )
+        if strategy is not None and strategy != self.strategy:
+            raise ValueError(
+                f"{self.path} was built with the {self.strategy} strategy; "
+                f"it cannot be used with {strategy}"
+            )
+        stop_words = meta.get("stop_words")
+        stop_words = json.loads(stop_words) if stop_words else None
+        normalizer = meta.get("normalizer")
+        if normalizer is not None:
+            from .normalize import Normalizer
+
+            normalizer = Normalizer(*json.loads(normalizer))
+        if creator is None:
+            creator = AcronymCreator(
+                stop_words=StopWords(stop_words) if stop_words else None,
+                normalizer=normalizer,
+            )
+        elif sorted(creator.COMMON_WORDS) != (
+            stop_words or sorted(AcronymCreator.COMMON_WORDS)
+        ):
+            raise ValueError(
+                f"{self.path} was built with different stop words; "
+                f"it cannot be used with this creator's"
+            )
+        elif creator.normalizer != normalizer:
+            raise ValueError(
+                f"{self.path} was built with normalizer {normalizer}; "
+                f"it cannot be used with {creator.normalizer}"
+            )
+        self.creator = creator
+
+    def add(
+        self,
+        phrases: Iterable[str],
+        engine: Optional[ParallelAcronymEngine] = None,
+    ) -> int:
+        """Index new phrases and return how many postings were added.
+
+        Blank phrases, phrases without an acronym and postings already in
+        the index are skipped. Pass an ``engine`` to compute acronyms on
+        several processes; it must use this index's creator settings.
+        """
+        if engine is None:
+            engine = ParallelAcronymEngine(
+                workers=1, creator=self.creator, strategy=self.strategy
+            )
+        options = AcronymOptions(**self.options._asdict())
+        added = 0
+        with self._connection:
+            for _, chunk, acronyms in engine.chunks(phrases, options, ordered=False):
+                before = self._connection.total_changes
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO postings VALUES (?, ?)",
+                    (
+                        (acronym.upper(), phrase)
+                        for phrase, acronym in zip(chunk, acronyms)
+                        if acronym and phrase.strip()
+                    ),
+                )
+                added += self._connection.total_changes - before
+        return added
+
+    def lookup(self, acronym: str, limit: Optional[int] = None) -> List[str]:
+        """Return the phrases whose acronym is ``acronym``, sorted."""
+        return [
+            phrase
+            for (phrase,) in self._connection.execute(
+                "SELECT phrase FROM postings WHERE acronym = ? ORDER BY phrase "
+                "LIMIT ?",
+                (acronym.upper(), -1 if limit is None else limit),
+            )
+        ]
+
+    def prefix(self, prefix: str, limit: Optional[int] = None) -> List[Tuple[str, str]]:
+        """Return ``(acronym, phrase)`` pairs for acronyms starting with
+        ``prefix``, sorted by acronym then phrase."""
+        prefix = prefix.upper()
+        return self._connection.execute(
+            "SELECT acronym, phrase FROM postings "
+            "WHERE acronym >= ? AND acronym < ? ORDER BY acronym, phrase LIMIT ?",
+            (prefix, prefix + _PREFIX_END, -1 if limit is None else limit),
+        ).fetchall()
+
+    def acronym_count(self) -> int:
+        """Return the number of distinct acronyms."""
+        (count,) = self._connection.execute(
+            "SELECT COUNT(DISTINCT acronym) FROM postings"
+        ).fetchone()
+        return count
+
+    def clear(self) -> None:
+        """Remove every posting, keeping the recorded settings."""
+        with self._connection:
+            self._connection.execute("DELETE FROM postings")
+        self._connection.execute("VACUUM")
+
+    def __len__(self) -> int:
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM postings").fetchone()
+        return count
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def __enter__(self) -> "ReverseIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,186 @@
+"""
+Long-running acronym daemon and thin client over a Unix domain socket.
+
+The protocol is JSON Lines: each request is one JSON object per line and
+each response is one JSON object per line, for as many requests as the
+client sends on the connection. A request looks like::
+
+    {"phrase": "Hello World", "strategy": "basic",
+     "options": {"include_articles": false, "min_word_length": 2,
+                 "max_words": null, "force_uppercase": true}}
+
+``strategy`` is ``basic`` (default), ``syllable`` or ``multiple``, and
+every ``options`` field is optional. Responses are ``{"acronym": ...}``,
+``{"results": {...}}`` for ``multiple``, or ``{"error": ...}``; every
+request gets a response, including malformed ones.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+from pathlib import Path
+from typing import Optional, Union
+
+from .cache import LRUCache
+from .core import AcronymCreator, AcronymOptions
+
+DEFAULT_CACHE_SIZE = 100_000
+DEFAULT_TIMEOUT = 1.0
+
+
+def default_socket_path() -> Path:
+    """Return the socket path from ACRONYMCREATOR_SOCKET or a per-user default."""
+    configured = os.environ.get("ACRONYMCREATOR_SOCKET")
+    if configured:
+        return Path(configured)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "acronymcreator.sock"
+    return Path(tempfile.gettempdir()) / f"acronymcreator-{os.getuid()}.sock"
+
+
+# Accepted JSON types of each ``options`` field; bools are not integers here
+OPTION_TYPES = {
+    "include_articles": (bool,),
+    "min_word_length": (int,),
+    "max_words": (int, type(None)),
+    "force_uppercase": (bool,),
+}
+
+
+def parse_options(raw) -> AcronymOptions:
+    """Build ``AcronymOptions`` from a request's ``options`` object.
+
+    Raises ValueError naming the first unknown or mistyped field.
+    """
+    if not isinstance(raw, dict):
+        raise ValueError("'options' must be a JSON object")
+    for name, value in raw.items():
+        types = OPTION_TYPES.get(name)
+        if types is None:
+            raise ValueError(f"unknown option {name!r}")
+        if not isinstance(value, types) or (
+            isinstance(value, bool) and bool not in types
+        ):
+            expected = " or ".join(
+                "null" if kind is type(None) else kind.__name__ for kind in types
+            )
+            raise ValueError(f"option {name!r} must be {expected}")
+    return AcronymOptions(**raw)
+
+
+class AcronymService:
+    """Answers protocol requests with a warm, cached AcronymCreator."""
+
+    def __init__(self, creator: Optional[AcronymCreator] = None):
+        self.creator = creator or AcronymCreator(cache=LRUCache(DEFAULT_CACHE_SIZE))
+
+    def handle(self, request: dict) -> dict:
+        """Return the response for a decoded request."""
+        phrase = request.get("phrase")
+        if not isinstance(phrase, str):
+            return {"error": "'phrase' must be a string"}
+        try:
+            options = parse_options(request.get("options", {}))
+        except ValueError as error:
+            return {"error": f"invalid options: {error}"}
+
+        strategy = request.get("strategy", "basic")
+        if strategy == "basic":
+            return {"acronym": self.creator.create_basic_acronym(phrase, options)}
+        if strategy == "syllable":
+            return {"acronym": self.creator.create_syllable_acronym(phrase, options)}
+        if strategy == "multiple":
+            return {"results": self.creator.generate_multiple_options(phrase)}
+        return {"error": f"unknown strategy: {strategy}"}
+
+    def handle_line(self, line: bytes) -> bytes:
+        """Decode one request line and encode its response line."""
+        try:
+            request = json.loads(line)
+        except ValueError:
+            response = {"error": "invalid JSON"}
+        else:
+            if not isinstance(request, dict):
+                response = {"error": "request must be a JSON object"}
+            else:
+                try:
+                    response = self.handle(request)
+                except Exception as error:
+                    # Answer instead of dropping the connection
+                    response = {"error": f"{type(error).__name__}: {error}"}
+        return json.dumps(response).encode("utf-8") + b"\n"
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if line.strip():
+                self.wfile.write(self.server.service.handle_line(line))
+                self.wfile.flush()
+
+
+class AcronymServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix socket server sharing one AcronymService."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        service: Optional[AcronymService] = None,
+    ):
+        self.path = Path(path) if path is not None else default_socket_path()
+        self.service = service or AcronymService()
+        _remove_stale_socket(self.path)
+        super().__init__(str(self.path), _RequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        if self.path.exists():
+            self.path.unlink()
+
+
+def _remove_stale_socket(path: Path) -> None:
+    """Delete a socket file left behind by a daemon that is no longer running.
+
+    Raises OSError if ``path`` is not a socket or a daemon is listening on it.
+    """
+    try:
+        mode = path.lstat().st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise OSError(f"{path} exists and is not a socket")
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            probe.connect(str(path))
+    except OSError:
+        path.unlink()
+    else:
+        raise OSError(f"an acronymcreator daemon is already listening on {path}")
+
+
+def send_request(
+    request: dict,
+    path: Union[str, Path, None] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> dict:
+    """Send one request to a running daemon and return its response.
+
+    Raises OSError when no daemon is listening, so callers can fall back to
+    in-process execution.
+    """
+    path = Path(path) if path is not None else default_socket_path()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(str(path))
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with client.makefile("rb") as reader:
+            line = reader.readline()
+    if not line:
+        raise ConnectionError("daemon closed the connection without a response")
+    return json.loads(line)
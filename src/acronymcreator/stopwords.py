@@ -0,0 +1,131 @@
+"""
+Configurable stop-word dictionaries with multi-word entries.
+
+Single-word entries are kept in a frozenset, so each token costs one hash
+lookup whatever the list size. Multi-word entries such as "in order to"
+are compiled into a trie keyed by whole words, which the tokenizer walks
+for the leftmost-longest match while scanning the phrase once; the work
+per token is bounded by the longest entry, not by the number of entries.
+"""
+
+from collections.abc import Set
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .tokenizer import END, clean_tokens
+
+
+def _normalize(
+    entry: str, normalizer: Optional[Callable[[str], str]] = None
+) -> Tuple[str, ...]:
+    """Split an entry into lowercase words cleaned like phrase tokens."""
+    if normalizer is not None:
+        return tuple(normalizer(entry).lower().split())
+    return tuple(clean_tokens(entry.lower()))
+
+
+def read_stop_words(path: Union[str, Path]) -> List[str]:
+    """Read one entry per line, skipping blank lines and ``#`` comments."""
+    entries = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                entries.append(line)
+    return entries
+
+
+class StopWords(Set):
+    """Immutable, hashable stop-word dictionary.
+
+    Behaves as a set of entries (multi-word entries as space-joined
+    strings) and can be used wherever ``AcronymCreator.COMMON_WORDS`` is.
+    Entries are split into words like phrases without a normalizer; pass
+    the creator's ``normalizer`` so that an entry such as "state-of-the-art"
+    splits into the same words as the phrases it should match.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[str] = (),
+        normalizer: Optional[Callable[[str], str]] = None,
+    ):
+        self.entries = frozenset(entries)
+        self.normalizer = normalizer
+        words = set()
+        phrases = set()
+        for entry in self.entries:
+            normalized = _normalize(entry, normalizer)
+            if len(normalized) == 1:
+                words.add(normalized[0])
+            elif normalized:
+                phrases.add(normalized)
+        self.words = frozenset(words)
+        self.phrases = frozenset(phrases)
+        self.trie = self._build_trie(self.phrases) if phrases else None
+
+    @staticmethod
+    def _build_trie(phrases: Iterable[Tuple[str, ...]]) -> Dict:
+        trie = {}
+        for phrase in phrases:
+            node = trie
+            for word in phrase:
+                node = node.setdefault(word, {})
+            node[END] = True
+        return trie
+
+    @classmethod
+    def from_files(
+        cls, paths: Iterable[Union[str, Path]], base: Iterable[str] = ()
+    ) -> "StopWords":
+        """Load entries from files, added to the ``base`` entries."""
+        entries = list(base)
+        for path in paths:
+            entries.extend(read_stop_words(path))
+        return cls(entries)
+
+    def with_normalizer(
+        self, normalizer: Optional[Callable[[str], str]]
+    ) -> "StopWords":
+        """Return these entries split into words by ``normalizer``."""
+        if normalizer == self.normalizer:
+            return self
+        return type(self)(self.entries, normalizer)
+
+    @property
+    def fingerprint(self) -> str:
+        """Digest of the entries that is stable across processes."""
+        import hashlib
+
+        text = "\n".join(sorted(self))
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+    def __contains__(self, entry: object) -> bool:
+        if not isinstance(entry, str):
+            return False
+        normalized = _normalize(entry, self.normalizer)
+        if len(normalized) == 1:
+            return normalized[0] in self.words
+        return normalized in self.phrases
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.words
+        for phrase in self.phrases:
+            yield " ".join(phrase)
+
+    def __len__(self) -> int:
+        return len(self.words) + len(self.phrases)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, StopWords):
+            return self.words == other.words and self.phrases == other.phrases
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return hash((self.words, self.phrases))
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}"
+            f"({len(self.words)} words, {len(self.phrases)} phrases)"
+        )
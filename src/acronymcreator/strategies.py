@@ -0,0 +1,106 @@
+"""
+Acronym strategies derived from a shared list of words.
+"""
+
+from typing import AbstractSet, Callable, Dict, Iterable, Iterator, List, Optional
+
+from .compiled import FrozenAcronymOptions, compile_options
+
+VOWELS = frozenset("aeiouAEIOU")
+
+# Number of words kept by the "limited" creative variant
+LIMITED_WORDS = 3
+
+_ALL_WORDS_OPTIONS = FrozenAcronymOptions(include_articles=True)
+_DEFAULT_OPTIONS = FrozenAcronymOptions()
+
+
+def first_syllable(word: str) -> str:
+    """Return the 2-3 character leading syllable used by syllable acronyms."""
+    if len(word) <= 2:
+        return word
+    if len(word) <= 4:
+        # Short words: take first 2 characters
+        return word[:2]
+    # Longer words: take 3 characters when the word starts with a vowel or
+    # its second character is one, otherwise 2
+    if word[0] in VOWELS or word[1] in VOWELS:
+        return word[:3]
+    return word[:2]
+
+
+def initials(words: Iterable[str]) -> str:
+    """Join the first letter of each word."""
+    return "".join(word[0] for word in words)
+
+
+def syllables(words: Iterable[str]) -> str:
+    """Join the leading syllable of each word."""
+    return "".join(first_syllable(word) for word in words)
+
+
+class MultiStrategyEngine:
+    """Derive every ``generate_multiple_options`` variant from one tokenization.
+
+    Each phrase is tokenized once with articles included; the article-free
+    word list used by the basic, lowercase, limited and syllable variants is
+    filtered from that list instead of re-tokenizing the phrase. Stop words
+    with multi-word entries cannot be filtered word by word, so for those the
+    article-free list comes from a second, phrase-aware tokenization.
+    ``join_syllables`` builds the syllable variant from the word list, and
+    ``normalizer``, if given, is applied to each phrase before tokenizing.
+    """
+
+    def __init__(
+        self,
+        common_words: AbstractSet[str],
+        join_syllables: Callable[[Iterable[str]], str] = syllables,
+        normalizer: Optional[Callable[[str], str]] = None,
+    ):
+        self.common_words = common_words
+        self.join_syllables = join_syllables
+        self.tokenizer = compile_options(
+            _ALL_WORDS_OPTIONS, common_words, normalizer
+        ).tokenizer
+        self.tokenize = self.tokenizer.tokenize
+        self.stop_tokenizer = None
+        self.stop_tokenize = None
+        if getattr(common_words, "trie", None) is not None:
+            self.stop_tokenizer = compile_options(
+                _DEFAULT_OPTIONS, common_words, normalizer
+            ).tokenizer
+            self.stop_tokenize = self.stop_tokenizer.tokenize
+
+    def generate(self, phrase: str) -> Dict[str, List[str]]:
+        """Generate the multiple-options dict for a single phrase."""
+        all_words = list(self.tokenize(phrase))
+        if self.stop_tokenize is None:
+            common_words = self.common_words
+            words = [word for word in all_words if word.lower() not in common_words]
+        else:
+            words = list(self.stop_tokenize(phrase))
+
+        letters = initials(words)
+        basic = letters.upper()
+        with_articles = initials(all_words).upper()
+
+        creative = []
+        if basic:
+            lowercase = letters.lower()
+            if lowercase.lower() != basic.lower():
+                creative.append(lowercase)
+            limited = initials(words[:LIMITED_WORDS]).upper()
+            if limited and limited != basic:
+                creative.append(limited)
+
+        syllable = self.join_syllables(words).upper()
+        return {
+            "basic": [basic] if basic else [],
+            "with_articles": [with_articles] if with_articles else [],
+            "creative": creative,
+            "syllable": [syllable] if syllable else [],
+        }
+
+    def generate_many(self, phrases: Iterable[str]) -> Iterator[Dict[str, List[str]]]:
+        """Generate the multiple-options dict for each phrase."""
+        return map(self.generate, phrases)
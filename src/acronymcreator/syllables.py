@@ -0,0 +1,297 @@
+"""
+Syllabification models for syllable acronyms.
+
+Two models split words into syllables in a single left-to-right pass:
+
+- ``VowelGroupSyllabifier`` segments words around vowel groups, giving
+  consonant clusters between groups to the next syllable when they form a
+  plausible English onset.
+- ``HyphenationSyllabifier`` applies Liang (TeX) hyphenation patterns,
+  compiled once into a character trie. Each position of a word walks the
+  trie for at most the longest pattern, so the work per word is linear in
+  its length for a given pattern set.
+
+Both take the first ``count`` syllables of each word and remember the
+result per distinct word, so repeated vocabulary is syllabified once.
+Without a syllabifier, ``AcronymCreator`` keeps the original two-to-three
+character rule in ``strategies.first_syllable``.
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+SYLLABLE_MODELS = ("legacy", "vowel", "pattern")
+
+# Distinct words remembered per syllabifier; None keeps every word
+DEFAULT_CACHE_SIZE = 65536
+
+VOWELS = frozenset("aeiouyàáâãäåæèéêëìíîïòóôõöøùúûüýÿœ")
+
+# Consonant clusters that start a syllable when they end a cluster between
+# vowel groups; two-letter "s" clusters are split instead ("bas-ket")
+ONSETS = frozenset(
+    {
+        "bl", "br", "ch", "cl", "cr", "dr", "fl", "fr", "gl", "gr", "kn",
+        "ph", "pl", "pr", "qu", "sh", "th", "tr", "wh", "wr",
+        "chr", "phr", "scr", "shr", "spl", "spr", "squ", "str", "thr",
+    }
+)  # fmt: skip
+
+# Key marking a pattern trie node that completes a pattern
+END = ""
+
+
+class Syllabifier:
+    """Base class: split words into syllables and take the leading ones.
+
+    Subclasses implement ``split_points``. ``first`` is cached per word; the
+    cache is rebuilt empty when an instance is unpickled in a worker.
+    """
+
+    def __init__(self, count: int = 1, cache_size: Optional[int] = DEFAULT_CACHE_SIZE):
+        if count < 1:
+            raise ValueError("count must be at least 1")
+        self.count = count
+        self.cache_size = cache_size
+        self._cache_first()
+
+    def _cache_first(self) -> None:
+        self.first = lru_cache(maxsize=self.cache_size)(self._first)
+
+    @property
+    def key(self) -> Tuple:
+        """Return the settings that decide how this syllabifier splits words."""
+        return (type(self).__name__, self.count)
+
+    def split_points(self, word: str) -> List[int]:
+        """Return the indexes where syllables after the first one start.
+
+        ``word`` is lowercase; the indexes apply to the original word too.
+        """
+        raise NotImplementedError
+
+    def _points(self, word: str) -> List[int]:
+        lower = word.lower()
+        # A few characters change length when lowercased; keep indexes valid
+        return self.split_points(lower if len(lower) == len(word) else word)
+
+    def syllables(self, word: str) -> List[str]:
+        """Split ``word`` into syllables, preserving its case."""
+        starts = [0, *self._points(word), len(word)]
+        return [word[start:end] for start, end in zip(starts, starts[1:])]
+
+    def _first(self, word: str) -> str:
+        points = self._points(word)
+        if len(points) < self.count:
+            return word
+        return word[: points[self.count - 1]]
+
+    def join(self, words: Iterable[str]) -> str:
+        """Join the leading syllables of each word."""
+        first = self.first
+        return "".join(first(word) for word in words)
+
+    def cache_info(self):
+        """Return the ``functools.lru_cache`` statistics of the word cache."""
+        return self.first.cache_info()
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state["first"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._cache_first()
+
+
+class VowelGroupSyllabifier(Syllabifier):
+    """Split words before the onset of each vowel group after the first.
+
+    "y" counts as a vowel unless it starts the word or follows a vowel, and
+    a final silent "e" does not form a syllable ("make") unless it ends a
+    consonant plus "le" ("table"). Between two vowel groups, the longest
+    cluster suffix found in ``ONSETS`` (or a single consonant) starts the
+    next syllable: "pro-gram", "ab-stract", "bas-ket".
+    """
+
+    def split_points(self, word: str) -> List[int]:
+        length = len(word)
+        vowel = [False] * length
+        for index, char in enumerate(word):
+            if char == "y":
+                vowel[index] = index > 0 and not vowel[index - 1]
+            else:
+                vowel[index] = char in VOWELS
+        if (
+            length > 2
+            and word[-1] == "e"
+            and not vowel[-2]
+            and not (word[-2] == "l" and length > 3 and not vowel[-3])
+        ):
+            vowel[-1] = False
+
+        points = []
+        group_end = None
+        index = 0
+        while index < length:
+            if not vowel[index]:
+                index += 1
+                continue
+            if group_end is not None:
+                points.append(self._onset_start(word, group_end, index))
+            while index < length and vowel[index]:
+                index += 1
+            group_end = index
+        return points
+
+    @staticmethod
+    def _onset_start(word: str, start: int, end: int) -> int:
+        """Return where the syllable starting in consonants ``[start, end)``
+        begins."""
+        for size in (3, 2):
+            if end - start >= size and word[end - size : end] in ONSETS:
+                return end - size
+        return end - 1
+
+
+def parse_pattern(pattern: str) -> Tuple[str, Tuple[int, ...]]:
+    """Split a Liang pattern such as "hen5at" into letters and values.
+
+    Values has one entry per gap between letters, including both ends.
+    """
+    letters = []
+    values = [0]
+    for char in pattern:
+        if char.isdigit():
+            values[-1] = int(char)
+        else:
+            letters.append(char)
+            values.append(0)
+    return "".join(letters), tuple(values)
+
+
+def read_patterns(path: Union[str, Path]) -> Tuple[List[str], List[str]]:
+    """Read patterns and hyphenated exception words from a file.
+
+    Accepts TeX files with ``\\patterns{...}`` and ``\\hyphenation{...}``
+    blocks and ``%`` comments, or plain whitespace-separated patterns.
+    """
+    text = re.sub(r"%.*", "", Path(path).read_text(encoding="utf-8"))
+    blocks = re.findall(r"\\(patterns|hyphenation)\s*\{([^}]*)\}", text)
+    if not blocks:
+        return text.split(), []
+    patterns = []
+    exceptions = []
+    for kind, body in blocks:
+        (patterns if kind == "patterns" else exceptions).extend(body.split())
+    return patterns, exceptions
+
+
+class HyphenationSyllabifier(Syllabifier):
+    """Split words where Liang hyphenation patterns allow a hyphen.
+
+    No break is placed within ``left_min`` characters of the start or
+    ``right_min`` characters of the end. ``exceptions`` are hyphenated
+    words such as "ta-ble" that override the patterns.
+    """
+
+    def __init__(
+        self,
+        patterns: Iterable[str],
+        exceptions: Iterable[str] = (),
+        count: int = 1,
+        cache_size: Optional[int] = DEFAULT_CACHE_SIZE,
+        left_min: int = 2,
+        right_min: int = 2,
+    ):
+        super().__init__(count, cache_size)
+        self.left_min = left_min
+        self.right_min = right_min
+        patterns = sorted(patterns)
+        exceptions = sorted(exceptions)
+        # Identifies the pattern set, whichever file or order it came from
+        self.digest = hashlib.sha256(
+            "\n".join([*patterns, "", *exceptions]).encode("utf-8")
+        ).hexdigest()
+        self.trie = {}
+        for pattern in patterns:
+            letters, values = parse_pattern(pattern.lower())
+            node = self.trie
+            for char in letters:
+                node = node.setdefault(char, {})
+            node[END] = values
+        self.exceptions = {}
+        for exception in exceptions:
+            parts = exception.lower().split("-")
+            points = []
+            for part in parts[:-1]:
+                points.append((points[-1] if points else 0) + len(part))
+            self.exceptions["".join(parts)] = points
+
+    @property
+    def key(self) -> Tuple:
+        return (*super().key, self.left_min, self.right_min, self.digest)
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path], **kwargs) -> "HyphenationSyllabifier":
+        """Compile the patterns and exceptions in a pattern file."""
+        patterns, exceptions = read_patterns(path)
+        return cls(patterns, exceptions, **kwargs)
+
+    def split_points(self, word: str) -> List[int]:
+        points = self.exceptions.get(word)
+        if points is not None:
+            return points
+        text = f".{word}."
+        length = len(text)
+        values = [0] * (length + 1)
+        trie = self.trie
+        for start in range(length):
+            node = trie
+            index = start
+            while index < length:
+                node = node.get(text[index])
+                if node is None:
+                    break
+                index += 1
+                pattern = node.get(END)
+                if pattern is not None:
+                    for offset, value in enumerate(pattern, start):
+                        if value > values[offset]:
+                            values[offset] = value
+        # values[i + 1] is the gap before word[i], after the leading "."
+        last = len(word) - self.right_min
+        return [
+            index
+            for index in range(max(self.left_min, 1), last + 1)
+            if values[index + 1] % 2
+        ]
+
+
+def get_syllabifier(
+    model: str = "legacy",
+    patterns: Optional[Union[str, Path]] = None,
+    count: int = 1,
+) -> Optional[Syllabifier]:
+    """Build the syllabifier for a model name, or None for "legacy".
+
+    The "pattern" model needs a ``patterns`` file. The legacy rule always
+    takes one leading syllable, so it rejects other counts.
+    """
+    if model == "legacy":
+        if count != 1:
+            raise ValueError("The legacy syllable model takes one syllable per word")
+        return None
+    if model == "vowel":
+        return VowelGroupSyllabifier(count)
+    if model == "pattern":
+        if patterns is None:
+            raise ValueError("The pattern syllable model needs a patterns file")
+        return HyphenationSyllabifier.from_file(patterns, count=count)
+    raise ValueError(
+        f"Unknown syllable model {model!r}; choose from {', '.join(SYLLABLE_MODELS)}"
+    )
@@ -0,0 +1,179 @@
+"""
+Single-pass tokenizer for AcronymCreator.
+"""
+
+import re
+from typing import AbstractSet, Callable, Dict, Iterator, List, Optional
+
+# Characters removed from words; only applied to tokens that contain them
+PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+
+# Key marking a phrase trie node that completes a multi-word stop entry
+END = ""
+
+
+def clean_tokens(phrase: str) -> List[str]:
+    """Split a phrase and strip punctuation, dropping emptied tokens."""
+    strip_punctuation = PUNCTUATION_PATTERN.sub
+    tokens = []
+    for word in phrase.split():
+        if not word.isalnum():
+            word = strip_punctuation("", word)
+            if not word:
+                continue
+        tokens.append(word)
+    return tokens
+
+
+def match_phrase(trie: Dict, words: List[str], start: int) -> int:
+    """Return the end of the longest trie entry at ``words[start:]``, or 0."""
+    node = trie.get(words[start])
+    index = start + 1
+    end = 0
+    while node is not None:
+        if END in node:
+            end = index
+        if index == len(words):
+            break
+        node = node.get(words[index])
+        index += 1
+    return end
+
+
+class Tokenizer:
+    """Clean, split and filter a phrase in a single pass over its tokens.
+
+    Produces the same words as ``AcronymCreator.extract_words`` without
+    building the intermediate cleaned phrase or filtered lists: each
+    whitespace-separated token has punctuation removed only when it contains
+    some, then is checked against the stop words and minimum length.
+    """
+
+    __slots__ = ("stop_words", "min_length", "words", "phrases")
+
+    # Normalizer applied to phrases first; set by ``NormalizingTokenizer``
+    normalize: Optional[Callable[[str], str]] = None
+
+    # Split a phrase into cleaned tokens
+    split = staticmethod(clean_tokens)
+
+    def __init__(self, stop_words: Optional[AbstractSet[str]], min_length: int):
+        self.stop_words = stop_words
+        self.min_length = min_length
+        # A StopWords dictionary is split into a frozenset of single words
+        # and a trie of multi-word entries
+        self.words = getattr(stop_words, "words", stop_words)
+        self.phrases = getattr(stop_words, "trie", None)
+
+    @classmethod
+    def for_options(
+        cls,
+        options,
+        common_words: AbstractSet[str],
+        normalizer: Optional[Callable[[str], str]] = None,
+    ) -> "Tokenizer":
+        """Build the tokenizer for an ``AcronymOptions`` instance.
+
+        With a ``normalizer``, phrases are normalized first and split on
+        whitespace only.
+        """
+        stop_words = None if options.include_articles else common_words
+        phrases = getattr(stop_words, "trie", None) is not None
+        if normalizer is not None:
+            cls = NormalizingPhraseTokenizer if phrases else NormalizingTokenizer
+            return cls(stop_words, options.min_word_length, normalizer)
+        if phrases:
+            return PhraseTokenizer(stop_words, options.min_word_length)
+        return cls(stop_words, options.min_word_length)
+
+    def tokenize(self, phrase: str) -> Iterator[str]:
+        """Yield the words of ``phrase`` that survive cleaning and filtering."""
+        strip_punctuation = PUNCTUATION_PATTERN.sub
+        stop_words = self.words
+        min_length = self.min_length
+        for word in phrase.split():
+            if not word.isalnum():
+                word = strip_punctuation("", word)
+                if not word:
+                    continue
+            if len(word) < min_length:
+                continue
+            if stop_words is not None and word.lower() in stop_words:
+                continue
+            yield word
+
+    __call__ = tokenize
+
+
+class PhraseTokenizer(Tokenizer):
+    """Tokenizer that also drops multi-word stop entries.
+
+    Cleaned tokens are scanned once from left to right; at each position the
+    phrase trie is walked for the longest entry starting there, which is
+    skipped whole. Stop phrases are matched before the length filter, so
+    entries containing short words such as "a number of" still match.
+    """
+
+    __slots__ = ()
+
+    def tokenize(self, phrase: str) -> Iterator[str]:
+        """Yield the words of ``phrase`` outside any stop word or phrase."""
+        tokens = self.split(phrase)
+        lowered = [word.lower() for word in tokens]
+        stop_words = self.words
+        trie = self.phrases
+        min_length = self.min_length
+        index = 0
+        while index < len(tokens):
+            end = match_phrase(trie, lowered, index)
+            if end:
+                index = end
+                continue
+            word = tokens[index]
+            if len(word) >= min_length and lowered[index] not in stop_words:
+                yield word
+            index += 1
+
+    __call__ = tokenize
+
+
+class NormalizingTokenizer(Tokenizer):
+    """Tokenizer that runs a normalizer over each phrase before splitting it.
+
+    The normalizer has already resolved punctuation, so tokens are not
+    cleaned again; that keeps the combining marks it leaves in place.
+    """
+
+    __slots__ = ("normalize",)
+
+    def __init__(
+        self,
+        stop_words: Optional[AbstractSet[str]],
+        min_length: int,
+        normalize: Callable[[str], str],
+    ):
+        super().__init__(stop_words, min_length)
+        self.normalize = normalize
+
+    def split(self, phrase: str) -> List[str]:
+        """Normalize a phrase and split it on whitespace."""
+        return self.normalize(phrase).split()
+
+    def tokenize(self, phrase: str) -> Iterator[str]:
+        """Yield the words of the normalized phrase that survive filtering."""
+        stop_words = self.words
+        min_length = self.min_length
+        for word in self.normalize(phrase).split():
+            if len(word) < min_length:
+                continue
+            if stop_words is not None and word.lower() in stop_words:
+                continue
+            yield word
+
+    __call__ = tokenize
+
+
+class NormalizingPhraseTokenizer(PhraseTokenizer, NormalizingTokenizer):
+    """Phrase-aware tokenizer over normalized phrases."""
+
+    __slots__ = ()
@@ -0,0 +1,222 @@
+"""
+File-to-file transforms that add an acronym column to tabular data.
+
+CSV and TSV use only the standard library; Parquet needs pyarrow. Input is
+read in chunks of ``engine.chunk_size`` rows and each chunk is written out
+as soon as its acronyms are ready, so memory use is bounded by the chunks
+in flight rather than by the file size. Output is written to a temporary
+file next to the destination and moved into place once complete.
+"""
+
+import os
+from collections import deque
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Union
+
+from .core import AcronymOptions
+from .parallel import ParallelAcronymEngine
+
+FORMATS = ("csv", "tsv", "parquet")
+
+SUFFIXES = {".csv": "csv", ".tsv": "tsv", ".parquet": "parquet", ".pq": "parquet"}
+
+Progress = Callable[[int], None]
+
+
+def _no_progress(amount: int) -> None:
+    pass
+
+
+class Transform:
+    """Base class: add ``output_column`` computed from ``column``.
+
+    ``total`` is the amount of work in the units passed to the progress
+    callback, or None when unknown.
+    """
+
+    def __init__(
+        self,
+        source: Union[str, Path],
+        destination: Union[str, Path],
+        column: str,
+        output_column: str = "acronym",
+    ):
+        self.source = Path(source)
+        self.destination = Path(destination)
+        self.column = column
+        self.output_column = output_column
+
+    @property
+    def total(self) -> Optional[int]:
+        return None
+
+    def run(
+        self,
+        engine: ParallelAcronymEngine,
+        options: AcronymOptions,
+        progress: Progress = _no_progress,
+    ) -> int:
+        """Transform the whole file and return the number of rows written."""
+        partial = self.destination.with_name(f".{self.destination.name}.partial")
+        try:
+            rows = self._run(partial, engine, options, progress)
+            os.replace(partial, self.destination)
+        finally:
+            if partial.exists():
+                partial.unlink()
+        return rows
+
+    def _run(self, partial, engine, options, progress) -> int:
+        raise NotImplementedError
+
+    def _check_columns(self, names: List[str]) -> int:
+        """Return the index of the input column, validating both names."""
+        if self.column not in names:
+            raise ValueError(
+                f"Column {self.column!r} not found in {self.source}; "
+                f"available: {', '.join(names)}"
+            )
+        if self.output_column in names:
+            raise ValueError(
+                f"Column {self.output_column!r} already exists in {self.source}; "
+                f"choose another output column name"
+            )
+        return names.index(self.column)
+
+
+class DelimitedTransform(Transform):
+    """CSV or TSV transform; progress is reported in bytes read."""
+
+    def __init__(self, *args, delimiter: str = ",", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.delimiter = delimiter
+
+    @property
+    def total(self) -> int:
+        return self.source.stat().st_size
+
+    def _run(self, partial, engine, options, progress) -> int:
+        import csv
+        import io
+        import itertools
+
+        with open(self.source, "rb") as raw, open(
+            partial, "w", newline="", encoding="utf-8"
+        ) as outfile:
+            infile = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+            reader = csv.reader(infile, delimiter=self.delimiter)
+            header = next(reader, None)
+            if header is None:
+                raise ValueError(f"{self.source} is empty; expected a header row")
+            index = self._check_columns(header)
+            writer = csv.writer(outfile, delimiter=self.delimiter, lineterminator="\n")
+            writer.writerow([*header, self.output_column])
+
+            pending = deque()
+
+            width = len(header)
+            # Blank lines are skipped, as csv.DictReader does
+            rows_in = (row for row in reader if row)
+
+            def chunks() -> Iterator[List[str]]:
+                while True:
+                    rows = list(itertools.islice(rows_in, engine.chunk_size))
+                    if not rows:
+                        return
+                    pending.append(rows)
+                    yield [row[index] if index < len(row) else "" for row in rows]
+
+            written = 0
+            position = 0
+            for _, _, acronyms in engine.process_chunks(chunks(), options):
+                rows = pending.popleft()
+                for row, acronym in zip(rows, acronyms):
+                    # Pad short rows so the new column lines up with the header
+                    row.extend([""] * (width - len(row)))
+                    row.append(acronym)
+                writer.writerows(rows)
+                written += len(rows)
+                # Approximate by up to one read-ahead block
+                progress(raw.tell() - position)
+                position = raw.tell()
+        return written
+
+
+class ParquetTransform(Transform):
+    """Parquet transform; progress is reported in rows."""
+
+    @property
+    def total(self) -> int:
+        import pyarrow.parquet as pq
+
+        return pq.ParquetFile(self.source).metadata.num_rows
+
+    def _run(self, partial, engine, options, progress) -> int:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(self.source)
+        schema = parquet.schema_arrow
+        index = self._check_columns(schema.names)
+        field = schema.field(index)
+        if not (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)):
+            raise ValueError(
+                f"Column {self.column!r} has type {field.type}; expected strings"
+            )
+        output_schema = schema.append(pa.field(self.output_column, pa.string()))
+
+        pending = deque()
+
+        def chunks() -> Iterator[List[str]]:
+            for batch in parquet.iter_batches(batch_size=engine.chunk_size):
+                pending.append(batch)
+                # Nulls give "" like empty strings
+                yield [phrase or "" for phrase in batch.column(index).to_pylist()]
+
+        written = 0
+        with pq.ParquetWriter(partial, output_schema) as writer:
+            for _, chunk, acronyms in engine.process_chunks(chunks(), options):
+                batch = pending.popleft()
+                writer.write_batch(
+                    pa.RecordBatch.from_arrays(
+                        [*batch.columns, pa.array(acronyms, type=pa.string())],
+                        schema=output_schema,
+                    )
+                )
+                written += len(chunk)
+                progress(len(chunk))
+        return written
+
+
+def detect_format(path: Union[str, Path]) -> str:
+    """Return the transform format implied by a file name."""
+    suffix = Path(path).suffix.lower()
+    try:
+        return SUFFIXES[suffix]
+    except KeyError:
+        raise ValueError(
+            f"Cannot tell the format of {path} from its extension; "
+            f"use one of {', '.join(FORMATS)} explicitly"
+        ) from None
+
+
+def open_transform(
+    source: Union[str, Path],
+    destination: Union[str, Path],
+    column: str,
+    output_column: str = "acronym",
+    format: Optional[str] = None,
+) -> Transform:
+    """Create the transform for ``source``, detecting its format if needed."""
+    format = (format or detect_format(source)).lower()
+    if format == "parquet":
+        return ParquetTransform(source, destination, column, output_column)
+    if format in ("csv", "tsv"):
+        return DelimitedTransform(
+            source,
+            destination,
+            column,
+            output_column,
+            delimiter="\t" if format == "tsv" else ",",
+        )
+    raise ValueError(f"Unknown format {format!r}; choose from {', '.join(FORMATS)}")
@@ -190,3 +190,34 @@ class TestAcronymCreator:
 
         # Check with articles (should include 'The')
         assert "TQBF" in results["with_articles"]
+
+    def test_create_basic_acronym_many_matches_single(self):
+        """Test batch acronyms match the single-phrase method."""
+        phrases = [
+            "The Quick Brown Fox",
+            "Hello, World! How are you?",
+            "",
+            "   ",
+            "A Big Red Car",
+            "One Two Three Four Five",
+            "!@#$%",
+        ]
+        option_sets = [
+            AcronymOptions(),
+            AcronymOptions(include_articles=True),
+            AcronymOptions(min_word_length=3, include_articles=True),
+            AcronymOptions(max_words=3, force_uppercase=False),
+        ]
+        for options in option_sets:
+            expected = [
+                self.creator.create_basic_acronym(phrase, options) for phrase in phrases
+            ]
+            result = list(self.creator.create_basic_acronym_many(phrases, options))
+            assert result == expected
+
+    def test_create_basic_acronym_many_is_lazy(self):
+        """Test batch acronyms are yielded from any iterable."""
+        phrases = iter(["Hello World", "Portable Document Format"])
+        results = self.creator.create_basic_acronym_many(phrases, AcronymOptions())
+        assert next(results) == "HW"
+        assert next(results) == "PDF"
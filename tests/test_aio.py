@@ -0,0 +1,183 @@
+"""
+Tests for the asyncio facade.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.acronymcreator.aio import AsyncAcronymCreator
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+
+PHRASES = [
+    "The Quick Brown Fox",
+    "Application Programming Interface",
+    "",
+    "Hello World",
+    "One Two Three Four Five",
+]
+
+
+async def agen(items):
+    """Async iterable over items."""
+    for item in items:
+        await asyncio.sleep(0)
+        yield item
+
+
+async def collect(iterator):
+    """Collect an async iterator into a list."""
+    return [item async for item in iterator]
+
+
+class CountingCreator(AcronymCreator):
+    """Creator that records peak concurrency of basic batch calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.release = threading.Event()
+
+    def create_basic_acronym_many(self, phrases, options):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        self.release.wait(1)
+        with self.lock:
+            self.active -= 1
+        return super().create_basic_acronym_many(phrases, options)
+
+
+class TestAsyncAcronymCreator:
+    """Test cases for the AsyncAcronymCreator class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.creator = AcronymCreator()
+        self.async_creator = AsyncAcronymCreator(self.creator)
+        self.options = AcronymOptions(max_words=3)
+
+    def test_single_calls_match_sync_api(self):
+        """Test single-phrase coroutines match the synchronous methods."""
+
+        async def run():
+            return (
+                await self.async_creator.create_basic_acronym(
+                    "Hello World", self.options
+                ),
+                await self.async_creator.create_syllable_acronym(
+                    "Hello World", self.options
+                ),
+                await self.async_creator.generate_multiple_options("Hello World"),
+            )
+
+        basic, syllable, multiple = asyncio.run(run())
+        assert basic == self.creator.create_basic_acronym("Hello World", self.options)
+        assert syllable == self.creator.create_syllable_acronym(
+            "Hello World", self.options
+        )
+        assert multiple == self.creator.generate_multiple_options("Hello World")
+
+    def test_map_async_iterable_in_order(self):
+        """Test map over an async iterable keeps input order."""
+        expected = list(self.creator.create_basic_acronym_many(PHRASES, self.options))
+        for batch_size in (1, 2, 10):
+            result = asyncio.run(
+                collect(
+                    self.async_creator.map(
+                        agen(PHRASES), self.options, batch_size=batch_size
+                    )
+                )
+            )
+            assert result == expected
+
+    def test_map_other_strategies(self):
+        """Test map supports the syllable and multiple strategies."""
+        syllables = asyncio.run(
+            collect(self.async_creator.map(PHRASES, self.options, "syllable"))
+        )
+        assert syllables == [
+            self.creator.create_syllable_acronym(phrase, self.options)
+            for phrase in PHRASES
+        ]
+        multiple = asyncio.run(
+            collect(self.async_creator.map(PHRASES, None, "multiple"))
+        )
+        assert multiple == list(self.creator.generate_multiple_options_many(PHRASES))
+
+    def test_max_in_flight_is_enforced(self):
+        """Test no more than max_in_flight jobs run at once."""
+        creator = CountingCreator()
+        executor = ThreadPoolExecutor(max_workers=8)
+        async_creator = AsyncAcronymCreator(creator, executor, max_in_flight=2)
+
+        async def run():
+            tasks = [
+                asyncio.ensure_future(
+                    async_creator.create_basic_acronym(phrase, self.options)
+                )
+                for phrase in PHRASES
+            ]
+            await asyncio.sleep(0.05)
+            creator.release.set()
+            return await asyncio.gather(*tasks)
+
+        results = asyncio.run(run())
+        executor.shutdown()
+        assert creator.peak == 2
+        assert results == list(
+            AcronymCreator().create_basic_acronym_many(PHRASES, self.options)
+        )
+
+    def test_map_applies_backpressure(self):
+        """Test map stops pulling input while max_in_flight batches are pending."""
+        pulled = []
+
+        async def source():
+            for phrase in PHRASES * 4:
+                pulled.append(phrase)
+                yield phrase
+
+        async_creator = AsyncAcronymCreator(max_in_flight=2)
+
+        async def run():
+            iterator = async_creator.map(source(), self.options)
+            first = await iterator.__anext__()
+            count = len(pulled)
+            await iterator.aclose()
+            return first, count
+
+        first, count = asyncio.run(run())
+        assert first == "QBF"
+        assert count == 2
+
+    def test_cancellation(self):
+        """Test cancelling a consumer stops the iteration cleanly."""
+
+        async def run():
+            async def consume():
+                async for _ in self.async_creator.map(
+                    agen(PHRASES * 100), self.options
+                ):
+                    await asyncio.sleep(0.01)
+
+            task = asyncio.ensure_future(consume())
+            await asyncio.sleep(0.02)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+
+    def test_invalid_arguments(self):
+        """Test invalid limits and strategies are rejected."""
+        with pytest.raises(ValueError):
+            AsyncAcronymCreator(max_in_flight=0)
+        with pytest.raises(ValueError):
+            asyncio.run(collect(self.async_creator.map(PHRASES, strategy="nope")))
+        with pytest.raises(ValueError):
+            asyncio.run(collect(self.async_creator.map(PHRASES, batch_size=0)))
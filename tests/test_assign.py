@@ -0,0 +1,82 @@
+"""
+Tests for the assign module.
+"""
+
+import pytest
+from src.acronymcreator.assign import (
+    AcronymAssigner,
+    Assignment,
+    read_registry,
+    write_registry,
+)
+from src.acronymcreator.core import AcronymOptions
+
+
+class TestAcronymAssigner:
+    """Test cases for collision-aware assignment."""
+
+    def test_escalation_order(self):
+        """Test collisions escalate through letters, syllables and suffixes."""
+        assigner = AcronymAssigner(max_letters=2)
+        names = ["Data Platform", "Data Pipeline", "Data Products", "Data Privacy"]
+        assert [assigner.assign(name) for name in names] == [
+            Assignment("Data Platform", "DP", "basic"),
+            Assignment("Data Pipeline", "DAP", "letters"),
+            Assignment("Data Products", "DAPR", "letters"),
+            # DAP, DAPR and the syllable acronym are all taken
+            Assignment("Data Privacy", "DP2", "suffix"),
+        ]
+        assert assigner.assign("Data Portal").acronym == "DAPO"
+        assert assigner.assign("Data Pods").acronym == "DP3"
+
+        initials_only = AcronymAssigner(max_letters=1, registry=[("DP", None)])
+        assert initials_only.assign("Data Pipeline") == Assignment(
+            "Data Pipeline", "DAPIP", "syllable"
+        )
+
+    def test_suffix_skips_taken_acronyms(self):
+        """Test numeric suffixes skip acronyms issued by other means."""
+        registry = [("DP", None), ("dp2", None), ("DAPL", None)]
+        assigner = AcronymAssigner(max_letters=1, registry=registry)
+        assert assigner.assign("Data Platform").acronym == "DP3"
+        assert assigner.assign("Dp").acronym == "D"
+
+    def test_registry_and_repeats(self):
+        """Test registry names keep their acronym and repeats are stable."""
+        assigner = AcronymAssigner(registry=[("API", "Application Interface")])
+        assert assigner.assign("Application Interface") == Assignment(
+            "Application Interface", "API", "registry"
+        )
+        first = assigner.assign("Alpha Beta")
+        assert assigner.assign("Alpha Beta") is first
+        assert assigner.is_taken("ab")
+        assert assigner.registry() == [
+            ("API", "Application Interface"),
+            ("AB", "Alpha Beta"),
+        ]
+        assert len(assigner) == 2
+
+    def test_empty_names_and_options(self):
+        """Test names without words get no acronym and options apply."""
+        assigner = AcronymAssigner(options=AcronymOptions(force_uppercase=False))
+        assert assigner.assign("!!!") == Assignment("!!!", "", "empty")
+        assert assigner.assign("Hello World").acronym == "hw"
+        assert assigner.assign("Happy Wheels").acronym == "haw"
+        with pytest.raises(ValueError):
+            AcronymAssigner(max_letters=0)
+
+    def test_unique_at_scale(self):
+        """Test many colliding names all receive distinct acronyms."""
+        names = [f"Data Platform {index}" for index in range(2000)]
+        acronyms = [a.acronym for a in AcronymAssigner().assign_many(names)]
+        assert len({acronym.upper() for acronym in acronyms}) == len(names)
+
+    def test_registry_file_round_trip(self, tmp_path):
+        """Test registry files skip comments and round-trip entries."""
+        path = tmp_path / "registry.tsv"
+        path.write_text("# in use\nDP\tData Platform\n\nAPI\n", encoding="utf-8")
+        entries = read_registry(path)
+        assert entries == [("DP", "Data Platform"), ("API", None)]
+        write_registry(path, entries)
+        assert read_registry(path) == entries
+        assert not list(tmp_path.glob(".*partial"))
@@ -0,0 +1,225 @@
+"""
+Tests for the batch processing helpers.
+"""
+
+import csv
+import io
+import json
+import tomllib
+
+import yaml
+import pytest
+
+from src.acronymcreator.batch import (
+    WRITERS,
+    BatchWriter,
+    OutputBuffer,
+    get_writer,
+    iter_phrases,
+    register_writer,
+)
+from src.acronymcreator.json_backend import get_backend
+from src.acronymcreator.core import AcronymOptions
+
+
+class TestBatch:
+    """Test cases for batch input and output helpers."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.options = AcronymOptions()
+        self.stream = io.StringIO()
+
+    def write_all(self, format, results):
+        """Write results with the writer for the given format."""
+        writer = get_writer(format, self.stream, self.options)
+        for phrase, acronym in results:
+            writer.write(phrase, acronym)
+        writer.close()
+        return self.stream.getvalue()
+
+    def test_iter_phrases_multiple_streams(self):
+        """Test phrases are read from each stream in order."""
+        streams = [io.StringIO("Hello World\nFoo Bar\n"), io.StringIO("Last One")]
+        assert list(iter_phrases(streams)) == ["Hello World", "Foo Bar", "Last One"]
+
+    def test_iter_phrases_keeps_blank_lines(self):
+        """Test blank lines are kept so output stays aligned with input."""
+        phrases = list(iter_phrases([io.StringIO("One Two\n\nThree Four\n")]))
+        assert phrases == ["One Two", "", "Three Four"]
+
+    def test_text_writer(self):
+        """Test text writer emits one acronym per line."""
+        output = self.write_all("text", [("Hello World", "HW"), ("", "")])
+        assert output == "HW\n\n"
+
+    def test_json_writer_emits_json_lines(self):
+        """Test JSON writer emits one object per line."""
+        output = self.write_all("json", [("Hello World", "HW"), ("Foo Bar", "FB")])
+        records = [json.loads(line) for line in output.splitlines()]
+        assert [record["acronym"] for record in records] == ["HW", "FB"]
+        assert records[0]["options"]["min_word_length"] == 2
+
+    def test_yaml_writer_emits_documents(self):
+        """Test YAML writer emits one document per phrase."""
+        output = self.write_all("yaml", [("Hello World", "HW"), ("Foo Bar", "FB")])
+        documents = list(yaml.safe_load_all(output))
+        assert [doc["phrase"] for doc in documents] == ["Hello World", "Foo Bar"]
+
+    def test_csv_writer_single_header(self):
+        """Test CSV writer writes the header once."""
+        output = self.write_all("csv", [("Hello World", "HW"), ("Foo Bar", "FB")])
+        assert output.count("phrase,acronym") == 1
+        rows = list(csv.DictReader(io.StringIO(output)))
+        assert [row["acronym"] for row in rows] == ["HW", "FB"]
+        assert rows[0]["max_words"] == ""
+
+    def test_csv_writer_header_without_rows(self):
+        """Test CSV writer still writes a header for empty input."""
+        output = self.write_all("csv", [])
+        assert output.strip() == ",".join(
+            [
+                "phrase",
+                "acronym",
+                "include_articles",
+                "min_word_length",
+                "max_words",
+                "lowercase",
+            ]
+        )
+
+    def test_tsv_writer(self):
+        """Test TSV writer uses tab delimiters."""
+        self.options = AcronymOptions(max_words=3, force_uppercase=False)
+        output = self.write_all("tsv", [("Hello, World", "hw")])
+        rows = list(csv.DictReader(io.StringIO(output), delimiter="\t"))
+        assert rows[0]["phrase"] == "Hello, World"
+        assert rows[0]["max_words"] == "3"
+        assert rows[0]["lowercase"] == "true"
+
+    def test_toml_writer_array_of_tables(self):
+        """Test TOML writer emits a parseable array of tables."""
+        output = self.write_all("toml", [("Hello World", "HW"), ("Foo Bar", "FB")])
+        parsed = tomllib.loads(output)
+        assert [table["acronym"] for table in parsed["acronyms"]] == ["HW", "FB"]
+        assert parsed["acronyms"][0]["max_words"] == ""
+
+    def test_json_array_writer(self):
+        """Test JSON array writer emits one parseable array."""
+        output = self.write_all(
+            "json-array", [("Hello World", "HW"), ("Foo Bar", "FB")]
+        )
+        records = json.loads(output)
+        assert [record["acronym"] for record in records] == ["HW", "FB"]
+        assert output.startswith("[\n{") and output.endswith("}\n]\n")
+
+    def test_json_array_writer_empty(self):
+        """Test JSON array writer emits an empty array for empty input."""
+        assert json.loads(self.write_all("json-array", [])) == []
+
+    def test_json_writers_compact_backend(self):
+        """Test JSON writers emit compact records with a backend."""
+        stream = io.BytesIO()
+        writer = get_writer(
+            "json-array", stream, self.options, backend=get_backend("json")
+        )
+        writer.write("Café Olé", "CO")
+        writer.close()
+        output = stream.getvalue().decode("utf-8")
+        assert '{"phrase":"Café Olé","acronym":"CO",' in output
+        assert json.loads(output)[0]["acronym"] == "CO"
+
+    def test_binary_stream(self):
+        """Test writers encode output for binary streams."""
+        stream = io.BytesIO()
+        writer = get_writer("text", stream, self.options)
+        writer.write("Café Olé", "CO")
+        writer.write("Ünïcode Wörd", "ÜW")
+        writer.close()
+        assert stream.getvalue() == "CO\nÜW\n".encode("utf-8")
+
+    def test_text_wrapper_uses_binary_buffer(self):
+        """Test a text stream with a buffer is written through the buffer."""
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding="utf-8")
+        stream.write("before\n")
+        writer = get_writer("text", stream, self.options)
+        assert writer.stream.raw is raw
+        writer.write("Hello World", "HW")
+        writer.close()
+        assert raw.getvalue() == b"before\nHW\n"
+
+    def test_register_writer(self):
+        """Test custom writers can be registered by format name."""
+
+        class UpperWriter(BatchWriter):
+            def write_record(self, phrase, acronym):
+                self.stream.write(phrase.upper() + "\n")
+
+        register_writer("Upper", UpperWriter)
+        try:
+            assert self.write_all("upper", [("Hello", "H")]) == "HELLO\n"
+        finally:
+            del WRITERS["upper"]
+
+
+class RecordingStream(io.BytesIO):
+    """Binary stream that records the size of each write."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append(len(data))
+        return super().write(data)
+
+
+class TestOutputBuffer:
+    """Test cases for the OutputBuffer flush policies."""
+
+    def test_flush_by_records(self):
+        """Test output is written every N records."""
+        raw = RecordingStream()
+        buffer = OutputBuffer(raw, flush_records=2, flush_bytes=None)
+        for _ in range(5):
+            buffer.write("ab\n")
+            buffer.end_record()
+        assert raw.writes == [6, 6]
+        buffer.flush()
+        assert raw.writes == [6, 6, 3]
+        assert buffer.bytes_written == 15
+
+    def test_flush_by_bytes(self):
+        """Test output is written once enough bytes are pending."""
+        raw = RecordingStream()
+        buffer = OutputBuffer(raw, flush_bytes=8)
+        for _ in range(5):
+            buffer.write("abc\n")
+            buffer.end_record()
+        assert raw.writes == [8, 8]
+
+    def test_bytes_counted_after_encoding(self):
+        """Test the byte policy counts encoded bytes, not characters."""
+        raw = RecordingStream()
+        buffer = OutputBuffer(raw, flush_bytes=4)
+        buffer.write("éé")
+        buffer.end_record()
+        assert raw.writes == [4]
+
+    def test_no_write_until_flush(self):
+        """Test nothing reaches the stream while under both limits."""
+        raw = RecordingStream()
+        buffer = OutputBuffer(raw)
+        buffer.write_bytes(b"HW\n")
+        buffer.end_record()
+        assert raw.writes == []
+        buffer.flush()
+        assert raw.getvalue() == b"HW\n"
+
+    def test_invalid_policy(self):
+        """Test flush limits must be positive."""
+        with pytest.raises(ValueError):
+            OutputBuffer(io.BytesIO(), flush_records=0)
+        with pytest.raises(ValueError):
+            OutputBuffer(io.BytesIO(), flush_bytes=0)
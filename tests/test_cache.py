@@ -0,0 +1,179 @@
+"""
+Tests for the in-memory result cache.
+"""
+
+import pickle
+import threading
+
+import pytest
+
+from src.acronymcreator.cache import CacheStats, LRUCache
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+from src.acronymcreator.normalize import Normalizer
+from src.acronymcreator.stopwords import StopWords
+from src.acronymcreator.syllables import VowelGroupSyllabifier
+
+
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUCache:
+    """Test cases for the LRUCache class."""
+
+    def test_hit_and_miss_counters(self):
+        """Test hits and misses are counted."""
+        cache = LRUCache(maxsize=2)
+        assert cache.get("a") is None
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert cache.stats() == CacheStats(
+            hits=1, misses=1, evictions=0, expirations=0, size=1, maxsize=2
+        )
+
+    def test_least_recently_used_is_evicted(self):
+        """Test the least recently used entry is evicted first."""
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats().evictions == 1
+        assert len(cache) == 2
+
+    def test_ttl_expires_entries(self):
+        """Test entries older than the TTL are dropped."""
+        clock = FakeClock()
+        cache = LRUCache(maxsize=4, ttl=10, clock=clock)
+        cache.put("a", 1)
+        clock.now = 5
+        assert cache.get("a") == 1
+        clock.now = 11
+        assert cache.get("a", "missing") == "missing"
+        stats = cache.stats()
+        assert stats.expirations == 1
+        assert stats.size == 0
+
+    def test_get_or_compute(self):
+        """Test values are computed once and then served from the cache."""
+        cache = LRUCache()
+        calls = []
+        for _ in range(3):
+            cache.get_or_compute("key", lambda: calls.append(1) or "value")
+        assert len(calls) == 1
+        assert cache.stats().hits == 2
+
+    def test_clear_resets_counters(self):
+        """Test clear removes entries and counters."""
+        cache = LRUCache()
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+        assert cache.stats() == CacheStats(0, 0, 0, 0, 0, 1024)
+
+    def test_thread_safety(self):
+        """Test concurrent access keeps the size bound and counters consistent."""
+        cache = LRUCache(maxsize=50)
+
+        def worker(offset):
+            for i in range(500):
+                cache.get_or_compute((offset + i) % 80, lambda: i)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = cache.stats()
+        assert stats.size <= 50
+        assert stats.hits + stats.misses == 8 * 500
+
+    def test_pickle_gives_empty_cache(self):
+        """Test pickled caches keep their settings but not their entries."""
+        cache = LRUCache(maxsize=3, ttl=5)
+        cache.put("a", 1)
+        copy = pickle.loads(pickle.dumps(cache))
+        assert (copy.maxsize, copy.ttl, len(copy)) == (3, 5, 0)
+
+    def test_invalid_settings(self):
+        """Test invalid sizes and TTLs are rejected."""
+        with pytest.raises(ValueError):
+            LRUCache(maxsize=0)
+        with pytest.raises(ValueError):
+            LRUCache(ttl=0)
+
+
+class TestCachedAcronymCreator:
+    """Test cases for AcronymCreator with a cache."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.cache = LRUCache(maxsize=100)
+        self.creator = AcronymCreator(cache=self.cache)
+
+    def test_basic_acronym_is_cached(self):
+        """Test repeated phrases are served from the cache."""
+        options = AcronymOptions()
+        assert self.creator.create_basic_acronym("Hello World", options) == "HW"
+        assert self.creator.create_basic_acronym("Hello World", options) == "HW"
+        assert self.cache.stats().hits == 1
+
+    def test_options_are_part_of_the_key(self):
+        """Test different options do not share cache entries."""
+        lower = AcronymOptions(force_uppercase=False)
+        assert self.creator.create_basic_acronym("Hello World", lower) == "hw"
+        assert (
+            self.creator.create_basic_acronym("Hello World", AcronymOptions()) == "HW"
+        )
+        assert self.creator.create_syllable_acronym("Hello World", lower) == "helwor"
+        assert self.cache.stats().hits == 0
+
+    def test_creators_sharing_a_cache(self):
+        """Test creators with different settings never see each other's results."""
+        plain = AcronymCreator(cache=self.cache)
+        stop = AcronymCreator(cache=self.cache, stop_words=StopWords(["data"]))
+        syllable = AcronymCreator(
+            cache=self.cache, syllabifier=VowelGroupSyllabifier(count=2)
+        )
+        normalized = AcronymCreator(cache=self.cache, normalizer=Normalizer())
+        options = AcronymOptions()
+        assert plain.create_basic_acronym("Data Platform", options) == "DP"
+        assert stop.create_basic_acronym("Data Platform", options) == "P"
+        assert plain.create_basic_acronym("e-mail Data", options) == "ED"
+        assert normalized.create_basic_acronym("e-mail Data", options) == "MD"
+        assert plain.create_syllable_acronym("Data Platform", options) == "DAPL"
+        assert (
+            syllable.create_syllable_acronym("Data Platform", options) == "DATAPLATFORM"
+        )
+        assert plain.generate_multiple_options("Data Platform")["basic"] == ["DP"]
+        assert stop.generate_multiple_options("Data Platform")["basic"] == ["P"]
+        # Equal settings still share entries
+        again = AcronymCreator(cache=self.cache, stop_words=StopWords(["data"]))
+        hits = self.cache.stats().hits
+        assert again.create_basic_acronym("Data Platform", options) == "P"
+        assert self.cache.stats().hits == hits + 1
+
+    def test_batch_uses_cache(self):
+        """Test the batch API consults the cache per phrase."""
+        phrases = ["Hello World", "Foo Bar", "Hello World"]
+        result = list(self.creator.create_basic_acronym_many(phrases, AcronymOptions()))
+        assert result == ["HW", "FB", "HW"]
+        assert self.cache.stats().hits == 1
+
+    def test_multiple_options_are_copied(self):
+        """Test cached multiple-options results cannot be mutated by callers."""
+        first = self.creator.generate_multiple_options("The Quick Brown Fox")
+        first["basic"].append("XYZ")
+        second = self.creator.generate_multiple_options("The Quick Brown Fox")
+        assert second["basic"] == ["QBF"]
+        results = list(self.creator.generate_multiple_options_many(["Go Now"]))
+        assert results[0]["basic"] == ["GN"]
+        assert self.cache.stats().hits == 1
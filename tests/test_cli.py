@@ -5,7 +5,11 @@ Tests for the CLI module.
 import csv
 import io
 import json
+import sys
+import threading
 import tomllib
+
+import pytest
 from click.testing import CliRunner
 from src.acronymcreator.cli import main
 
@@ -477,3 +481,748 @@ class TestCLI:
 
         assert output["phrase"] == 'Hello, World! "Test"'
         assert output["acronym"] == "HWT"
+
+    def test_cli_batch_from_stdin(self):
+        """Test batch mode reading phrases from stdin."""
+        result = self.runner.invoke(
+            main, ["--input", "-"], input="Hello World\nThe Quick Brown Fox\n"
+        )
+        assert result.exit_code == 0
+        assert result.output == "HW\nQBF\n"
+
+    def test_cli_batch_from_files(self, tmp_path):
+        """Test batch mode reading phrases from several files."""
+        first = tmp_path / "first.txt"
+        second = tmp_path / "second.txt"
+        first.write_text("Hello World\n", encoding="utf-8")
+        second.write_text("Portable Document Format\n", encoding="utf-8")
+        result = self.runner.invoke(main, ["-i", str(first), "-i", str(second)])
+        assert result.exit_code == 0
+        assert result.output == "HW\nPDF\n"
+
+    def test_cli_batch_keeps_unmatched_lines(self):
+        """Test batch mode emits empty results instead of aborting."""
+        result = self.runner.invoke(main, ["-i", "-"], input="Hello World\n!!!\n")
+        assert result.exit_code == 0
+        assert result.output == "HW\n\n"
+
+    def test_cli_batch_csv_single_header(self):
+        """Test batch CSV output writes the header only once."""
+        result = self.runner.invoke(
+            main,
+            ["-i", "-", "--format", "csv", "--lowercase"],
+            input="Hello World\nFoo Bar\n",
+        )
+        assert result.exit_code == 0
+        assert result.output.count("phrase,acronym") == 1
+        rows = list(csv.DictReader(io.StringIO(result.output)))
+        assert [row["acronym"] for row in rows] == ["hw", "fb"]
+
+    def test_cli_batch_json_lines(self):
+        """Test batch JSON output is one object per line."""
+        result = self.runner.invoke(
+            main, ["-i", "-", "--format", "json"], input="Hello World\nFoo Bar\n"
+        )
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert [record["acronym"] for record in records] == ["HW", "FB"]
+
+    def test_cli_batch_toml_output(self):
+        """Test batch TOML output is a single parseable document."""
+        result = self.runner.invoke(
+            main, ["-i", "-", "--format", "toml"], input="Hello World\nFoo Bar\n"
+        )
+        assert result.exit_code == 0
+        output = tomllib.loads(result.output)
+        assert [table["acronym"] for table in output["acronyms"]] == ["HW", "FB"]
+
+    def test_cli_missing_phrase(self):
+        """Test CLI requires a phrase or an input file."""
+        result = self.runner.invoke(main, [])
+        assert result.exit_code == 2
+        assert "Missing argument 'PHRASE'" in result.output
+
+    def test_cli_phrase_with_input_rejected(self):
+        """Test CLI rejects a phrase combined with --input."""
+        result = self.runner.invoke(main, ["Hello World", "-i", "-"], input="Foo\n")
+        assert result.exit_code == 2
+        assert "cannot be combined" in result.output
+
+    def test_cli_batch_with_workers(self):
+        """Test batch mode output is identical with multiple workers."""
+        phrases = "".join(
+            f"Phrase Number {i}\nThe Quick Brown Fox\n" for i in range(20)
+        )
+        serial = self.runner.invoke(main, ["-i", "-", "--format", "csv"], input=phrases)
+        parallel = self.runner.invoke(
+            main,
+            ["-i", "-", "--format", "csv", "--workers", "2", "--chunk-size", "3"],
+            input=phrases,
+        )
+        assert parallel.exit_code == 0
+        assert parallel.output == serial.output
+
+    def test_cli_batch_unordered(self):
+        """Test unordered batch mode still emits every result."""
+        result = self.runner.invoke(
+            main,
+            ["-i", "-", "--workers", "2", "--chunk-size", "1", "--unordered"],
+            input="Hello World\nFoo Bar\nPortable Document Format\n",
+        )
+        assert result.exit_code == 0
+        assert sorted(result.output.split()) == ["FB", "HW", "PDF"]
+
+    def test_cli_create_subcommand(self):
+        """Test the explicit create subcommand matches the default."""
+        result = self.runner.invoke(main, ["create", "Hello World"])
+        assert result.exit_code == 0
+        assert result.output.strip() == "HW"
+
+    def test_cli_options_before_phrase(self):
+        """Test options may precede the phrase without naming a command."""
+        result = self.runner.invoke(main, ["--lowercase", "Hello World"])
+        assert result.exit_code == 0
+        assert result.output.strip() == "hw"
+
+    def test_cli_persistent_cache(self, tmp_path, monkeypatch):
+        """Test cached output is reused across invocations."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        first = self.runner.invoke(main, ["Hello World", "--cache", "--format", "json"])
+        assert first.exit_code == 0
+        monkeypatch.setattr(
+            "src.acronymcreator.cli.AcronymCreator.create_basic_acronym",
+            lambda *args: pytest.fail("cache was not used"),
+        )
+        second = self.runner.invoke(
+            main, ["Hello World", "--format", "json"], env={"ACRONYMCREATOR_CACHE": "1"}
+        )
+        assert second.exit_code == 0
+        assert second.output == first.output
+
+    def test_cli_no_cache_overrides_env(self, tmp_path, monkeypatch):
+        """Test --no-cache disables the cache even when enabled by env."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        result = self.runner.invoke(
+            main, ["Hello World", "--no-cache"], env={"ACRONYMCREATOR_CACHE": "1"}
+        )
+        assert result.exit_code == 0
+        assert not (tmp_path / "acronymcreator").exists()
+
+    def test_cli_subcommand_names(self, tmp_path, monkeypatch):
+        """Test a subcommand name runs the subcommand unless forced a phrase."""
+        from src.acronymcreator.server import AcronymServer
+
+        monkeypatch.setenv("ACRONYMCREATOR_SOCKET", str(tmp_path / "daemon.sock"))
+
+        def serve_forever(server):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(AcronymServer, "serve_forever", serve_forever)
+        result = self.runner.invoke(main, ["serve"])
+        assert result.exit_code == 0
+        assert "Listening on" in result.stderr
+        assert "Shutting down." in result.stderr
+
+        result = self.runner.invoke(main, ["cache"])
+        assert "Manage the on-disk result cache." in result.output
+        result = self.runner.invoke(main, ["index"])
+        assert "reverse index" in result.output
+        assert "Commands:" in result.output
+
+        # create WORD and -- read a subcommand name as a phrase
+        for args in (
+            ["create", "serve"],
+            ["--", "serve"],
+            ["--lowercase", "--", "cache"],
+        ):
+            result = self.runner.invoke(main, args)
+            assert result.exit_code == 0
+            assert result.stdout.strip().upper() == args[-1][0].upper()
+
+    def test_cli_cache_commands(self, tmp_path, monkeypatch):
+        """Test the cache info, compact and clear commands."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        for phrase in ["Hello World", "Foo Bar", "Quick Brown Fox"]:
+            self.runner.invoke(main, [phrase, "--cache"])
+
+        info = self.runner.invoke(main, ["cache", "info"])
+        assert info.exit_code == 0
+        assert "Entries: 3" in info.output
+
+        compact = self.runner.invoke(main, ["cache", "compact", "--max-entries", "1"])
+        assert compact.exit_code == 0
+        assert "Removed 2 entries; 1 remain." in compact.output
+
+        clear = self.runner.invoke(main, ["cache", "clear"])
+        assert clear.exit_code == 0
+        assert "Entries: 0" in self.runner.invoke(main, ["cache", "info"]).output
+
+    def test_cli_daemon_client(self, tmp_path, monkeypatch):
+        """Test --daemon forwards the phrase to a running daemon."""
+        from src.acronymcreator.server import AcronymServer
+
+        server = AcronymServer(tmp_path / "daemon.sock")
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        monkeypatch.setenv("ACRONYMCREATOR_SOCKET", str(server.path))
+        try:
+            result = self.runner.invoke(
+                main, ["Hello World", "--daemon", "--lowercase"]
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+        assert result.exit_code == 0
+        assert result.output.strip() == "hw"
+        assert server.service.creator.cache.stats().misses == 1
+
+    def test_cli_serve_keeps_regular_file(self, tmp_path, monkeypatch):
+        """Test serve refuses a socket path that is a regular file."""
+        notes = tmp_path / "notes.txt"
+        notes.write_text("keep me", encoding="utf-8")
+        result = self.runner.invoke(main, ["serve", "--socket", str(notes)])
+        assert result.exit_code == 1
+        assert "is not a socket" in result.stderr
+
+        monkeypatch.setenv("ACRONYMCREATOR_SOCKET", str(notes))
+        result = self.runner.invoke(main, ["serve", "--cache-size", "10"])
+        assert result.exit_code == 1
+        assert notes.read_text(encoding="utf-8") == "keep me"
+
+    def test_cli_daemon_fallback(self, tmp_path, monkeypatch):
+        """Test --daemon falls back to in-process execution."""
+        monkeypatch.setenv("ACRONYMCREATOR_SOCKET", str(tmp_path / "none.sock"))
+        result = self.runner.invoke(
+            main, ["Hello World"], env={"ACRONYMCREATOR_DAEMON": "1"}
+        )
+        assert result.exit_code == 0
+        assert result.output.strip() == "HW"
+
+    def test_cli_serve(self, tmp_path, monkeypatch):
+        """Test the serve command starts and cleans up the daemon."""
+        from src.acronymcreator.server import AcronymServer
+
+        def interrupt(self):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(AcronymServer, "serve_forever", interrupt)
+        path = tmp_path / "serve.sock"
+        result = self.runner.invoke(main, ["serve", "--socket", str(path)])
+        assert result.exit_code == 0
+        assert f"Listening on {path}" in result.output
+        assert not path.exists()
+
+    def test_cli_serve_refuses_live_socket(self, tmp_path):
+        """Test serve reports an error when a daemon is already running."""
+        from src.acronymcreator.server import AcronymServer
+
+        server = AcronymServer(tmp_path / "live.sock")
+        try:
+            result = self.runner.invoke(main, ["serve", "--socket", str(server.path)])
+        finally:
+            server.server_close()
+        assert result.exit_code == 1
+        assert "already listening" in result.output
+
+    def test_cli_batch_json_array(self):
+        """Test --json-array wraps batch JSON output in one array."""
+        result = self.runner.invoke(
+            main,
+            ["-i", "-", "--format", "json", "--json-array"],
+            input="Hello World\nFoo Bar\n",
+        )
+        assert result.exit_code == 0
+        records = json.loads(result.output)
+        assert [record["acronym"] for record in records] == ["HW", "FB"]
+
+    def test_cli_json_array_requires_json(self):
+        """Test --json-array is rejected for other formats."""
+        result = self.runner.invoke(main, ["-i", "-", "--json-array"], input="A B\n")
+        assert result.exit_code == 2
+        assert "--json-array requires --format json" in result.output
+
+    def test_cli_batch_flush_every(self):
+        """Test --flush-every does not change batch output."""
+        phrases = "Hello World\nFoo Bar\nPortable Document Format\n"
+        result = self.runner.invoke(
+            main, ["-i", "-", "--flush-every", "1", "--flush-bytes", "1"], input=phrases
+        )
+        assert result.exit_code == 0
+        assert result.output == "HW\nFB\nPDF\n"
+
+    def test_cli_json_compact(self):
+        """Test --compact renders a single line of JSON."""
+        result = self.runner.invoke(
+            main, ["Hello World", "--format", "json", "--compact"]
+        )
+        assert result.exit_code == 0
+        assert result.output.count("\n") == 1
+        assert '"acronym":"HW"' in result.output
+        assert json.loads(result.output)["options"]["max_words"] is None
+
+    def test_cli_json_compact_stdlib_backend(self):
+        """Test the stdlib backend matches the default compact output."""
+        args = ["-i", "-", "--format", "json", "--compact"]
+        phrases = "Café Olé\nHello World\n"
+        auto = self.runner.invoke(main, args, input=phrases)
+        stdlib = self.runner.invoke(
+            main, [*args, "--json-backend", "json"], input=phrases
+        )
+        assert auto.exit_code == stdlib.exit_code == 0
+        assert auto.output == stdlib.output
+        assert [json.loads(line)["acronym"] for line in auto.output.splitlines()] == [
+            "CO",
+            "HW",
+        ]
+
+    def test_cli_compact_requires_json(self):
+        """Test --compact is rejected for other formats."""
+        result = self.runner.invoke(main, ["Hello World", "--compact"])
+        assert result.exit_code == 2
+        assert "--compact requires --format json" in result.output
+
+    def test_cli_json_backend_not_installed(self, monkeypatch):
+        """Test a missing backend is reported as a usage error."""
+        from src.acronymcreator.json_backend import get_backend
+
+        get_backend.cache_clear()
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+        result = self.runner.invoke(
+            main,
+            ["Hello World", "--format", "json", "--compact"],
+            env={"ACRONYMCREATOR_JSON_BACKEND": "msgspec"},
+        )
+        get_backend.cache_clear()
+        assert result.exit_code == 2
+        assert "'msgspec' is not installed" in result.output
+
+    def test_cli_profile_breakdown(self):
+        """Test --profile prints stages and counters to stderr only."""
+        result = self.runner.invoke(main, ["The Quick Brown Fox", "--profile"])
+        assert result.exit_code == 0
+        assert result.stdout.strip() == "QBF"
+        assert "tokenize" in result.stderr
+        assert "serialize" in result.stderr
+        assert "words.dropped.stop_word" in result.stderr
+
+    def test_cli_profile_batch(self, tmp_path):
+        """Test --profile counts phrases and bytes in batch mode."""
+        path = tmp_path / "phrases.txt"
+        path.write_text("Hello World\nThe Quick Brown Fox\n", encoding="utf-8")
+        result = self.runner.invoke(main, ["--input", str(path), "--profile"])
+        assert result.exit_code == 0
+        assert result.stdout == "HW\nQBF\n"
+        counters = dict(
+            line.split() for line in result.stderr.splitlines()[-5:] if line
+        )
+        assert counters["phrases"] == "2"
+        assert counters["bytes.emitted"] == "7"
+
+    def test_cli_profile_output(self, tmp_path):
+        """Test --profile-output writes a pstats file."""
+        import pstats
+
+        path = tmp_path / "run.pstats"
+        result = self.runner.invoke(
+            main, ["Hello World", "--profile-output", str(path)]
+        )
+        assert result.exit_code == 0
+        assert result.stdout.strip() == "HW"
+        assert pstats.Stats(str(path)).total_calls > 0
+
+    def test_cli_transform_csv(self, tmp_path):
+        """Test transform adds an acronym column to a CSV file."""
+        source, destination = tmp_path / "in.csv", tmp_path / "out.csv"
+        source.write_text("id,name\n1,Hello World\n2,\n", encoding="utf-8")
+        result = self.runner.invoke(
+            main,
+            [
+                "transform",
+                str(source),
+                str(destination),
+                "--column",
+                "name",
+                "--lowercase",
+                "--strategy",
+                "syllable",
+                "--progress",
+            ],
+        )
+        assert result.exit_code == 0
+        assert "Wrote 2 rows" in result.stderr
+        assert destination.read_text(encoding="utf-8") == (
+            "id,name,acronym\n1,Hello World,helwor\n2,,\n"
+        )
+
+    def test_cli_transform_errors(self, tmp_path):
+        """Test transform reports bad columns and formats."""
+        source = tmp_path / "in.csv"
+        source.write_text("id,name\n1,Hello World\n", encoding="utf-8")
+        result = self.runner.invoke(
+            main, ["transform", str(source), str(tmp_path / "o.csv"), "-c", "title"]
+        )
+        assert result.exit_code == 1
+        assert "Column 'title' not found" in result.output
+        other = tmp_path / "in.dat"
+        other.write_text("x", encoding="utf-8")
+        result = self.runner.invoke(
+            main, ["transform", str(other), str(tmp_path / "o.dat"), "-c", "name"]
+        )
+        assert result.exit_code == 1
+        assert "Cannot tell the format" in result.output
+
+    def test_cli_transform_without_pyarrow(self, tmp_path, monkeypatch):
+        """Test Parquet without pyarrow gives an install hint."""
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        monkeypatch.setitem(sys.modules, "pyarrow.parquet", None)
+        source = tmp_path / "in.parquet"
+        source.write_bytes(b"PAR1")
+        result = self.runner.invoke(
+            main, ["transform", str(source), str(tmp_path / "o.parquet"), "-c", "x"]
+        )
+        assert result.exit_code == 1
+        assert "requires pyarrow" in result.output
+
+    def test_cli_mmap_matches_text_input(self, tmp_path):
+        """Test --mmap output matches line-by-line reading."""
+        path = tmp_path / "phrases.txt"
+        path.write_text("Hello World\r\n\nCafé Olé Society\nLast", encoding="utf-8")
+        args = ["-i", str(path), "--format", "csv"]
+        plain = self.runner.invoke(main, args)
+        mapped = self.runner.invoke(main, [*args, "--mmap", "--workers", "2"])
+        assert plain.exit_code == mapped.exit_code == 0
+        assert mapped.output == plain.output
+
+    def test_cli_mmap_stdin_falls_back(self):
+        """Test --mmap reads stdin line by line."""
+        result = self.runner.invoke(
+            main, ["-i", "-", "--mmap"], input="Hello World\nFoo Bar\n"
+        )
+        assert result.exit_code == 0
+        assert result.output == "HW\nFB\n"
+
+    def test_cli_stop_words_file(self, tmp_path):
+        """Test --stop-words adds single and multi-word entries to the defaults."""
+        stop_list = tmp_path / "stop.txt"
+        stop_list.write_text("# domain list\nin order to\nsteps\n", encoding="utf-8")
+        result = self.runner.invoke(
+            main, ["The Steps In Order To Win", "--stop-words", str(stop_list)]
+        )
+        assert result.exit_code == 0
+        assert result.output.strip() == "W"
+
+        phrases = tmp_path / "phrases.txt"
+        phrases.write_text("Steps In Order To Win\nA Plan in order to Grow\n")
+        result = self.runner.invoke(
+            main,
+            ["-i", str(phrases), "--stop-words", str(stop_list), "--workers", "2"],
+        )
+        assert result.exit_code == 0
+        assert result.output.splitlines() == ["W", "PG"]
+
+    def test_cli_normalize(self, tmp_path, monkeypatch):
+        """Test --normalize and the policy options that imply it."""
+        phrase = "State-of-the-Art Ｄａｔａ Café"
+        result = self.runner.invoke(main, [phrase])
+        assert result.stdout.strip() == "SＤC"
+        result = self.runner.invoke(main, [phrase, "--normalize"])
+        assert result.stdout.strip() == "SADC"
+        result = self.runner.invoke(main, [phrase, "--hyphens", "join"])
+        assert result.stdout.strip() == "SDC"
+        result = self.runner.invoke(
+            main, ["Café Über", "--strip-accents", "--format", "json"]
+        )
+        assert json.loads(result.stdout)["acronym"] == "CU"
+        result = self.runner.invoke(main, ["基盤工程", "--cjk", "split"])
+        assert result.exit_code == 1
+        result = self.runner.invoke(
+            main, ["基盤工程", "--cjk", "split", "--min-length", "1"]
+        )
+        assert result.stdout.strip() == "基盤工程"
+
+        # Results cached without a normalizer are not reused with one
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        self.runner.invoke(main, [phrase, "--cache"])
+        result = self.runner.invoke(main, [phrase, "--cache", "--normalize"])
+        assert result.stdout.strip() == "SADC"
+
+        phrases = tmp_path / "phrases.txt"
+        phrases.write_text("rock’n’roll e-mail\nＡＰＩ Gateway\n", encoding="utf-8")
+        result = self.runner.invoke(
+            main,
+            ["-i", str(phrases), "--apostrophes", "split", "--workers", "2"],
+        )
+        assert result.stdout.splitlines() == ["RRM", "AG"]
+
+    def test_cli_normalize_stop_words(self, tmp_path):
+        """Test --stop-words entries are split like --normalize splits phrases."""
+        stop_list = tmp_path / "stop.txt"
+        stop_list.write_text("state-of-the-art\n", encoding="utf-8")
+        phrase = "State-of-the-Art Data Platform"
+        for args in ([], ["--normalize"], ["--hyphens", "join"]):
+            result = self.runner.invoke(
+                main, [phrase, "--stop-words", str(stop_list), *args]
+            )
+            assert result.stdout.strip() == "DP"
+
+    def test_cli_transform_stop_words(self, tmp_path):
+        """Test transform honours --stop-words."""
+        stop_list = tmp_path / "stop.txt"
+        stop_list.write_text("with respect to\n", encoding="utf-8")
+        source, destination = tmp_path / "in.csv", tmp_path / "out.csv"
+        source.write_text("title\nRules with respect to Tax Law\n", encoding="utf-8")
+        result = self.runner.invoke(
+            main,
+            [
+                "transform",
+                str(source),
+                str(destination),
+                "-c",
+                "title",
+                "--stop-words",
+                str(stop_list),
+            ],
+        )
+        assert result.exit_code == 0
+        rows = list(csv.reader(destination.open(encoding="utf-8")))
+        assert rows[1] == ["Rules with respect to Tax Law", "RTL"]
+
+    def test_cli_transform_syllable_model(self, tmp_path):
+        """Test transform selects the syllable model and validates its options."""
+        source, destination = tmp_path / "in.csv", tmp_path / "out.csv"
+        source.write_text("title\nProgramming Basket\n", encoding="utf-8")
+        args = ["transform", str(source), str(destination), "-c", "title"]
+        result = self.runner.invoke(
+            main,
+            [*args, "--strategy", "syllable", "--syllable-model", "vowel"],
+        )
+        assert result.exit_code == 0
+        rows = list(csv.reader(destination.open(encoding="utf-8")))
+        assert rows[1] == ["Programming Basket", "PROBAS"]
+
+        result = self.runner.invoke(main, [*args, "--syllable-model", "vowel"])
+        assert result.exit_code == 2
+        result = self.runner.invoke(
+            main, [*args, "--strategy", "syllable", "--syllable-model", "pattern"]
+        )
+        assert result.exit_code == 2
+        assert "patterns file" in result.output
+
+    def test_cli_creative(self, tmp_path, monkeypatch):
+        """Test the creative command ranks dictionary words first."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        words = tmp_path / "words.txt"
+        words.write_text("laser\n", encoding="utf-8")
+        phrase = "Light Amplification by Stimulated Emission of Radiation"
+        result = self.runner.invoke(
+            main, ["creative", phrase, "-d", str(words), "--top", "2"]
+        )
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert len(lines) == 2
+        assert lines[0].split() == ["LASER", "4.80", "(word)"]
+
+        result = self.runner.invoke(
+            main, ["creative", phrase, "-d", str(words), "--format", "json"]
+        )
+        assert json.loads(result.output)[0]["is_word"] is True
+
+        result = self.runner.invoke(main, ["creative", "!!!"])
+        assert result.exit_code == 1
+
+    def test_cli_creative_stop_words(self, tmp_path, monkeypatch):
+        """Test creative may skip the words listed with --stop-words."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        stop_list = tmp_path / "stop.txt"
+        stop_list.write_text("special\n", encoding="utf-8")
+        args = ["creative", "Light Amplification Special Emission", "--top", "3"]
+        args += ["--format", "json"]
+        result = self.runner.invoke(main, args)
+        assert "LAE" not in [item["acronym"] for item in json.loads(result.output)]
+        result = self.runner.invoke(main, args + ["--stop-words", str(stop_list)])
+        assert "LAE" in [item["acronym"] for item in json.loads(result.output)]
+
+    def test_cli_assign(self, tmp_path):
+        """Test assign issues unique acronyms and updates the registry."""
+        registry = tmp_path / "registry.tsv"
+        registry.write_text("DP\n", encoding="utf-8")
+        result = self.runner.invoke(
+            main,
+            ["assign", "--registry", str(registry), "--update-registry"],
+            input="Data Platform\nData Pipeline\n\nData Platform\n",
+        )
+        assert result.exit_code == 0
+        assert result.output.splitlines() == ["DAP", "DAPI", "", "DAP"]
+        assert registry.read_text(encoding="utf-8").splitlines() == [
+            "DP",
+            "DAP\tData Platform",
+            "DAPI\tData Pipeline",
+        ]
+
+        result = self.runner.invoke(
+            main,
+            ["assign", "--registry", str(registry), "--format", "json"],
+            input="Data Platform\nDeep Purple\n",
+        )
+        assert [json.loads(line) for line in result.output.splitlines()] == [
+            {"name": "Data Platform", "acronym": "DAP", "strategy": "registry"},
+            {"name": "Deep Purple", "acronym": "DEP", "strategy": "letters"},
+        ]
+
+        result = self.runner.invoke(main, ["assign", "--update-registry"], input="")
+        assert result.exit_code == 2
+
+    def test_cli_index(self, tmp_path):
+        """Test index build, add, lookup and info share one index file."""
+        index = str(tmp_path / "reverse.sqlite3")
+        corpus = tmp_path / "corpus.txt"
+        corpus.write_text(
+            "Application Programming Interface\nData Privacy\n\nData Platform\n",
+            encoding="utf-8",
+        )
+        result = self.runner.invoke(main, ["index", "build", str(corpus), "-x", index])
+        assert result.exit_code == 0
+        assert "Added 3 postings" in result.stderr
+
+        result = self.runner.invoke(main, ["index", "lookup", "dp", "-x", index])
+        assert result.exit_code == 0
+        assert result.output.splitlines() == ["Data Platform", "Data Privacy"]
+
+        more = tmp_path / "more.txt"
+        more.write_text("Data Privacy\nDeep Purple Sky\n", encoding="utf-8")
+        result = self.runner.invoke(main, ["index", "add", str(more), "-x", index])
+        assert result.exit_code == 0
+        assert "Added 1 postings; 4 postings for 3 acronyms" in result.stderr
+
+        result = self.runner.invoke(
+            main, ["index", "lookup", "D", "--prefix", "--limit", "2", "-x", index]
+        )
+        assert result.output.splitlines() == [
+            "DP\tData Platform",
+            "DP\tData Privacy",
+        ]
+        result = self.runner.invoke(
+            main, ["index", "lookup", "api", "--format", "json", "-x", index]
+        )
+        assert json.loads(result.output) == {
+            "acronym": "API",
+            "phrase": "Application Programming Interface",
+        }
+
+        result = self.runner.invoke(main, ["index", "info", "-x", index])
+        assert "Postings: 4" in result.output
+        assert "Acronyms: 3" in result.output
+
+        result = self.runner.invoke(main, ["index", "lookup", "ZZ", "-x", index])
+        assert result.exit_code == 1
+        assert "No indexed phrases" in result.stderr
+
+    def test_cli_index_missing(self, tmp_path):
+        """Test commands other than build refuse a missing index."""
+        index = tmp_path / "reverse.sqlite3"
+        corpus = tmp_path / "corpus.txt"
+        corpus.write_text("Data Privacy\n", encoding="utf-8")
+        for args in (
+            ["index", "lookup", "DP"],
+            ["index", "info"],
+            ["index", "add", str(corpus)],
+        ):
+            result = self.runner.invoke(main, args + ["-x", str(index)])
+            assert result.exit_code == 2
+            assert "No reverse index" in result.stderr
+            assert "acronymcreator index build" in result.stderr
+            assert not index.exists()
+
+    def test_cli_index_settings(self, tmp_path, monkeypatch):
+        """Test the index keeps its build settings and honours the env var."""
+        index = tmp_path / "reverse.sqlite3"
+        monkeypatch.setenv("ACRONYMCREATOR_INDEX", str(index))
+        corpus = tmp_path / "corpus.txt"
+        corpus.write_text("Data of Record Keeping\n", encoding="utf-8")
+        stop_words = tmp_path / "stop.txt"
+        stop_words.write_text("record\n", encoding="utf-8")
+        result = self.runner.invoke(
+            main,
+            ["index", "build", str(corpus), "--max-words", "3"]
+            + ["--stop-words", str(stop_words)],
+        )
+        assert result.exit_code == 0
+        assert index.exists()
+
+        more = tmp_path / "more.txt"
+        more.write_text("Record Store Keeper Tools\n", encoding="utf-8")
+        self.runner.invoke(main, ["index", "add", str(more)])
+        result = self.runner.invoke(main, ["index", "lookup", "", "--prefix"])
+        assert result.output.splitlines() == [
+            "DK\tData of Record Keeping",
+            "SKT\tRecord Store Keeper Tools",
+        ]
+
+        # Rebuilding replaces the index and its settings
+        result = self.runner.invoke(main, ["index", "build", str(corpus)])
+        assert result.exit_code == 0
+        result = self.runner.invoke(main, ["index", "lookup", "DRK"])
+        assert result.output.splitlines() == ["Data of Record Keeping"]
+
+    def test_cli_watch_once(self, tmp_path):
+        """Test watch --once reports changes and writes the acronym file."""
+        phrases = tmp_path / "phrases.txt"
+        phrases.write_text("Data Platform\nHello World\n", encoding="utf-8")
+        state = str(tmp_path / "state")
+        output = tmp_path / "acronyms.txt"
+        args = ["watch", str(phrases), "--once", "--state", state, "-o", str(output)]
+        result = self.runner.invoke(main, args)
+        assert result.exit_code == 0
+        assert result.stdout.splitlines() == [
+            "+1\tDP\tData Platform",
+            "+2\tHW\tHello World",
+        ]
+        assert "2 changes, 2 of 2 lines recomputed" in result.stderr
+        assert output.read_text(encoding="utf-8") == "DP\nHW\n"
+
+        phrases.write_text("Hello Big World\nNew Thing\n", encoding="utf-8")
+        result = self.runner.invoke(main, args + ["--format", "json"])
+        assert [json.loads(line) for line in result.stdout.splitlines()] == [
+            {
+                "change": "changed",
+                "line": 1,
+                "acronym": "HBW",
+                "phrase": "Hello Big World",
+                "old_acronym": "DP",
+            },
+            {
+                "change": "changed",
+                "line": 2,
+                "acronym": "NT",
+                "phrase": "New Thing",
+                "old_acronym": "HW",
+            },
+        ]
+        output.unlink()
+        result = self.runner.invoke(main, args)
+        assert result.stdout == ""
+        assert output.read_text(encoding="utf-8") == "HBW\nNT\n"
+
+    def test_cli_watch(self, tmp_path, monkeypatch):
+        """Test watch polls the file until interrupted."""
+        phrases = tmp_path / "phrases.txt"
+        phrases.write_text("Data Platform\n", encoding="utf-8")
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) == 1:
+                phrases.write_text("Data Platform\nDeep Purple\n", encoding="utf-8")
+            elif len(sleeps) == 3:
+                raise KeyboardInterrupt
+
+        monkeypatch.setattr("src.acronymcreator.cli.time.sleep", sleep)
+        args = ["watch", str(phrases), "--state", str(tmp_path / "state")]
+        result = self.runner.invoke(main, args + ["--interval", "0.5"])
+        assert result.exit_code == 0
+        assert result.stdout.splitlines() == [
+            "+1\tDP\tData Platform",
+            "+2\tDP\tDeep Purple",
+        ]
+        assert sleeps == [0.5, 0.5, 0.5]
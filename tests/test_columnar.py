@@ -0,0 +1,143 @@
+"""
+Tests for the columnar bulk API.
+"""
+
+import pytest
+
+from src.acronymcreator.columnar import acronym_column
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+
+PHRASES = [
+    "Application Programming Interface",
+    None,
+    "",
+    "Hello World",
+    "a an the",
+    "Application Programming Interface",
+    float("nan"),
+]
+EXPECTED = ["API", "", "", "HW", "", "API", ""]
+
+
+class TestAcronymColumn:
+    """Test cases for acronym_column with plain sequences."""
+
+    def test_matches_scalar_api(self):
+        """Test results match create_basic_acronym row by row."""
+        creator = AcronymCreator()
+        options = AcronymOptions(max_words=2, force_uppercase=False)
+        phrases = ["Portable Document Format", "The Quick Brown Fox", "x"]
+        assert acronym_column(phrases, options) == [
+            creator.create_basic_acronym(phrase, options) for phrase in phrases
+        ]
+
+    def test_nulls_and_empty_strings(self):
+        """Test nulls, empty strings and duplicates keep their rows."""
+        assert acronym_column(PHRASES) == EXPECTED
+
+    def test_any_iterable(self):
+        """Test tuples and generators are accepted."""
+        assert acronym_column(tuple(PHRASES)) == EXPECTED
+        assert acronym_column(iter(PHRASES)) == EXPECTED
+
+    def test_each_distinct_phrase_computed_once(self):
+        """Test repeated values are only processed once."""
+
+        class CountingCreator(AcronymCreator):
+            def create_basic_acronym_many(self, phrases, options):
+                self.seen = list(phrases)
+                return super().create_basic_acronym_many(self.seen, options)
+
+        creator = CountingCreator()
+        result = acronym_column(["Ab Cd", "Ef Gh", "Ab Cd"] * 100, creator=creator)
+        assert result == ["AC", "EG", "AC"] * 100
+        assert creator.seen == ["Ab Cd", "Ef Gh"]
+
+    def test_syllable_strategy(self):
+        """Test the syllable strategy matches create_syllable_acronym."""
+        assert acronym_column(["Hello World", None], strategy="syllable") == [
+            "HELWOR",
+            "",
+        ]
+
+    def test_unknown_strategy(self):
+        """Test unsupported strategies are rejected."""
+        with pytest.raises(ValueError, match="Unknown strategy"):
+            acronym_column(["Hello World"], strategy="multiple")
+
+    def test_rejects_non_string_values(self):
+        """Test non-string values raise TypeError."""
+        with pytest.raises(TypeError, match="not int"):
+            acronym_column(["Hello World", 3])
+
+    def test_rejects_single_string(self):
+        """Test a bare string is not treated as a column of characters."""
+        with pytest.raises(TypeError):
+            acronym_column("Hello World")
+
+
+class TestNumpyColumn:
+    """Test cases for acronym_column with NumPy arrays."""
+
+    def setup_method(self):
+        """Skip when NumPy is not installed."""
+        self.np = pytest.importorskip("numpy")
+
+    def test_object_array(self):
+        """Test object arrays with nulls return an object array."""
+        result = acronym_column(self.np.array(PHRASES, dtype=object))
+        assert isinstance(result, self.np.ndarray)
+        assert result.dtype == object
+        assert result.tolist() == EXPECTED
+
+    def test_string_array(self):
+        """Test fixed-width string arrays return a string array."""
+        phrases = ["Hello World", "", "Quick Brown Fox", "Hello World"]
+        result = acronym_column(self.np.array(phrases))
+        assert result.dtype.kind == "U"
+        assert result.tolist() == ["HW", "", "QBF", "HW"]
+
+    def test_empty_string_array(self):
+        """Test an empty array gives an empty result."""
+        assert acronym_column(self.np.array([], dtype=str)).tolist() == []
+
+    def test_rejects_numeric_and_2d_arrays(self):
+        """Test unsupported arrays are rejected."""
+        with pytest.raises(TypeError):
+            acronym_column(self.np.arange(3))
+        with pytest.raises(ValueError):
+            acronym_column(self.np.array([["A B"], ["C D"]]))
+
+
+class TestArrowColumn:
+    """Test cases for acronym_column with pyarrow arrays."""
+
+    def setup_method(self):
+        """Skip when pyarrow is not installed."""
+        self.pa = pytest.importorskip("pyarrow")
+
+    def test_string_array_with_nulls(self):
+        """Test Arrow nulls become empty strings."""
+        phrases = ["Hello World", None, "", "Hello World", "a an the"]
+        result = acronym_column(self.pa.array(phrases))
+        assert result.type == self.pa.string()
+        assert result.null_count == 0
+        assert result.to_pylist() == ["HW", "", "", "HW", ""]
+
+    def test_large_string_array(self):
+        """Test large_string arrays are accepted."""
+        values = self.pa.array(["Hello World"], type=self.pa.large_string())
+        assert acronym_column(values).to_pylist() == ["HW"]
+
+    def test_chunked_array(self):
+        """Test chunked arrays keep their chunking."""
+        values = self.pa.chunked_array([["Hello World", None], ["Quick Brown Fox"]])
+        result = acronym_column(values, AcronymOptions(force_uppercase=False))
+        assert isinstance(result, self.pa.ChunkedArray)
+        assert result.num_chunks == 2
+        assert result.to_pylist() == ["hw", "", "qbf"]
+
+    def test_rejects_non_string_array(self):
+        """Test non-string Arrow arrays are rejected."""
+        with pytest.raises(TypeError):
+            acronym_column(self.pa.array([1, 2]))
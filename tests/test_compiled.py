@@ -0,0 +1,103 @@
+"""
+Tests for frozen and compiled acronym options.
+"""
+
+import dataclasses
+
+import pytest
+
+from src.acronymcreator.cache import LRUCache
+from src.acronymcreator.compiled import (
+    CompiledOptions,
+    FrozenAcronymOptions,
+    compile_options,
+    compiled_cache_info,
+)
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+
+
+class TestFrozenAcronymOptions:
+    """Test cases for the FrozenAcronymOptions type."""
+
+    def test_defaults_match_acronym_options(self):
+        """Test frozen defaults match the mutable dataclass."""
+        assert FrozenAcronymOptions() == AcronymOptions().freeze()
+
+    def test_freeze_copies_fields(self):
+        """Test freezing keeps every field value."""
+        options = AcronymOptions(True, 3, 4, False)
+        frozen = options.freeze()
+        assert frozen._asdict() == dataclasses.asdict(options)
+
+    def test_frozen_is_hashable_and_immutable(self):
+        """Test frozen options can be dict keys and cannot be changed."""
+        frozen = FrozenAcronymOptions(max_words=2)
+        assert {frozen: "value"}[FrozenAcronymOptions(max_words=2)] == "value"
+        with pytest.raises(AttributeError):
+            frozen.max_words = 3
+        assert not hasattr(frozen, "__dict__")
+
+    def test_from_options_returns_frozen_unchanged(self):
+        """Test already frozen options are not copied."""
+        frozen = FrozenAcronymOptions()
+        assert FrozenAcronymOptions.from_options(frozen) is frozen
+
+
+class TestCompiledOptions:
+    """Test cases for compiled options."""
+
+    def test_compiled_call_matches_creator(self):
+        """Test calling compiled options gives the basic acronym."""
+        compiled = compile_options(
+            AcronymOptions(max_words=2, force_uppercase=False),
+            AcronymCreator.COMMON_WORDS,
+        )
+        assert compiled("The Quick Brown Fox") == "qb"
+        assert compiled("") == ""
+
+    def test_words_are_truncated(self):
+        """Test compiled words respect max_words."""
+        compiled = CompiledOptions(FrozenAcronymOptions(max_words=2), frozenset())
+        assert compiled.words("One Two Three") == ["One", "Two"]
+
+    def test_compiled_options_are_interned(self):
+        """Test equal options share a single compiled instance."""
+        first = compile_options(AcronymOptions(min_word_length=5), {"the"})
+        hits = compiled_cache_info().hits
+        second = compile_options(FrozenAcronymOptions(min_word_length=5), {"the"})
+        assert first is second
+        assert compiled_cache_info().hits == hits + 1
+
+    def test_creator_compile_uses_common_words(self):
+        """Test AcronymCreator.compile uses the class stop words."""
+        compiled = AcronymCreator().compile(AcronymOptions())
+        assert compiled.tokenizer.stop_words == AcronymCreator.COMMON_WORDS
+        assert compiled("The Quick Brown Fox") == "QBF"
+
+    def test_common_words_stay_customizable(self):
+        """Test changes to the class-level stop words reach new results."""
+        creator = AcronymCreator(cache=LRUCache(8))
+        assert isinstance(AcronymCreator.COMMON_WORDS, set)
+        assert creator.create_basic_acronym("Data Platform", AcronymOptions()) == "DP"
+        AcronymCreator.COMMON_WORDS.add("data")
+        try:
+            assert (
+                creator.create_basic_acronym("Data Platform", AcronymOptions()) == "P"
+            )
+        finally:
+            AcronymCreator.COMMON_WORDS.discard("data")
+        assert creator.create_basic_acronym("Data Platform", AcronymOptions()) == "DP"
+
+    def test_plain_stop_word_set_is_frozen_once(self):
+        """Test a creator freezes a plain stop-word set once, not per call."""
+        creator = AcronymCreator(stop_words={"data", "the"})
+        assert creator.COMMON_WORDS == frozenset({"data", "the"})
+        assert isinstance(creator.COMMON_WORDS, frozenset)
+        compiled = creator.compile(AcronymOptions())
+        hits = compiled_cache_info().hits
+        assert creator.compile(AcronymOptions()) is compiled
+        assert compiled_cache_info().hits == hits + 1
+        assert compiled.tokenizer.stop_words is creator.COMMON_WORDS
+        assert (
+            creator.create_basic_acronym("The Data Platform", AcronymOptions()) == "P"
+        )
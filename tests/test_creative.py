@@ -0,0 +1,97 @@
+"""
+Tests for the creative module.
+"""
+
+import pytest
+from src.acronymcreator.creative import (
+    CreativeSearch,
+    WordIndex,
+    pronounceability,
+)
+
+PHRASE = "Light Amplification by Stimulated Emission of Radiation"
+
+
+class TestWordIndex:
+    """Test cases for the dictionary index."""
+
+    def test_words_and_prefixes(self):
+        """Test words are normalized and every prefix is indexed."""
+        index = WordIndex(["Laser", "it's", "x", "radar", "averyveryverylongword"])
+        assert index.words == frozenset({"laser", "radar"})
+        assert {"l", "la", "las", "lase", "laser", "r"} <= index.prefixes
+        assert "Laser".lower() in index
+        assert len(index) == 2
+
+    def test_disk_cache(self, tmp_path):
+        """Test compiled indexes are reused until the word list changes."""
+        words = tmp_path / "words.txt"
+        words.write_text("laser\nradar\n", encoding="utf-8")
+        cache_dir = tmp_path / "cache"
+        index = WordIndex.from_file(words, cache_dir=cache_dir)
+        (cached,) = cache_dir.iterdir()
+        assert WordIndex.from_file(words, cache_dir=cache_dir).words == index.words
+
+        # A corrupt cache file is rebuilt rather than trusted
+        cached.write_bytes(b"garbage")
+        assert WordIndex.from_file(words, cache_dir=cache_dir).words == index.words
+
+        words.write_text("laser\nradar\nscuba\n", encoding="utf-8")
+        assert "scuba" in WordIndex.from_file(words, cache_dir=cache_dir)
+        assert len(list(cache_dir.iterdir())) == 2
+        assert "scuba" in WordIndex.from_file(words, cache=False)
+
+
+class TestCreativeSearch:
+    """Test cases for the beam search."""
+
+    def test_pronounceability(self):
+        """Test consonant clusters and missing vowels lower the score."""
+        assert pronounceability("laser") == 1.0
+        assert pronounceability("pdf") == 0.0
+        assert pronounceability("pdof") < pronounceability("podf")
+        assert pronounceability("trap") == 1.0
+        assert pronounceability("strap") < 1.0
+
+    def test_finds_dictionary_word(self):
+        """Test a dictionary word is found by skipping stop words."""
+        search = CreativeSearch(WordIndex(["laser", "radar"]))
+        best = search.search(PHRASE, top=3)[0]
+        assert best.acronym == "LASER"
+        assert best.is_word
+        assert best.parts == ("L", "A", "", "S", "E", "", "R")
+
+    def test_choices_and_ranking(self):
+        """Test choices per word and that results are sorted best first."""
+        search = CreativeSearch(max_letters=2)
+        assert search.choices("of") == ["", "o", "of"]
+        assert search.choices("Data") == ["D", "Da"]
+        results = search.search("Customer Relationship Management", top=5)
+        assert len(results) == 5
+        assert [c.score for c in results] == sorted(
+            (c.score for c in results), reverse=True
+        )
+        assert all(len(c.acronym) > 1 for c in results)
+        assert search.search("") == []
+        # Skipping every word leaves nothing, so only "OF" qualifies
+        assert [c.acronym for c in search.search("of")] == ["OF"]
+
+    def test_beam_width_bounds_search(self):
+        """Test a beam of one follows the single best partial acronym."""
+        search = CreativeSearch(beam_width=1)
+        assert len(search.search(PHRASE)) == 1
+
+    def test_time_budget_completes_with_initials(self):
+        """Test an exhausted budget finishes candidates with initials."""
+        ticks = iter(range(100))
+        search = CreativeSearch(time_budget=1.5, clock=lambda: next(ticks))
+        results = search.search("Alpha Beta of Gamma Delta")
+        # Two words are searched before the clock passes the deadline
+        assert all(c.parts[2:] == ("", "G", "D") for c in results)
+
+    def test_invalid_settings(self):
+        """Test invalid search settings raise ValueError."""
+        with pytest.raises(ValueError):
+            CreativeSearch(max_letters=0)
+        with pytest.raises(ValueError):
+            CreativeSearch(beam_width=0)
@@ -0,0 +1,197 @@
+"""
+Tests for the incremental module.
+"""
+
+import os
+import random
+
+import pytest
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+from src.acronymcreator.incremental import (
+    WATCH_DIRNAME,
+    IncrementalFile,
+    LineChange,
+    default_state_path,
+)
+from src.acronymcreator.normalize import Normalizer
+from src.acronymcreator.stopwords import StopWords
+from src.acronymcreator.syllables import HyphenationSyllabifier
+
+
+def write(path, lines):
+    """Rewrite a phrase file, making sure its modification time moves on."""
+    stat = path.stat() if path.exists() else None
+    path.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+    if stat is not None:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def phrases(tmp_path):
+    path = tmp_path / "phrases.txt"
+    write(path, ["Data Platform", "Hello World", "", "Deep Purple"])
+    return path
+
+
+def full_acronyms(lines, options=None):
+    """Compute every acronym from scratch."""
+    creator = AcronymCreator()
+    return [
+        creator.create_basic_acronym(line, options or AcronymOptions())
+        for line in lines
+    ]
+
+
+class TestIncrementalFile:
+    """Test cases for incremental recomputation."""
+
+    def test_first_update(self, phrases, tmp_path):
+        """Test the first update computes and reports every line."""
+        watched = IncrementalFile(phrases, tmp_path / "state")
+        assert watched.update() == [
+            LineChange("added", 1, "DP", "Data Platform"),
+            LineChange("added", 2, "HW", "Hello World"),
+            LineChange("added", 4, "DP", "Deep Purple"),
+        ]
+        assert watched.recomputed == 4
+        assert watched.acronyms == ["DP", "HW", "", "DP"]
+        assert watched.update() == []
+        assert watched.recomputed == 0
+
+    def test_edit_recomputes_changed_lines(self, phrases, tmp_path):
+        """Test only edited and added lines are recomputed after a reload."""
+        state = tmp_path / "state"
+        IncrementalFile(phrases, state).update()
+        write(
+            phrases,
+            ["Data Platform", "Hello Big World", "", "Deep Purple", "Zero Trust"],
+        )
+        watched = IncrementalFile(phrases, state)
+        assert watched.update() == [
+            LineChange("changed", 2, "HBW", "Hello Big World", "HW"),
+            LineChange("added", 5, "ZT", "Zero Trust"),
+        ]
+        assert watched.recomputed == 2
+        assert IncrementalFile(phrases, state).update() == []
+
+    def test_moved_and_removed_lines(self, phrases, tmp_path):
+        """Test moved lines reuse stored acronyms and removals are reported."""
+        state = tmp_path / "state"
+        IncrementalFile(phrases, state).update()
+        write(phrases, ["Hello World", "Data Platform"])
+        watched = IncrementalFile(phrases, state)
+        changes = watched.update()
+        assert watched.recomputed == 0
+        assert watched.acronyms == ["HW", "DP"]
+        assert LineChange("removed", 4, "DP", "Deep Purple") in changes
+        assert all(change.change != "changed" for change in changes)
+
+    def test_settings_change(self, phrases, tmp_path):
+        """Test new settings recompute every line and report what changed."""
+        state = tmp_path / "state"
+        IncrementalFile(phrases, state).update()
+        watched = IncrementalFile(
+            phrases, state, AcronymCreator(stop_words=StopWords(["hello"]))
+        )
+        assert watched.update() == [LineChange("changed", 2, "W", "Hello World", "HW")]
+        assert watched.recomputed == 4
+
+        lower = IncrementalFile(
+            phrases, state, options=AcronymOptions(force_uppercase=False)
+        )
+        assert [change.acronym for change in lower.update()] == ["dp", "hw", "dp"]
+
+        normalized = IncrementalFile(
+            phrases,
+            state,
+            AcronymCreator(normalizer=Normalizer()),
+            AcronymOptions(force_uppercase=False),
+        )
+        assert normalized.update() == []
+        assert normalized.recomputed == 4
+
+    def test_syllable_strategy(self, phrases, tmp_path):
+        """Test the syllable strategy is used for recomputed lines."""
+        watched = IncrementalFile(phrases, tmp_path / "state", strategy="syllable")
+        watched.update()
+        assert watched.acronyms[0] == "DAPL"
+
+    def test_syllabifier_patterns_change(self, phrases, tmp_path):
+        """Test switching hyphenation patterns recomputes every line."""
+        state = tmp_path / "state"
+
+        def watch(patterns):
+            creator = AcronymCreator(syllabifier=HyphenationSyllabifier(patterns))
+            watched = IncrementalFile(phrases, state, creator, strategy="syllable")
+            watched.update()
+            return watched
+
+        assert watch(["1ta"]).acronyms[0] == "DAPLATFORM"
+        watched = watch(["1ta", "1fo"])
+        assert watched.recomputed == 4
+        assert watched.acronyms[0] == "DAPLAT"
+        assert watch(["1fo", "1ta"]).recomputed == 0
+
+    def test_corrupt_state(self, phrases, tmp_path):
+        """Test an unreadable state file starts from scratch."""
+        state = tmp_path / "state"
+        state.write_bytes(b"not a state file")
+        watched = IncrementalFile(phrases, state)
+        assert len(watched.update()) == 3
+
+    def test_default_state_path(self, phrases, tmp_path, monkeypatch):
+        """Test default state files live in the cache directory per file."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        path = default_state_path(phrases)
+        assert path.parent == tmp_path / "cache" / "acronymcreator" / WATCH_DIRNAME
+        assert path != default_state_path(tmp_path / "other.txt")
+        IncrementalFile(phrases).update()
+        assert path.exists()
+
+    def test_blocks(self, tmp_path):
+        """Test edits across small blocks resynchronise on unchanged blocks."""
+        path = tmp_path / "phrases.txt"
+        lines = [f"Phrase Number {word * 2}" for word in "abcdefghijklmnopqrst"]
+        write(path, lines)
+        state = tmp_path / "state"
+        IncrementalFile(path, state, block_lines=2).update()
+
+        edited = list(lines)
+        edited[3] = "Edited Line"
+        edited.insert(9, "Inserted Line")
+        del edited[15]
+        edited.append("Appended Line")
+        write(path, edited)
+        watched = IncrementalFile(path, state, block_lines=2)
+        assert watched.update() == [
+            LineChange("changed", 4, "EL", "Edited Line", "PND"),
+            LineChange("added", 10, "IL", "Inserted Line"),
+            LineChange("removed", 15, "PNO", "Phrase Number oo"),
+            LineChange("added", 21, "AL", "Appended Line"),
+        ]
+        assert watched.recomputed == 3
+        assert watched.acronyms == full_acronyms(edited)
+        assert len(watched) == len(edited)
+
+    def test_random_edits(self, tmp_path):
+        """Test random edits always leave the acronyms of a full recompute."""
+        rng = random.Random(7)
+        words = ["Data", "Platform", "Cloud", "Service", "of", "the", "Api", "x"]
+        path = tmp_path / "phrases.txt"
+        state = tmp_path / "state"
+        lines = []
+        for _ in range(30):
+            for _ in range(rng.randint(1, 6)):
+                index = rng.randint(0, len(lines))
+                phrase = " ".join(rng.choices(words, k=rng.randint(0, 4)))
+                action = rng.choice(["insert", "edit", "delete"])
+                if action == "insert" or not lines:
+                    lines.insert(index, phrase)
+                elif action == "edit":
+                    lines[index % len(lines)] = phrase
+                else:
+                    del lines[index % len(lines)]
+            write(path, lines)
+            watched = IncrementalFile(path, state, block_lines=3)
+            watched.update()
+            assert watched.acronyms == full_acronyms(lines)
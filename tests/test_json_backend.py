@@ -0,0 +1,60 @@
+"""
+Tests for the compact JSON serializer backends.
+"""
+
+import importlib.util
+import json
+import sys
+
+import pytest
+
+from src.acronymcreator.json_backend import BACKENDS, get_backend
+
+RECORD = {
+    "phrase": 'Café Olé "Society"',
+    "acronym": "COS",
+    "options": {"include_articles": False, "max_words": None, "min_word_length": 2},
+}
+
+INSTALLED = [
+    name for name in BACKENDS if name == "json" or importlib.util.find_spec(name)
+]
+
+
+class TestJsonBackend:
+    """Test cases for JSON backend selection."""
+
+    def setup_method(self):
+        """Forget previously loaded backends."""
+        get_backend.cache_clear()
+
+    def teardown_method(self):
+        """Do not leak monkeypatched backends into other tests."""
+        get_backend.cache_clear()
+
+    @pytest.mark.parametrize("name", INSTALLED)
+    def test_backends_agree(self, name):
+        """Test every installed backend produces the same compact bytes."""
+        expected = json.dumps(RECORD, ensure_ascii=False, separators=(",", ":"))
+        assert get_backend(name).dumps(RECORD) == expected.encode("utf-8")
+
+    def test_auto_prefers_fastest_installed(self):
+        """Test auto picks the first installed backend in preference order."""
+        assert get_backend().name == INSTALLED[0]
+
+    def test_auto_falls_back_to_stdlib(self, monkeypatch):
+        """Test auto uses the standard library when nothing else imports."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+        assert get_backend("auto").name == "json"
+
+    def test_missing_backend_raises_import_error(self, monkeypatch):
+        """Test requesting an uninstalled backend raises ImportError."""
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+        with pytest.raises(ImportError):
+            get_backend("msgspec")
+
+    def test_unknown_backend(self):
+        """Test unknown backend names are rejected."""
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            get_backend("simplejson")
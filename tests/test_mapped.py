@@ -0,0 +1,70 @@
+"""
+Tests for the memory-mapped phrase reader.
+"""
+
+import io
+
+import pytest
+
+from src.acronymcreator.batch import iter_phrases
+from src.acronymcreator.mapped import MappedPhraseFile
+
+CONTENTS = [
+    "Hello World\nThe Quick Brown Fox\n",
+    "No trailing newline\nLast",
+    "\n\nBlank lines\n\n",
+    "Windows\r\nLine Endings\r\n",
+    "Ünïcödé Wörds\n日本語 テキスト\nCafé Olé\n",
+    "single",
+]
+
+
+def write(tmp_path, text):
+    """Write text as UTF-8 bytes and return the path."""
+    path = tmp_path / "phrases.txt"
+    path.write_bytes(text.encode("utf-8"))
+    return path
+
+
+def text_mode_phrases(text):
+    """Phrases as read by the line-by-line text path."""
+    stream = io.TextIOWrapper(io.BytesIO(text.encode("utf-8")), encoding="utf-8")
+    return list(iter_phrases([stream]))
+
+
+class TestMappedPhraseFile:
+    """Test cases for the MappedPhraseFile class."""
+
+    @pytest.mark.parametrize("text", CONTENTS)
+    def test_phrases_match_text_mode(self, tmp_path, text):
+        """Test the whole file decodes to the same phrases as text I/O."""
+        with MappedPhraseFile(write(tmp_path, text)) as mapped:
+            assert mapped.phrases() == text_mode_phrases(text)
+
+    @pytest.mark.parametrize("text", CONTENTS)
+    @pytest.mark.parametrize("range_bytes", [1, 3, 7, 1000])
+    def test_ranges_split_on_line_boundaries(self, tmp_path, text, range_bytes):
+        """Test ranges are contiguous, end on newlines and keep every phrase."""
+        with MappedPhraseFile(write(tmp_path, text)) as mapped:
+            ranges = list(mapped.ranges(range_bytes))
+            assert ranges[0][0] == 0
+            assert ranges[-1][1] == mapped.size
+            data = text.encode("utf-8")
+            for (_, end), (start, _) in zip(ranges, ranges[1:]):
+                assert end == start
+                assert data[end - 1 : end] == b"\n"
+            phrases = [p for start, end in ranges for p in mapped.phrases(start, end)]
+            assert phrases == text_mode_phrases(text)
+
+    def test_empty_file(self, tmp_path):
+        """Test an empty file has no ranges and no phrases."""
+        with MappedPhraseFile(write(tmp_path, "")) as mapped:
+            assert mapped.size == 0
+            assert list(mapped.ranges()) == []
+            assert mapped.phrases() == []
+
+    def test_invalid_range_size(self, tmp_path):
+        """Test range sizes must be positive."""
+        with MappedPhraseFile(write(tmp_path, "a\n")) as mapped:
+            with pytest.raises(ValueError):
+                list(mapped.ranges(0))
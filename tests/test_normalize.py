@@ -0,0 +1,166 @@
+"""
+Tests for the normalize module.
+"""
+
+import pickle
+
+import pytest
+from src.acronymcreator.compiled import compile_options
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+from src.acronymcreator.normalize import Normalizer
+from src.acronymcreator.parallel import ParallelAcronymEngine
+from src.acronymcreator.stopwords import StopWords
+from src.acronymcreator.tokenizer import NormalizingPhraseTokenizer
+
+
+class TestNormalizer:
+    """Test cases for the Normalizer class."""
+
+    def test_compatibility_folding(self):
+        """Test NFKC folds full-width letters and ligatures."""
+        normalize = Normalizer()
+        assert normalize("ＡＰＩ ﬁnance ①") == "API finance 1"
+        assert Normalizer(form="none")("ＡＰＩ") == "ＡＰＩ"
+
+    def test_composed_and_decomposed_accents_agree(self):
+        """Test precomposed and combining accents normalize the same way."""
+        composed, decomposed = "Caf\u00e9", "Cafe\u0301"
+        assert Normalizer()(composed) == Normalizer()(decomposed) == "Café"
+        assert Normalizer(form="NFD")(composed) == decomposed
+
+    def test_strip_accents(self):
+        """Test accent stripping removes diacritics in any form."""
+        for form in ("NFKC", "NFC", "NFKD", "NFD", "none"):
+            normalize = Normalizer(form=form, strip_accents=True)
+            assert normalize("Ångström résumé Café") == "Angstrom resume Cafe"
+
+    def test_strip_accents_keeps_letter_marks(self):
+        """Test marks that belong to the letter are not stripped."""
+        normalize = Normalizer(strip_accents=True)
+        assert normalize("नमस्ते") == "नमस्ते"
+        assert normalize("デ") == "デ"
+
+    def test_hyphen_policies(self):
+        """Test dashes and underscores split or join words."""
+        phrase = "state-of-the-art e‑mail snake_case a—b"
+        assert Normalizer()(phrase).split() == [
+            "state",
+            "of",
+            "the",
+            "art",
+            "e",
+            "mail",
+            "snake",
+            "case",
+            "a",
+            "b",
+        ]
+        assert Normalizer(hyphens="join")(phrase).split() == [
+            "stateoftheart",
+            "email",
+            "snakecase",
+            "ab",
+        ]
+
+    def test_apostrophe_policies(self):
+        """Test straight and curly apostrophes split or join words."""
+        phrase = "don't O’Brien rock`n`roll"
+        assert Normalizer()(phrase) == "dont OBrien rocknroll"
+        assert Normalizer(apostrophes="split")(phrase).split() == [
+            "don",
+            "t",
+            "O",
+            "Brien",
+            "rock",
+            "n",
+            "roll",
+        ]
+
+    def test_punctuation(self):
+        """Test punctuation is removed and full-width punctuation splits words."""
+        normalize = Normalizer()
+        assert normalize("U.S.A. «Hello», world!") == "USA Hello world"
+        assert normalize("データ、基盤。工程").split() == ["データ", "基盤", "工程"]
+        assert normalize("zero\u200bwidth soft\u00adhyphen") == "zero width softhyphen"
+
+    def test_cjk_split(self):
+        """Test Han ideographs become one word each while kana runs stay whole."""
+        assert Normalizer()("データ基盤").split() == ["データ基盤"]
+        assert Normalizer(cjk="split")("データ基盤").split() == ["データ", "基", "盤"]
+
+    def test_invalid_policy(self):
+        """Test unknown policies are rejected."""
+        with pytest.raises(ValueError, match="hyphen policy"):
+            Normalizer(hyphens="keep")
+        with pytest.raises(ValueError, match="normalization form"):
+            Normalizer(form="nfkc")
+
+    def test_value_semantics(self):
+        """Test normalizers compare, hash and pickle by their policies."""
+        normalizer = Normalizer(strip_accents=True, cjk="split")
+        assert normalizer == Normalizer(strip_accents=True, cjk="split")
+        assert normalizer != Normalizer()
+        assert hash(normalizer) == hash(Normalizer(strip_accents=True, cjk="split"))
+        assert pickle.loads(pickle.dumps(normalizer)) == normalizer
+        assert eval(repr(normalizer)) == normalizer
+
+    def test_normalize_many(self):
+        """Test the batch API matches normalizing each phrase."""
+        normalize = Normalizer(strip_accents=True)
+        phrases = ["Café-Bar", "plain ascii", ""]
+        assert list(normalize.normalize_many(phrases)) == [
+            normalize(phrase) for phrase in phrases
+        ]
+
+
+class TestNormalizedCreator:
+    """Test cases for AcronymCreator with a normalizer attached."""
+
+    def setup_method(self):
+        """Set up a creator that strips accents."""
+        self.creator = AcronymCreator(normalizer=Normalizer(strip_accents=True))
+        self.options = AcronymOptions()
+
+    def test_default_is_unchanged(self):
+        """Test a creator without a normalizer keeps the original cleaning."""
+        creator = AcronymCreator()
+        assert creator.normalizer is None
+        assert creator.create_basic_acronym("state-of-the-art", self.options) == "S"
+        assert creator.clean_phrase("state-of-the-art") == "stateoftheart"
+
+    def test_strategies(self):
+        """Test every strategy sees the normalized words."""
+        phrase = "Über-fast ｄａｔａ"
+        assert self.creator.extract_words(phrase, self.options) == [
+            "Uber",
+            "fast",
+            "data",
+        ]
+        assert self.creator.create_basic_acronym(phrase, self.options) == "UFD"
+        assert self.creator.create_syllable_acronym(phrase, self.options) == "UBFADA"
+        assert self.creator.generate_multiple_options(phrase)["basic"] == ["UFD"]
+        assert self.creator.clean_phrase("  Über—fast  ") == "Uber fast"
+
+    def test_split_words_meet_stop_words(self):
+        """Test words split out by the normalizer are filtered as stop words."""
+        phrase = "state-of-the-art in-order-to win"
+        assert self.creator.create_basic_acronym(phrase, self.options) == "SAOW"
+        creator = AcronymCreator(
+            stop_words=StopWords([*AcronymCreator.COMMON_WORDS, "in order to"]),
+            normalizer=Normalizer(),
+        )
+        assert isinstance(creator.tokenizer(self.options), NormalizingPhraseTokenizer)
+        assert creator.create_basic_acronym(phrase, self.options) == "SAW"
+
+    def test_compiled_cache_key(self):
+        """Test compiled options are shared per normalizer."""
+        words = AcronymCreator.COMMON_WORDS
+        compiled = compile_options(self.options, words, Normalizer())
+        assert compile_options(self.options, words, Normalizer()) is compiled
+        assert compile_options(self.options, words) is not compiled
+
+    def test_parallel_engine(self):
+        """Test the normalizer travels to worker processes."""
+        phrases = ["Café-Bar", "Ｄａｔａ Platform"] * 3
+        engine = ParallelAcronymEngine(workers=2, chunk_size=2, creator=self.creator)
+        assert list(engine.map(phrases, self.options)) == ["CB", "DP"] * 3
@@ -0,0 +1,120 @@
+"""
+Tests for the multiprocess batch engine.
+"""
+
+import pytest
+
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+from src.acronymcreator.parallel import ParallelAcronymEngine
+
+PHRASES = [
+    "The Quick Brown Fox",
+    "Application Programming Interface",
+    "",
+    "Hello, World! How are you?",
+    "A Big Red Car",
+    "One Two Three Four Five",
+    "Portable Document Format",
+] * 5
+
+
+class NoStopWords(AcronymCreator):
+    """Creator without stop words, defined at module level to be picklable."""
+
+    COMMON_WORDS = set()
+
+
+class TestParallelAcronymEngine:
+    """Test cases for the ParallelAcronymEngine class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.options = AcronymOptions(max_words=3)
+        self.expected = list(
+            AcronymCreator().create_basic_acronym_many(PHRASES, self.options)
+        )
+
+    def test_map_serial_matches_batch_api(self):
+        """Test a single worker matches the serial batch API."""
+        engine = ParallelAcronymEngine(workers=1, chunk_size=4)
+        assert list(engine.map(PHRASES, self.options)) == self.expected
+
+    def test_map_multiprocess_preserves_order(self):
+        """Test the process pool returns results in input order."""
+        engine = ParallelAcronymEngine(workers=2, chunk_size=3, max_pending=2)
+        assert list(engine.map(iter(PHRASES), self.options)) == self.expected
+
+    def test_map_unordered_returns_every_index(self):
+        """Test unordered mode yields each input index exactly once."""
+        engine = ParallelAcronymEngine(workers=2, chunk_size=4)
+        results = dict(engine.map_unordered(PHRASES, self.options))
+        assert [results[index] for index in range(len(PHRASES))] == self.expected
+
+    def test_chunks_include_input_phrases(self):
+        """Test chunks carry their start index and source phrases."""
+        engine = ParallelAcronymEngine(workers=1, chunk_size=10)
+        chunks = list(engine.chunks(PHRASES, self.options))
+        assert [start for start, _, _ in chunks] == [0, 10, 20, 30]
+        assert [phrase for _, chunk, _ in chunks for phrase in chunk] == PHRASES
+
+    def test_empty_input(self):
+        """Test an empty corpus yields nothing."""
+        engine = ParallelAcronymEngine(workers=2)
+        assert list(engine.map([], self.options)) == []
+
+    def test_uses_given_creator(self):
+        """Test workers use the configured creator's stop words."""
+        engine = ParallelAcronymEngine(workers=2, chunk_size=1, creator=NoStopWords())
+        result = list(engine.map(["The Quick Brown Fox"], AcronymOptions()))
+        assert result == ["TQBF"]
+
+    def test_invalid_settings(self):
+        """Test invalid worker and chunk settings are rejected."""
+        with pytest.raises(ValueError):
+            ParallelAcronymEngine(workers=0)
+        with pytest.raises(ValueError):
+            ParallelAcronymEngine(chunk_size=0)
+        with pytest.raises(ValueError):
+            ParallelAcronymEngine(strategy="multiple")
+
+    def test_syllable_strategy(self):
+        """Test the syllable strategy matches the scalar API in workers."""
+        creator = AcronymCreator()
+        expected = [
+            creator.create_syllable_acronym(phrase, self.options) for phrase in PHRASES
+        ]
+        engine = ParallelAcronymEngine(workers=2, chunk_size=4, strategy="syllable")
+        assert list(engine.map(PHRASES, self.options)) == expected
+
+    def test_process_chunks_keeps_caller_boundaries(self):
+        """Test pre-chunked input keeps its chunks and start indexes."""
+        engine = ParallelAcronymEngine(workers=2, chunk_size=100)
+        chunks = [PHRASES[:3], PHRASES[3:4], PHRASES[4:]]
+        results = list(engine.process_chunks(iter(chunks), self.options))
+        assert [(start, chunk) for start, chunk, _ in results] == [
+            (0, chunks[0]),
+            (3, chunks[1]),
+            (4, chunks[2]),
+        ]
+        assert [a for _, _, acronyms in results for a in acronyms] == self.expected
+
+    def test_file_chunks_match_map(self, tmp_path):
+        """Test memory-mapped input gives the same results with any workers."""
+        path = tmp_path / "phrases.txt"
+        path.write_text("\n".join(PHRASES) + "\n", encoding="utf-8")
+        for workers in (1, 2):
+            engine = ParallelAcronymEngine(workers=workers)
+            chunks = list(engine.file_chunks(path, self.options, range_bytes=50))
+            assert len(chunks) > 1
+            assert [p for _, phrases, _ in chunks for p in phrases] == PHRASES
+            assert list(engine.map_file(path, self.options)) == self.expected
+
+    def test_file_chunks_unordered(self, tmp_path):
+        """Test unordered file chunks are keyed by byte offset."""
+        path = tmp_path / "phrases.txt"
+        path.write_text("\n".join(PHRASES), encoding="utf-8")
+        engine = ParallelAcronymEngine(workers=2)
+        chunks = sorted(
+            engine.file_chunks(path, self.options, ordered=False, range_bytes=40)
+        )
+        assert [a for _, _, acronyms in chunks for a in acronyms] == self.expected
@@ -0,0 +1,73 @@
+"""
+Tests for the persistent on-disk cache.
+"""
+
+import pytest
+
+from src.acronymcreator.persistent import PersistentCache, default_cache_path
+
+
+class TestPersistentCache:
+    """Test cases for the PersistentCache class."""
+
+    def test_default_path_uses_xdg_cache_home(self, tmp_path, monkeypatch):
+        """Test the default location honours XDG_CACHE_HOME."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_path() == tmp_path / "acronymcreator" / "results.sqlite3"
+
+    def test_default_path_falls_back_to_home(self, tmp_path, monkeypatch):
+        """Test the default location falls back to ~/.cache."""
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert default_cache_path().parent == tmp_path / ".cache" / "acronymcreator"
+
+    def test_round_trip_across_instances(self, tmp_path):
+        """Test values survive reopening the cache file."""
+        path = tmp_path / "cache.sqlite3"
+        with PersistentCache(path) as cache:
+            assert cache.get("Hello World", "text") is None
+            cache.put("Hello World", "text", "HW")
+        with PersistentCache(path) as cache:
+            assert cache.get("Hello World", "text") == "HW"
+            assert cache.get("Hello World", "json") is None
+
+    def test_entries_are_versioned(self, tmp_path):
+        """Test entries from another tool version are ignored and compacted."""
+        path = tmp_path / "cache.sqlite3"
+        with PersistentCache(path, version="0.0.1") as old:
+            old.put("Hello World", "text", "HW")
+        with PersistentCache(path, version="0.0.2") as cache:
+            assert cache.get("Hello World", "text") is None
+            assert cache.compact() == 1
+            assert len(cache) == 0
+
+    def test_size_limit_drops_oldest(self, tmp_path):
+        """Test the oldest entries are removed beyond max_entries."""
+        with PersistentCache(tmp_path / "c.sqlite3", max_entries=2) as cache:
+            for phrase in ["one", "two", "three"]:
+                cache.put(phrase, "text", phrase.upper())
+            assert len(cache) == 2
+            assert cache.get("one", "text") is None
+            assert cache.get("three", "text") == "THREE"
+
+    def test_compact_applies_new_limit(self, tmp_path):
+        """Test compaction trims to the configured size."""
+        path = tmp_path / "cache.sqlite3"
+        with PersistentCache(path) as cache:
+            for phrase in ["one", "two", "three"]:
+                cache.put(phrase, "text", phrase.upper())
+        with PersistentCache(path, max_entries=1) as cache:
+            assert cache.compact() == 2
+            assert cache.get("three", "text") == "THREE"
+
+    def test_clear(self, tmp_path):
+        """Test clear removes everything."""
+        with PersistentCache(tmp_path / "cache.sqlite3") as cache:
+            cache.put("Hello World", "text", "HW")
+            cache.clear()
+            assert len(cache) == 0
+
+    def test_invalid_limit(self, tmp_path):
+        """Test a non-positive size limit is rejected."""
+        with pytest.raises(ValueError):
+            PersistentCache(tmp_path / "cache.sqlite3", max_entries=0)
@@ -0,0 +1,203 @@
+"""
+Tests for the opt-in profiling hooks.
+"""
+
+import pickle
+import threading
+
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+from src.acronymcreator.normalize import Normalizer
+from src.acronymcreator.profiling import (
+    InstrumentedCompiledOptions,
+    Profiler,
+    ProfileSnapshot,
+    StageStats,
+)
+from src.acronymcreator.stopwords import StopWords
+
+
+class FakeClock:
+    """Clock that advances one second per reading."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+
+class TestProfiler:
+    """Test cases for the Profiler class."""
+
+    def test_nested_stages_are_exclusive(self):
+        """Test time in a nested stage is not counted for its parent."""
+        profiler = Profiler(clock=FakeClock())
+        with profiler.stage("outer"):
+            with profiler.stage("inner"):
+                pass
+        snapshot = profiler.snapshot()
+        assert snapshot.stages["inner"] == StageStats(calls=1, seconds=1.0)
+        assert snapshot.stages["outer"] == StageStats(calls=1, seconds=2.0)
+        assert snapshot.total_seconds == 3.0
+
+    def test_stage_records_on_exception(self):
+        """Test a stage is recorded even when its block raises."""
+        profiler = Profiler()
+        try:
+            with profiler.stage("failing"):
+                raise ValueError
+        except ValueError:
+            pass
+        assert profiler.snapshot().stages["failing"].calls == 1
+
+    def test_counters_and_reset(self):
+        """Test counters accumulate and reset clears everything."""
+        profiler = Profiler()
+        profiler.count("phrases")
+        profiler.add_counts({"phrases": 2, "skipped": 0})
+        assert profiler.snapshot().counters == {"phrases": 3}
+        profiler.reset()
+        assert profiler.snapshot() == ProfileSnapshot(stages={}, counters={})
+
+    def test_snapshot_is_a_copy(self):
+        """Test later activity does not change an earlier snapshot."""
+        profiler = Profiler()
+        profiler.count("phrases")
+        snapshot = profiler.snapshot()
+        profiler.count("phrases")
+        assert snapshot.counters["phrases"] == 1
+
+    def test_threads_keep_separate_stacks(self):
+        """Test concurrent stages are all recorded."""
+        profiler = Profiler()
+
+        def work():
+            for _ in range(100):
+                with profiler.stage("outer"):
+                    with profiler.stage("inner"):
+                        pass
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stages = profiler.snapshot().stages
+        assert stages["outer"].calls == stages["inner"].calls == 400
+
+    def test_format(self):
+        """Test the text breakdown lists stages and counters."""
+        profiler = Profiler(clock=FakeClock())
+        with profiler.stage("tokenize"):
+            pass
+        profiler.count("phrases", 5)
+        text = profiler.snapshot().format()
+        assert "tokenize" in text
+        assert "100%" in text
+        assert "phrases" in text
+
+    def test_pickles_to_none(self):
+        """Test a profiler is not carried into other processes."""
+        assert pickle.loads(pickle.dumps(Profiler())) is None
+
+
+class TestProfiledCreator:
+    """Test cases for AcronymCreator with a profiler attached."""
+
+    def setup_method(self):
+        """Set up a profiled creator."""
+        self.profiler = Profiler()
+        self.creator = AcronymCreator(profiler=self.profiler)
+        self.options = AcronymOptions()
+
+    def test_results_unchanged(self):
+        """Test profiling does not change any result."""
+        plain = AcronymCreator()
+        phrases = ["The Quick Brown Fox", "Hello, World!", "a an the", ""]
+        for phrase in phrases:
+            assert self.creator.create_basic_acronym(
+                phrase, self.options
+            ) == plain.create_basic_acronym(phrase, self.options)
+            assert self.creator.create_syllable_acronym(
+                phrase, self.options
+            ) == plain.create_syllable_acronym(phrase, self.options)
+            assert self.creator.extract_words(
+                phrase, self.options
+            ) == plain.extract_words(phrase, self.options)
+            assert self.creator.clean_phrase(phrase) == plain.clean_phrase(phrase)
+            assert self.creator.generate_multiple_options(
+                phrase
+            ) == plain.generate_multiple_options(phrase)
+
+    def test_word_counters(self):
+        """Test kept and dropped words are counted by reason."""
+        self.creator.extract_words("The quick, brown fox of x !!", self.options)
+        assert self.profiler.snapshot().counters == {
+            "phrases": 1,
+            "words.kept": 3,
+            "words.dropped.stop_word": 2,
+            "words.dropped.length": 1,
+            "words.dropped.punctuation": 1,
+        }
+
+    def test_stages_per_strategy(self):
+        """Test each strategy records its own stage."""
+        self.creator.create_basic_acronym("Hello World", self.options)
+        self.creator.create_syllable_acronym("Hello World", self.options)
+        self.creator.generate_multiple_options("Hello World")
+        self.creator.clean_phrase("Hello World")
+        stages = self.profiler.snapshot().stages
+        assert stages["tokenize"].calls == 3
+        assert {"acronym", "syllable", "multiple", "clean"} <= set(stages)
+
+    def test_multiple_options_with_stop_phrases(self):
+        """Test the phrase-aware pass of multiple options is profiled."""
+        stop_words = StopWords([*AcronymCreator.COMMON_WORDS, "in order to"])
+        creator = AcronymCreator(profiler=self.profiler, stop_words=stop_words)
+        phrase = "Steps in order to Win"
+        assert creator.generate_multiple_options(phrase) == AcronymCreator(
+            stop_words=stop_words
+        ).generate_multiple_options(phrase)
+        snapshot = self.profiler.snapshot()
+        assert snapshot.stages["tokenize"].calls == 2
+        assert snapshot.counters["words.dropped.stop_phrase"] == 3
+
+    def test_batch_api_is_instrumented(self):
+        """Test the batch API goes through the instrumented path."""
+        phrases = ["Hello World", "Quick Brown Fox"]
+        result = list(self.creator.create_basic_acronym_many(phrases, self.options))
+        assert result == ["HW", "QBF"]
+        assert self.profiler.snapshot().stages["acronym"].calls == 2
+
+    def test_instrumented_compile_is_reused(self):
+        """Test compiled options are instrumented once per option set."""
+        compiled = self.creator.compile(self.options)
+        assert isinstance(compiled, InstrumentedCompiledOptions)
+        assert self.creator.compile(AcronymOptions()) is compiled
+
+    def test_disabled_by_default(self):
+        """Test a creator without a profiler uses the plain compiled options."""
+        compiled = AcronymCreator().compile(self.options)
+        assert not isinstance(compiled, InstrumentedCompiledOptions)
+
+    def test_normalize_stage(self):
+        """Test a normalizer is timed as its own stage and keeps its results."""
+        creator = AcronymCreator(profiler=self.profiler, normalizer=Normalizer())
+        plain = AcronymCreator(normalizer=Normalizer())
+        for phrase in ["state-of-the-art", "Ｄａｔａ, Platform!"]:
+            assert creator.create_basic_acronym(
+                phrase, self.options
+            ) == plain.create_basic_acronym(phrase, self.options)
+            assert creator.generate_multiple_options(
+                phrase
+            ) == plain.generate_multiple_options(phrase)
+        stages = self.profiler.snapshot().stages
+        assert stages["normalize"].calls == stages["tokenize"].calls == 4
+        assert creator.compile(self.options) is not self.creator.compile(self.options)
+
+    def test_pickled_creator_is_uninstrumented(self):
+        """Test a creator sent to a worker process runs without profiling."""
+        copy = pickle.loads(pickle.dumps(self.creator))
+        assert copy.profiler is None
+        assert copy.create_basic_acronym("Hello World", self.options) == "HW"
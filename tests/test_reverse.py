@@ -0,0 +1,178 @@
+"""
+Tests for the reverse module.
+"""
+
+import pytest
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+from src.acronymcreator.normalize import Normalizer
+from src.acronymcreator.parallel import ParallelAcronymEngine
+from src.acronymcreator.reverse import INDEX_FILENAME, ReverseIndex, default_index_path
+from src.acronymcreator.stopwords import StopWords
+
+PHRASES = [
+    "Application Programming Interface",
+    "Advanced Packaging Institute",
+    "Data Privacy",
+    "Digital Platform",
+    "Data Pipeline Builder",
+    "",
+    "the of",
+]
+
+
+class TestReverseIndex:
+    """Test cases for the reverse lookup index."""
+
+    def test_lookup(self, tmp_path):
+        """Test exact lookups are case-insensitive and sorted."""
+        with ReverseIndex(tmp_path / "index.sqlite3") as index:
+            assert index.add(PHRASES) == 5
+            assert index.lookup("api") == [
+                "Advanced Packaging Institute",
+                "Application Programming Interface",
+            ]
+            assert index.lookup("DP", limit=1) == ["Data Privacy"]
+            assert index.lookup("XYZ") == []
+            assert len(index) == 5
+            assert index.acronym_count() == 3
+
+    def test_prefix(self, tmp_path):
+        """Test prefix lookups scan acronyms in order."""
+        with ReverseIndex(tmp_path / "index.sqlite3") as index:
+            index.add(PHRASES)
+            assert index.prefix("d") == [
+                ("DP", "Data Privacy"),
+                ("DP", "Digital Platform"),
+                ("DPB", "Data Pipeline Builder"),
+            ]
+            assert index.prefix("DPB") == [("DPB", "Data Pipeline Builder")]
+            assert index.prefix("A", limit=1) == [
+                ("API", "Advanced Packaging Institute")
+            ]
+            assert index.prefix("Q") == []
+
+    def test_incremental_add(self, tmp_path):
+        """Test adding to a reopened index skips postings already present."""
+        path = tmp_path / "index.sqlite3"
+        with ReverseIndex(path) as index:
+            index.add(PHRASES[:2])
+        with ReverseIndex(path) as index:
+            assert index.add(PHRASES) == 3
+            assert index.add(PHRASES) == 0
+            assert len(index) == 5
+
+    def test_settings_persist(self, tmp_path):
+        """Test options, strategy and stop words are stored with the index."""
+        path = tmp_path / "index.sqlite3"
+        options = AcronymOptions(max_words=3, force_uppercase=False)
+        creator = AcronymCreator(stop_words=StopWords(["data"]))
+        with ReverseIndex(path, options, "syllable", creator) as index:
+            index.add(["Data Platform Team"])
+        with ReverseIndex(path) as index:
+            assert index.strategy == "syllable"
+            assert index.options == options.freeze()
+            assert index.creator.COMMON_WORDS == StopWords(["data"])
+            index.add(["Data Pipeline"])
+            assert index.lookup("PIP") == ["Data Pipeline"]
+            assert index.prefix("") == [
+                ("PIP", "Data Pipeline"),
+                ("PLTE", "Data Platform Team"),
+            ]
+
+    def test_normalizer_persists(self, tmp_path):
+        """Test the creator's normalizer is stored with the index."""
+        path = tmp_path / "index.sqlite3"
+        normalizer = Normalizer(strip_accents=True, hyphens="join")
+        creator = AcronymCreator(normalizer=normalizer)
+        with ReverseIndex(path, creator=creator) as index:
+            index.add(["Café-Bar Ｄａｔａ"])
+        with ReverseIndex(path) as index:
+            assert index.creator.normalizer == normalizer
+            index.add(["Über-cool Ｄａｔａ"])
+            assert index.lookup("CD") == ["Café-Bar Ｄａｔａ"]
+            assert index.lookup("UD") == ["Über-cool Ｄａｔａ"]
+
+    def test_settings_mismatch(self, tmp_path):
+        """Test reopening with different settings is rejected."""
+        path = tmp_path / "index.sqlite3"
+        ReverseIndex(path).close()
+        with pytest.raises(ValueError, match="was built with"):
+            ReverseIndex(path, options=AcronymOptions(max_words=2))
+        with pytest.raises(ValueError, match="syllable"):
+            ReverseIndex(path, strategy="syllable")
+        with pytest.raises(ValueError, match="Unknown strategy"):
+            ReverseIndex(path, strategy="creative")
+        # The same settings passed explicitly are accepted
+        ReverseIndex(path, AcronymOptions(), "basic").close()
+
+    def test_creator_mismatch(self, tmp_path):
+        """Test reopening with a creator of different settings is rejected."""
+        path = tmp_path / "index.sqlite3"
+        creator = AcronymCreator(
+            stop_words=StopWords(["data"]), normalizer=Normalizer()
+        )
+        with ReverseIndex(path, creator=creator) as index:
+            index.add(["Data Platform"])
+        with pytest.raises(ValueError, match="different stop words"):
+            ReverseIndex(path, creator=AcronymCreator(normalizer=Normalizer()))
+        with pytest.raises(ValueError, match="normalizer"):
+            ReverseIndex(path, creator=AcronymCreator(stop_words=StopWords(["data"])))
+        with pytest.raises(ValueError, match="normalizer"):
+            ReverseIndex(
+                path,
+                creator=AcronymCreator(
+                    stop_words={"data"}, normalizer=Normalizer(hyphens="join")
+                ),
+            )
+        # A creator with the same settings is accepted
+        same = AcronymCreator(stop_words={"data"}, normalizer=Normalizer())
+        with ReverseIndex(path, creator=same) as index:
+            assert index.add(["Data Pipeline"]) == 1
+        with pytest.raises(ValueError, match="different stop words"):
+            ReverseIndex(tmp_path / "new.sqlite3").close()
+            ReverseIndex(tmp_path / "new.sqlite3", creator=creator)
+
+    def test_open_existing_only(self, tmp_path):
+        """Test read-only and read-write modes never create an index."""
+        path = tmp_path / "missing" / "index.sqlite3"
+        for mode in ("ro", "rw"):
+            with pytest.raises(FileNotFoundError, match="No reverse index"):
+                ReverseIndex(path, mode=mode)
+        assert not path.parent.exists()
+
+        path = tmp_path / "index.sqlite3"
+        with ReverseIndex(path) as index:
+            index.add(PHRASES)
+        with ReverseIndex(path, mode="ro") as index:
+            assert index.lookup("DP") == ["Data Privacy", "Digital Platform"]
+        with ReverseIndex(path, mode="rw") as index:
+            assert index.add(["Deep Purple"]) == 1
+
+        other = tmp_path / "other.sqlite3"
+        other.write_bytes(b"")
+        with pytest.raises(ValueError, match="not a reverse index"):
+            ReverseIndex(other, mode="ro")
+        with pytest.raises(ValueError, match="Unknown mode"):
+            ReverseIndex(path, mode="w")
+
+    def test_parallel_engine(self, tmp_path):
+        """Test a multi-process engine indexes the same postings."""
+        with ReverseIndex(tmp_path / "index.sqlite3") as index:
+            engine = ParallelAcronymEngine(2, chunk_size=2, creator=index.creator)
+            assert index.add(PHRASES * 3, engine) == 5
+            assert index.lookup("DPB") == ["Data Pipeline Builder"]
+
+    def test_clear(self, tmp_path):
+        """Test clearing removes postings but keeps the settings."""
+        path = tmp_path / "index.sqlite3"
+        with ReverseIndex(path, strategy="syllable") as index:
+            index.add(PHRASES)
+            index.clear()
+            assert len(index) == 0
+        with ReverseIndex(path) as index:
+            assert index.strategy == "syllable"
+
+    def test_default_path(self, tmp_path, monkeypatch):
+        """Test the default index lives in the XDG cache directory."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_index_path() == tmp_path / "acronymcreator" / INDEX_FILENAME
@@ -0,0 +1,161 @@
+"""
+Tests for the acronym daemon and its client.
+"""
+
+import socket
+import threading
+
+import pytest
+
+from src.acronymcreator.server import (
+    AcronymServer,
+    AcronymService,
+    default_socket_path,
+    send_request,
+)
+
+
+@pytest.fixture
+def server(tmp_path):
+    """Run a daemon on a temporary socket for the duration of a test."""
+    daemon = AcronymServer(tmp_path / "daemon.sock")
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    yield daemon
+    daemon.shutdown()
+    daemon.server_close()
+    thread.join()
+
+
+class TestAcronymService:
+    """Test cases for request handling."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.service = AcronymService()
+
+    def test_basic_request(self):
+        """Test a basic request with default options."""
+        assert self.service.handle({"phrase": "Hello World"}) == {"acronym": "HW"}
+
+    def test_request_options(self):
+        """Test options are applied."""
+        response = self.service.handle(
+            {
+                "phrase": "The Quick Brown Fox",
+                "options": {"include_articles": True, "force_uppercase": False},
+            }
+        )
+        assert response == {"acronym": "tqbf"}
+
+    def test_syllable_and_multiple_strategies(self):
+        """Test the other strategies."""
+        syllable = self.service.handle(
+            {"phrase": "Hello World", "strategy": "syllable"}
+        )
+        assert syllable == {"acronym": "HELWOR"}
+        multiple = self.service.handle(
+            {"phrase": "The Quick Brown Fox", "strategy": "multiple"}
+        )
+        assert multiple["results"]["basic"] == ["QBF"]
+
+    def test_invalid_requests(self):
+        """Test malformed requests produce error responses."""
+        assert "error" in self.service.handle({})
+        assert "error" in self.service.handle({"phrase": "x", "options": {"bad": 1}})
+        assert "error" in self.service.handle({"phrase": "x", "strategy": "nope"})
+        assert b"invalid JSON" in self.service.handle_line(b"{not json")
+        assert b"JSON object" in self.service.handle_line(b"[1, 2]")
+
+    def test_malformed_option_values(self):
+        """Test options of the wrong type produce error responses."""
+        for options, message in [
+            ({"min_word_length": "x"}, "option 'min_word_length' must be int"),
+            ({"min_word_length": True}, "option 'min_word_length' must be int"),
+            ({"max_words": [1]}, "option 'max_words' must be int or null"),
+            ({"include_articles": 1}, "option 'include_articles' must be bool"),
+            ([1], "'options' must be a JSON object"),
+        ]:
+            response = self.service.handle(
+                {"phrase": "Hello World", "options": options}
+            )
+            assert response == {"error": f"invalid options: {message}"}
+        assert self.service.handle(
+            {"phrase": "Hello World", "options": {"max_words": None}}
+        ) == {"acronym": "HW"}
+
+    def test_unexpected_errors_are_answered(self, monkeypatch):
+        """Test a failure inside generation becomes an error response."""
+
+        def fail(phrase, options):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(self.service.creator, "create_basic_acronym", fail)
+        response = self.service.handle_line(b'{"phrase": "Hello World"}')
+        assert response == b'{"error": "RuntimeError: boom"}\n'
+
+
+class TestAcronymServer:
+    """Test cases for the socket server and client."""
+
+    def test_round_trip(self, server):
+        """Test a client request is answered by the daemon."""
+        response = send_request({"phrase": "Portable Document Format"}, server.path)
+        assert response == {"acronym": "PDF"}
+
+    def test_repeated_requests_hit_cache(self, server):
+        """Test the daemon keeps results warm between requests."""
+        for _ in range(3):
+            send_request({"phrase": "Hello World"}, server.path)
+        assert server.service.creator.cache.stats().hits == 2
+
+    def test_connection_survives_bad_options(self, server):
+        """Test a malformed request does not drop the connection."""
+        import socket
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(server.path))
+            client.sendall(
+                b'{"phrase": "Hello World", "options": {"max_words": [1]}}\n'
+                b'{"phrase": "Hello World"}\n'
+            )
+            with client.makefile("rb") as responses:
+                assert b"error" in responses.readline()
+                assert responses.readline() == b'{"acronym": "HW"}\n'
+
+    def test_missing_daemon_raises_oserror(self, tmp_path):
+        """Test the client raises OSError when nothing is listening."""
+        with pytest.raises(OSError):
+            send_request({"phrase": "Hello World"}, tmp_path / "missing.sock")
+
+    def test_stale_socket_is_replaced(self, tmp_path):
+        """Test a leftover socket file does not block a new daemon."""
+        path = tmp_path / "stale.sock"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(str(path))
+        daemon = AcronymServer(path)
+        daemon.server_close()
+        assert not path.exists()
+
+    def test_regular_file_is_kept(self, tmp_path):
+        """Test a file that is not a socket is never deleted."""
+        path = tmp_path / "notes.txt"
+        path.write_text("keep me")
+        with pytest.raises(OSError, match="not a socket"):
+            AcronymServer(path)
+        assert path.read_text() == "keep me"
+
+    def test_refuses_second_daemon(self, server):
+        """Test a second daemon cannot take over a live socket."""
+        with pytest.raises(OSError, match="already listening"):
+            AcronymServer(server.path)
+
+    def test_default_socket_path(self, tmp_path, monkeypatch):
+        """Test the socket path environment overrides."""
+        monkeypatch.setenv("ACRONYMCREATOR_SOCKET", str(tmp_path / "a.sock"))
+        assert default_socket_path() == tmp_path / "a.sock"
+        monkeypatch.delenv("ACRONYMCREATOR_SOCKET")
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        assert default_socket_path() == tmp_path / "acronymcreator.sock"
+        monkeypatch.delenv("XDG_RUNTIME_DIR")
+        assert default_socket_path().name.startswith("acronymcreator-")
@@ -0,0 +1,73 @@
+"""
+Start-up time budget tests for the acronymcreator entry point.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+# Budgets are generous so slow CI machines pass; override them to tighten
+IMPORT_BUDGET_MS = float(os.environ.get("ACRONYMCREATOR_IMPORT_BUDGET_MS", "500"))
+STARTUP_BUDGET_MS = float(os.environ.get("ACRONYMCREATOR_STARTUP_BUDGET_MS", "2000"))
+
+# Modules only some runs need; importing any of them eagerly is a regression
+LAZY_MODULES = [
+    "csv",
+    "json",
+    "yaml",
+    "tomli_w",
+    "sqlite3",
+    "multiprocessing",
+    "concurrent.futures.process",
+    "cProfile",
+    "orjson",
+    "msgspec",
+]
+
+
+def run_python(*args):
+    """Run the interpreter with the package source on the path."""
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    return subprocess.run(
+        [sys.executable, *args], env=env, capture_output=True, text=True, check=True
+    )
+
+
+def import_times():
+    """Return {module: cumulative microseconds} from ``-X importtime``."""
+    result = run_python("-X", "importtime", "-c", "import acronymcreator.cli")
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestStartup:
+    """Test cases for CLI start-up cost."""
+
+    def test_heavy_modules_are_lazy(self):
+        """Test importing the CLI does not load formatter or pool modules."""
+        times = import_times()
+        assert "acronymcreator.cli" in times
+        eager = [module for module in LAZY_MODULES if module in times]
+        assert eager == []
+
+    def test_import_within_budget(self):
+        """Test the CLI module imports within the time budget."""
+        cumulative_ms = import_times()["acronymcreator.cli"] / 1000
+        assert cumulative_ms < IMPORT_BUDGET_MS
+
+    def test_entry_point_within_budget(self):
+        """Test a full text-format run finishes within the time budget."""
+        start = time.perf_counter()
+        result = run_python("-m", "acronymcreator.cli", "Hello World")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        assert result.stdout.strip() == "HW"
+        assert elapsed_ms < STARTUP_BUDGET_MS
@@ -0,0 +1,110 @@
+"""
+Tests for the stopwords module.
+"""
+
+import pickle
+
+from src.acronymcreator.compiled import compile_options
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+from src.acronymcreator.normalize import Normalizer
+from src.acronymcreator.profiling import Profiler
+from src.acronymcreator.stopwords import StopWords, read_stop_words
+from src.acronymcreator.tokenizer import PhraseTokenizer, Tokenizer
+
+
+class TestStopWords:
+    """Test cases for the StopWords dictionary."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.stop_words = StopWords(
+            ["The", "of", "In Order To", "with respect to", "a number of", "order"]
+        )
+
+    def test_entries_are_normalized(self):
+        """Test entries are lowercased, cleaned and split by word count."""
+        assert self.stop_words.words == frozenset({"the", "of", "order"})
+        assert ("in", "order", "to") in self.stop_words.phrases
+        assert len(self.stop_words) == 6
+        assert "in order, to" in self.stop_words
+        assert "THE" in self.stop_words
+        assert "order to" not in self.stop_words
+        assert 3 not in self.stop_words
+
+    def test_equality_and_hash_include_phrases(self):
+        """Test dictionaries differing only in phrases are distinct keys."""
+        other = StopWords(["the", "of", "order"])
+        assert other != self.stop_words
+        assert other == frozenset({"the", "of", "order"})
+        assert hash(StopWords(["a b"])) == hash(StopWords(["A  B"]))
+        assert StopWords(["x"]).fingerprint == StopWords(["X", "x"]).fingerprint
+
+    def test_read_stop_words(self, tmp_path):
+        """Test files skip comments and blank lines."""
+        path = tmp_path / "stop.txt"
+        path.write_text("# header\n\nin order to  # phrase\nfoo\n", encoding="utf-8")
+        assert read_stop_words(path) == ["in order to", "foo"]
+        loaded = StopWords.from_files([path], base=["the"])
+        assert loaded == StopWords(["the", "in order to", "foo"])
+
+    def test_tokenizer_selection(self):
+        """Test only dictionaries with phrases get the phrase tokenizer."""
+        options = AcronymOptions()
+        phrases = compile_options(options, self.stop_words).tokenizer
+        assert type(phrases) is PhraseTokenizer
+        single = compile_options(options, StopWords(["the"])).tokenizer
+        assert type(single) is Tokenizer
+        articles = AcronymOptions(include_articles=True)
+        assert type(compile_options(articles, self.stop_words).tokenizer) is Tokenizer
+
+    def test_longest_match_and_min_length(self):
+        """Test the longest entry wins and short words inside phrases match."""
+        creator = AcronymCreator(stop_words=self.stop_words)
+        options = AcronymOptions()
+        words = creator.extract_words("A number of Steps in order to Win", options)
+        assert words == ["Steps", "Win"]
+        # "order" alone is a single stop word; "in" is not a stop word here
+        assert creator.extract_words("Rules in order", options) == ["Rules", "in"]
+        assert creator.extract_words("in order to", options) == []
+        assert creator.create_basic_acronym("Law, with respect to: Tax", options) == (
+            "LT"
+        )
+
+    def test_multiple_options_use_phrases(self):
+        """Test the strategy engine drops stop phrases from filtered variants."""
+        creator = AcronymCreator(stop_words=self.stop_words)
+        result = creator.generate_multiple_options("Steps in order to Win")
+        assert result["basic"] == ["SW"]
+        assert result["with_articles"] == ["SIOTW"]
+
+    def test_profiled_counts(self):
+        """Test profiling counts words dropped inside stop phrases."""
+        profiler = Profiler()
+        creator = AcronymCreator(profiler=profiler, stop_words=self.stop_words)
+        assert creator.create_basic_acronym("Steps in order to Win", AcronymOptions())
+        counters = profiler.snapshot().counters
+        assert counters["words.dropped.stop_phrase"] == 3
+        assert counters["words.kept"] == 2
+
+    def test_entries_split_by_normalizer(self):
+        """Test entries are split into words by the creator's normalizer."""
+        stop_words = StopWords(["state-of-the-art", "e-mail"])
+        assert stop_words.words == frozenset({"stateoftheart", "email"})
+        creator = AcronymCreator(stop_words=stop_words, normalizer=Normalizer())
+        assert ("state", "of", "the", "art") in creator.COMMON_WORDS.phrases
+        assert "State-of-the-Art" in creator.COMMON_WORDS
+        phrase = "State-of-the-Art e-mail Data Platform"
+        assert creator.create_basic_acronym(phrase, AcronymOptions()) == "DP"
+        assert creator.generate_multiple_options(phrase)["basic"] == ["DP"]
+        joined = AcronymCreator(
+            stop_words=stop_words, normalizer=Normalizer(hyphens="join")
+        )
+        assert joined.create_basic_acronym(phrase, AcronymOptions()) == "DP"
+        assert stop_words.with_normalizer(None) is stop_words
+
+    def test_pickles_with_creator(self):
+        """Test creators with custom stop words survive pickling for workers."""
+        creator = AcronymCreator(stop_words=self.stop_words)
+        clone = pickle.loads(pickle.dumps(creator))
+        assert clone.COMMON_WORDS == self.stop_words
+        assert clone.create_basic_acronym("in order to Win", AcronymOptions()) == "W"
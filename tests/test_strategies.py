@@ -0,0 +1,88 @@
+"""
+Tests for the shared-tokenization strategy engine.
+"""
+
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+from src.acronymcreator.strategies import (
+    MultiStrategyEngine,
+    first_syllable,
+    initials,
+    syllables,
+)
+
+PHRASES = [
+    "The Quick Brown Fox",
+    "One Two Three Four Five",
+    "Python Programming Language",
+    "Apple Orange",
+    "a an the",
+    "",
+    "   ",
+    "!!!",
+    "Point of Sale",
+    "Go To It",
+]
+
+
+def independent_options(creator, phrase):
+    """Reference result built from one tokenization per strategy."""
+    basic = creator.create_basic_acronym(phrase, AcronymOptions())
+    with_articles = creator.create_basic_acronym(
+        phrase, AcronymOptions(include_articles=True)
+    )
+    creative = []
+    if basic:
+        lowercase = creator.create_basic_acronym(
+            phrase, AcronymOptions(force_uppercase=False)
+        )
+        if lowercase.lower() != basic.lower():
+            creative.append(lowercase)
+        limited = creator.create_basic_acronym(phrase, AcronymOptions(max_words=3))
+        if limited and limited != basic:
+            creative.append(limited)
+    syllable = creator.create_syllable_acronym(phrase, AcronymOptions())
+    return {
+        "basic": [basic] if basic else [],
+        "with_articles": [with_articles] if with_articles else [],
+        "creative": creative,
+        "syllable": [syllable] if syllable else [],
+    }
+
+
+class TestStrategies:
+    """Test cases for strategy helpers and MultiStrategyEngine."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.creator = AcronymCreator()
+        self.engine = MultiStrategyEngine(AcronymCreator.COMMON_WORDS)
+
+    def test_first_syllable_rules(self):
+        """Test the leading syllable rules for each word length."""
+        assert first_syllable("Go") == "Go"
+        assert first_syllable("Code") == "Co"
+        assert first_syllable("Apple") == "App"
+        assert first_syllable("Hello") == "Hel"
+        assert first_syllable("Strong") == "St"
+
+    def test_initials_and_syllables(self):
+        """Test joining initials and syllables of a word list."""
+        assert initials(["Quick", "Brown"]) == "QB"
+        assert syllables(["Python", "Code"]) == "PyCo"
+
+    def test_generate_matches_independent_strategies(self):
+        """Test shared tokenization gives the same dict as separate runs."""
+        for phrase in PHRASES:
+            expected = independent_options(self.creator, phrase)
+            assert self.engine.generate(phrase) == expected
+            assert self.creator.generate_multiple_options(phrase) == expected
+
+    def test_generate_many(self):
+        """Test batch generation yields one dict per phrase."""
+        results = list(self.creator.generate_multiple_options_many(PHRASES))
+        assert results == [self.engine.generate(phrase) for phrase in PHRASES]
+
+    def test_limited_variant(self):
+        """Test the limited variant keeps the first three words."""
+        result = self.engine.generate("One Two Three Four Five")
+        assert result["creative"] == ["OTT"]
@@ -0,0 +1,146 @@
+"""
+Tests for the syllables module.
+"""
+
+import pickle
+
+import pytest
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+from src.acronymcreator.syllables import (
+    HyphenationSyllabifier,
+    VowelGroupSyllabifier,
+    get_syllabifier,
+    parse_pattern,
+    read_patterns,
+)
+
+# Liang's example patterns for "hyphenation" (The TeXbook, appendix H)
+PATTERNS = ["hy3ph", "he2n", "hena4", "hen5at", "1na", "n2at", "1tio", "2io", "o2n"]
+
+
+class TestVowelGroupSyllabifier:
+    """Test cases for vowel-group segmentation."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.syllabifier = VowelGroupSyllabifier()
+
+    @pytest.mark.parametrize(
+        "word, expected",
+        [
+            ("program", ["pro", "gram"]),
+            ("basket", ["bas", "ket"]),
+            ("abstract", ["ab", "stract"]),
+            ("table", ["ta", "ble"]),
+            ("make", ["make"]),
+            ("happy", ["hap", "py"]),
+            ("yes", ["yes"]),
+            ("rhythm", ["rhythm"]),
+            ("Customer", ["Cus", "to", "mer"]),
+            ("a", ["a"]),
+        ],
+    )
+    def test_syllables(self, word, expected):
+        """Test words split around vowel groups, preserving case."""
+        assert self.syllabifier.syllables(word) == expected
+
+    def test_first_count(self):
+        """Test the leading syllable count, falling back to the whole word."""
+        assert self.syllabifier.first("Programming") == "Pro"
+        two = VowelGroupSyllabifier(count=2)
+        assert two.first("Programming") == "Program"
+        assert two.first("Fox") == "Fox"
+        with pytest.raises(ValueError):
+            VowelGroupSyllabifier(count=0)
+
+    def test_words_are_cached(self):
+        """Test repeated words are syllabified once."""
+        self.syllabifier.join(["Data", "Data", "Platform", "Data"])
+        info = self.syllabifier.cache_info()
+        assert (info.hits, info.misses) == (2, 2)
+
+    def test_pickle_resets_cache(self):
+        """Test syllabifiers pickle for workers with an empty cache."""
+        self.syllabifier.first("Data")
+        clone = pickle.loads(pickle.dumps(self.syllabifier))
+        assert clone.cache_info().currsize == 0
+        assert clone.first("Data") == "Da"
+
+
+class TestHyphenationSyllabifier:
+    """Test cases for Liang hyphenation patterns."""
+
+    def test_parse_pattern(self):
+        """Test patterns split into letters and inter-letter values."""
+        assert parse_pattern("hen5at") == ("henat", (0, 0, 0, 5, 0, 0))
+        assert parse_pattern(".ach4") == (".ach", (0, 0, 0, 0, 4))
+
+    def test_hyphenation_example(self):
+        """Test the classic example splits as hy-phen-ation."""
+        syllabifier = HyphenationSyllabifier(PATTERNS)
+        assert syllabifier.syllables("Hyphenation") == ["Hy", "phen", "ation"]
+        assert syllabifier.first("Hyphenation") == "Hy"
+        assert HyphenationSyllabifier(PATTERNS, count=2).first("hyphenation") == (
+            "hyphen"
+        )
+
+    def test_edge_minimums_and_exceptions(self):
+        """Test no breaks near word edges and exceptions override patterns."""
+        syllabifier = HyphenationSyllabifier(["1b"], exceptions=["ab-ba"])
+        # Breaks before the first and last "b" are too close to an edge
+        assert syllabifier.syllables("abab") == ["abab"]
+        assert syllabifier.syllables("abbab") == ["ab", "bab"]
+        assert syllabifier.syllables("abba") == ["ab", "ba"]
+        assert HyphenationSyllabifier(["1b"], left_min=3).syllables("abbab") == [
+            "abbab"
+        ]
+
+    def test_key_identifies_patterns(self):
+        """Test the key changes with the patterns but not their order."""
+        key = HyphenationSyllabifier(PATTERNS).key
+        assert HyphenationSyllabifier(PATTERNS[::-1]).key == key
+        assert HyphenationSyllabifier(PATTERNS[:-1]).key != key
+        assert HyphenationSyllabifier(PATTERNS, ["ta-ble"]).key != key
+        assert HyphenationSyllabifier(PATTERNS, count=2).key != key
+        assert VowelGroupSyllabifier().key == ("VowelGroupSyllabifier", 1)
+
+    def test_read_tex_file(self, tmp_path):
+        """Test TeX pattern files with comments and exception blocks."""
+        path = tmp_path / "hyph.tex"
+        path.write_text(
+            "% patterns\n\\patterns{\n" + "\n".join(PATTERNS) + "\n}\n"
+            "\\hyphenation{ta-ble}\n",
+            encoding="utf-8",
+        )
+        assert read_patterns(path) == (PATTERNS, ["ta-ble"])
+        syllabifier = HyphenationSyllabifier.from_file(path)
+        assert syllabifier.syllables("hyphenation") == ["hy", "phen", "ation"]
+        assert syllabifier.syllables("table") == ["ta", "ble"]
+
+        plain = tmp_path / "hyph.txt"
+        plain.write_text(" ".join(PATTERNS), encoding="utf-8")
+        assert read_patterns(plain) == (PATTERNS, [])
+
+
+class TestSyllabifierIntegration:
+    """Test cases for syllabifiers in AcronymCreator."""
+
+    def test_get_syllabifier(self, tmp_path):
+        """Test model names map to syllabifiers, with legacy as None."""
+        assert get_syllabifier("legacy") is None
+        assert isinstance(get_syllabifier("vowel", count=2), VowelGroupSyllabifier)
+        path = tmp_path / "hyph.txt"
+        path.write_text(" ".join(PATTERNS), encoding="utf-8")
+        assert isinstance(get_syllabifier("pattern", path), HyphenationSyllabifier)
+        for args in (("legacy", None, 2), ("pattern",), ("unknown",)):
+            with pytest.raises(ValueError):
+                get_syllabifier(*args)
+
+    def test_creator_uses_syllabifier(self):
+        """Test syllable acronyms and multiple options use the syllabifier."""
+        options = AcronymOptions()
+        phrase = "Application Programming Interface"
+        assert AcronymCreator().create_syllable_acronym(phrase, options) == ("APPPRINT")
+        creator = AcronymCreator(syllabifier=VowelGroupSyllabifier())
+        assert creator.create_syllable_acronym(phrase, options) == "APPROIN"
+        assert creator.generate_multiple_options(phrase)["syllable"] == ["APPROIN"]
@@ -0,0 +1,76 @@
+"""
+Tests for the single-pass tokenizer.
+"""
+
+import re
+
+from src.acronymcreator.core import AcronymCreator, AcronymOptions
+from src.acronymcreator.tokenizer import Tokenizer
+
+PHRASES = [
+    "The Quick Brown Fox",
+    "Hello, World! How are you?",
+    "  Hello    World  ",
+    "",
+    "!!! ??? ...",
+    "rock-n-roll & co.",
+    "don't stop_me now",
+    "A Big Red Car",
+    "Café Olé naïve",
+    "tab\tseparated\nlines",
+    "x y z",
+]
+
+
+def legacy_extract_words(phrase, options):
+    """Reference implementation of the original clean/split/filter steps."""
+    cleaned = re.sub(r"[^\w\s]", "", phrase)
+    words = re.sub(r"\s+", " ", cleaned).strip().split()
+    if not options.include_articles:
+        words = [
+            word for word in words if word.lower() not in AcronymCreator.COMMON_WORDS
+        ]
+    return [word for word in words if len(word) >= options.min_word_length]
+
+
+class TestTokenizer:
+    """Test cases for the Tokenizer class."""
+
+    def test_matches_legacy_extraction(self):
+        """Test tokenizer output matches the original extraction exactly."""
+        option_sets = [
+            AcronymOptions(),
+            AcronymOptions(include_articles=True),
+            AcronymOptions(include_articles=True, min_word_length=0),
+            AcronymOptions(min_word_length=4),
+        ]
+        for options in option_sets:
+            tokenizer = Tokenizer.for_options(options, AcronymCreator.COMMON_WORDS)
+            for phrase in PHRASES:
+                assert list(tokenizer.tokenize(phrase)) == legacy_extract_words(
+                    phrase, options
+                )
+
+    def test_punctuation_inside_words_is_removed(self):
+        """Test punctuation joins rather than splits a token."""
+        tokenizer = Tokenizer(None, 1)
+        assert list(tokenizer("rock-n-roll don't")) == ["rocknroll", "dont"]
+
+    def test_punctuation_only_tokens_are_dropped(self):
+        """Test tokens made only of punctuation disappear even with no length limit."""
+        tokenizer = Tokenizer(None, 0)
+        assert list(tokenizer("Hello -- World")) == ["Hello", "World"]
+
+    def test_stop_words_are_case_insensitive(self):
+        """Test stop words are matched against the lowercased word."""
+        tokenizer = Tokenizer({"the"}, 1)
+        assert list(tokenizer("THE Fox")) == ["Fox"]
+
+    def test_creator_uses_tokenizer(self):
+        """Test AcronymCreator builds tokenizers from its own stop words."""
+        creator = AcronymCreator()
+        tokenizer = creator.tokenizer(AcronymOptions())
+        assert tokenizer.stop_words == AcronymCreator.COMMON_WORDS
+        assert (
+            creator.tokenizer(AcronymOptions(include_articles=True)).stop_words is None
+        )
@@ -0,0 +1,201 @@
+"""
+Tests for the file-to-file transforms.
+"""
+
+import csv
+
+import pytest
+
+from src.acronymcreator.core import AcronymOptions
+from src.acronymcreator.parallel import ParallelAcronymEngine
+from src.acronymcreator.transform import (
+    DelimitedTransform,
+    ParquetTransform,
+    detect_format,
+    open_transform,
+)
+
+ROWS = [
+    ["1", "Application Programming Interface"],
+    ["2", "Hello, World"],
+    ["3", ""],
+    ["4", "a an the"],
+    ["5", "Portable Document Format"],
+]
+ACRONYMS = ["API", "HW", "", "", "PDF"]
+
+
+def write_csv(path, rows, header=("id", "name"), delimiter=","):
+    """Write a delimited file with a header row."""
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file, delimiter=delimiter)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def read_csv(path, delimiter=","):
+    """Read a delimited file into a list of rows."""
+    with open(path, newline="", encoding="utf-8") as file:
+        return list(csv.reader(file, delimiter=delimiter))
+
+
+class TestDelimitedTransform:
+    """Test cases for CSV and TSV transforms."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.options = AcronymOptions()
+        self.engine = ParallelAcronymEngine(workers=1, chunk_size=2)
+
+    def test_adds_acronym_column(self, tmp_path):
+        """Test every row gets its acronym in a new last column."""
+        source, destination = tmp_path / "in.csv", tmp_path / "out.csv"
+        write_csv(source, ROWS)
+        rows = open_transform(source, destination, "name").run(
+            self.engine, self.options
+        )
+        assert rows == len(ROWS)
+        output = read_csv(destination)
+        assert output[0] == ["id", "name", "acronym"]
+        assert output[1:] == [row + [acronym] for row, acronym in zip(ROWS, ACRONYMS)]
+
+    def test_parallel_matches_serial(self, tmp_path):
+        """Test worker processes give the same file as a single process."""
+        source = tmp_path / "in.csv"
+        write_csv(source, ROWS * 20)
+        open_transform(source, tmp_path / "serial.csv", "name").run(
+            self.engine, self.options
+        )
+        open_transform(source, tmp_path / "parallel.csv", "name").run(
+            ParallelAcronymEngine(workers=2, chunk_size=7), self.options
+        )
+        assert (tmp_path / "serial.csv").read_bytes() == (
+            tmp_path / "parallel.csv"
+        ).read_bytes()
+
+    def test_tsv_and_options(self, tmp_path):
+        """Test TSV files, output column names and options."""
+        source, destination = tmp_path / "in.tsv", tmp_path / "out.tsv"
+        write_csv(source, ROWS, delimiter="\t")
+        job = open_transform(source, destination, "name", output_column="short")
+        job.run(self.engine, AcronymOptions(max_words=2, force_uppercase=False))
+        output = read_csv(destination, delimiter="\t")
+        assert output[0][-1] == "short"
+        assert [row[-1] for row in output[1:]] == ["ap", "hw", "", "", "pd"]
+
+    def test_short_and_blank_rows(self, tmp_path):
+        """Test short rows are padded and blank lines skipped."""
+        source, destination = tmp_path / "in.csv", tmp_path / "out.csv"
+        source.write_text("name,id\nHello World,1\n\nSolo\n", encoding="utf-8")
+        open_transform(source, destination, "id").run(self.engine, self.options)
+        assert read_csv(destination) == [
+            ["name", "id", "acronym"],
+            ["Hello World", "1", ""],
+            ["Solo", "", ""],
+        ]
+
+    def test_progress_reports_bytes(self, tmp_path):
+        """Test progress adds up to the file size."""
+        source = tmp_path / "in.csv"
+        write_csv(source, ROWS * 100)
+        job = open_transform(source, tmp_path / "out.csv", "name")
+        updates = []
+        job.run(self.engine, self.options, updates.append)
+        assert len(updates) > 1
+        assert sum(updates) == job.total == source.stat().st_size
+
+    def test_missing_column(self, tmp_path):
+        """Test an unknown column is reported with the available ones."""
+        source, destination = tmp_path / "in.csv", tmp_path / "out.csv"
+        write_csv(source, ROWS)
+        with pytest.raises(ValueError, match="available: id, name"):
+            open_transform(source, destination, "title").run(self.engine, self.options)
+        assert not destination.exists()
+        assert list(tmp_path.iterdir()) == [source]
+
+    def test_existing_output_column(self, tmp_path):
+        """Test the output column must not already exist."""
+        source = tmp_path / "in.csv"
+        write_csv(source, ROWS)
+        job = open_transform(source, tmp_path / "out.csv", "name", output_column="id")
+        with pytest.raises(ValueError, match="already exists"):
+            job.run(self.engine, self.options)
+
+    def test_empty_file(self, tmp_path):
+        """Test a file without a header row is rejected."""
+        source = tmp_path / "in.csv"
+        source.write_text("", encoding="utf-8")
+        with pytest.raises(ValueError, match="empty"):
+            open_transform(source, tmp_path / "out.csv", "name").run(
+                self.engine, self.options
+            )
+
+    def test_keeps_previous_destination_on_failure(self, tmp_path):
+        """Test a failed run leaves an existing destination untouched."""
+        source, destination = tmp_path / "in.csv", tmp_path / "out.csv"
+        write_csv(source, ROWS)
+        destination.write_text("previous", encoding="utf-8")
+        with pytest.raises(ValueError):
+            open_transform(source, destination, "title").run(self.engine, self.options)
+        assert destination.read_text(encoding="utf-8") == "previous"
+
+
+class TestFormats:
+    """Test cases for format detection."""
+
+    def test_detect_format(self):
+        """Test formats are detected from file extensions."""
+        assert detect_format("a.CSV") == "csv"
+        assert detect_format("a.tsv") == "tsv"
+        assert detect_format("a.pq") == "parquet"
+        with pytest.raises(ValueError, match="Cannot tell the format"):
+            detect_format("a.xlsx")
+
+    def test_open_transform_classes(self):
+        """Test the explicit format overrides the extension."""
+        job = open_transform("data.txt", "out.txt", "name", format="tsv")
+        assert isinstance(job, DelimitedTransform)
+        assert job.delimiter == "\t"
+        assert isinstance(open_transform("a.parquet", "b", "name"), ParquetTransform)
+        with pytest.raises(ValueError, match="Unknown format"):
+            open_transform("a.csv", "b.csv", "name", format="xlsx")
+
+
+class TestParquetTransform:
+    """Test cases for Parquet transforms."""
+
+    def setup_method(self):
+        """Skip when pyarrow is not installed."""
+        self.pa = pytest.importorskip("pyarrow")
+        self.pq = pytest.importorskip("pyarrow.parquet")
+
+    def write_parquet(self, path, names):
+        """Write a small Parquet file with several row groups."""
+        table = self.pa.table({"name": names, "n": list(range(len(names)))})
+        self.pq.write_table(table, path, row_group_size=3)
+
+    def test_adds_acronym_column(self, tmp_path):
+        """Test Parquet output keeps the input columns and adds acronyms."""
+        source, destination = tmp_path / "in.parquet", tmp_path / "out.parquet"
+        self.write_parquet(source, ["Hello World", None, "", "Quick Brown Fox"] * 3)
+        job = open_transform(source, destination, "name")
+        updates = []
+        rows = job.run(
+            ParallelAcronymEngine(workers=2, chunk_size=2),
+            AcronymOptions(),
+            updates.append,
+        )
+        table = self.pq.read_table(destination)
+        assert rows == job.total == sum(updates) == 12
+        assert table.column_names == ["name", "n", "acronym"]
+        assert table.column("n").to_pylist() == list(range(12))
+        assert table.column("acronym").to_pylist() == ["HW", "", "", "QBF"] * 3
+
+    def test_rejects_non_string_column(self, tmp_path):
+        """Test the input column must hold strings."""
+        source = tmp_path / "in.parquet"
+        self.write_parquet(source, ["Hello World"])
+        with pytest.raises(ValueError, match="expected strings"):
+            open_transform(source, tmp_path / "out.parquet", "n").run(
+                ParallelAcronymEngine(workers=1), AcronymOptions()
+            )